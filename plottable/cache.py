@@ -0,0 +1,195 @@
+"""Module containing a bounded cache to memoize computations per distinct value."""
+
+from __future__ import annotations
+
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Hashable, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_MISSING = object()
+
+
+class BoundedCache:
+    """A least recently used cache holding at most `maxsize` entries, that records
+    its hits and misses.
+
+    Args:
+        maxsize (int, optional):
+            maximum number of entries. Once it is reached, the least recently used
+            entry is discarded. Defaults to 1024.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups that were served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def info(self) -> CacheInfo:
+        """Returns the caches statistics as a CacheInfo(hits, misses, maxsize, currsize)."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: Hashable) -> Any:
+        value = self._data.get(key, _MISSING)
+        if value is not _MISSING:
+            self._data.move_to_end(key)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value for key, or default if key is not cached.
+
+        Args:
+            key (Hashable): the key
+            default (Any, optional): the default value. Defaults to None.
+
+        Returns:
+            Any: the cached value or default
+        """
+        value = self._lookup(key)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores value for key, discarding the least recently used entry if the cache
+        is full.
+
+        Args:
+            key (Hashable): the key
+            value (Any): the value
+        """
+        if self.maxsize <= 0:
+            return
+
+        self._data[key] = value
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def memoize(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Returns the cached value for key or computes it with fn and caches it.
+        Unhashable keys are not cached.
+
+        Args:
+            key (Hashable): the key
+            fn (Callable[[], Any]): Callable without arguments that computes the value
+
+        Returns:
+            Any: the cached or computed value
+        """
+        try:
+            value = self.get(key, _MISSING)
+        except TypeError:
+            return fn()
+
+        if value is _MISSING:
+            value = fn()
+            self.set(key, value)
+
+        return value
+
+    def map(self, fn: Callable[[Sequence], Sequence], values: Sequence) -> List[Any]:
+        """Maps a batch function over values, computing each distinct value only once.
+
+        Distinct values that are not yet cached are passed to fn in a single call.
+        Each occurrence of a value that did not need to be computed counts as a hit.
+        Values are cached by their type and value, so that equal values of different
+        types like 1, 1.0 and True are computed separately.
+        Missing values (NaN, None) and unhashable values are computed, but not cached.
+
+        Args:
+            fn (Callable[[Sequence], Sequence]):
+                Callable that takes an array of values and returns a sequence with one
+                result per value.
+            values (Sequence): the values
+
+        Returns:
+            List[Any]: the results for all values
+        """
+        if len(values) == 0:
+            return []
+
+        if not isinstance(values, np.ndarray):
+            _values = np.empty(len(values), dtype=object)
+            for idx, value in enumerate(values):
+                _values[idx] = value
+            values = _values
+
+        if values.dtype == object:
+            # factorize by (type, value) so that 1, 1.0 and True stay distinct
+            missing_values = pd.isna(values)
+            keys = np.empty(len(values), dtype=object)
+            for idx, value in enumerate(values):
+                keys[idx] = None if missing_values[idx] else (type(value), value)
+        else:
+            keys = values
+
+        try:
+            codes, _ = pd.factorize(keys)
+        except TypeError:
+            self.misses += len(values)
+            return list(fn(values))
+
+        valid = codes >= 0
+        _, first_positions = np.unique(codes[valid], return_index=True)
+        uniques = values[np.flatnonzero(valid)[first_positions]]
+        unique_keys = [(type(value), value) for value in uniques]
+
+        counts = np.bincount(codes[valid], minlength=len(uniques))
+        unique_results = [None] * len(uniques)
+        missing = []
+
+        for idx, key in enumerate(unique_keys):
+            value = self._lookup(key)
+            if value is _MISSING:
+                missing.append(idx)
+                self.misses += 1
+                self.hits += int(counts[idx]) - 1
+            else:
+                unique_results[idx] = value
+                self.hits += int(counts[idx])
+
+        if missing:
+            computed = fn(uniques[missing])
+            for idx, value in zip(missing, computed):
+                unique_results[idx] = value
+                self.set(unique_keys[idx], value)
+
+        results = [unique_results[code] for code in codes]
+
+        na_positions = np.flatnonzero(codes < 0)
+        if len(na_positions) > 0:
+            self.misses += len(na_positions)
+            for idx, value in zip(na_positions, fn(values[na_positions])):
+                results[idx] = value
+
+        return results
+
+    def __repr__(self) -> str:
+        return f"BoundedCache({self.info()})"
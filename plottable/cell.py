@@ -1,13 +1,59 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import MutableMapping
 from numbers import Number
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle
+import numpy as np
+from matplotlib.cbook import normalize_kwargs
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba, to_rgba_array
+from matplotlib.patches import Patch, Rectangle
+from matplotlib.transforms import Bbox
 
 from .column_def import ColumnType
+from .grid import TableGrid
+
+
+def get_axes_inset_bounds(
+    ax: mpl.axes.Axes, bounds: np.ndarray, padding: float = 0.2
+) -> np.ndarray:
+    """Transforms the bounds of cells from data coordinates of ax into the figure
+    coordinates of their axes insets, in a single call of the transform stack.
+
+    Args:
+        ax (mpl.axes.Axes):
+            the axes the cells are plotted on
+        bounds (np.ndarray):
+            (N, 4) array of the x, y, width and height of each cell in data coordinates
+        padding (float, optional):
+            vertical padding of the axes inset as a ratio of the cells height.
+            Defaults to 0.2.
+
+    Returns:
+        np.ndarray: (N, 4) array of the left, bottom, width and height of each axes inset
+    """
+    bounds = np.asarray(bounds, dtype=float).reshape(-1, 4)
+    # (N, 2, 2) array of the lower left and upper right corner of each cell
+    corners = np.stack([bounds[:, :2], bounds[:, :2] + bounds[:, 2:]], axis=1)
+
+    transform = ax.transData + ax.figure.transFigure.inverted()
+    corners = transform.transform(corners.reshape(-1, 2)).reshape(-1, 2, 2)
+
+    # the yaxis of a table is inverted, so the corners are sorted after transforming
+    (xmin, ymin), (xmax, ymax) = corners.min(axis=1).T, corners.max(axis=1).T
+    y_range = ymax - ymin
+    return np.column_stack(
+        [
+            xmin,
+            ymin + padding * y_range,
+            xmax - xmin,
+            y_range - 2 * padding * y_range,
+        ]
+    )
 
 
 def create_cell(column_type: ColumnType, *args, **kwargs) -> TableCell:
@@ -25,9 +71,66 @@ def create_cell(column_type: ColumnType, *args, **kwargs) -> TableCell:
         return TextCell(*args, **kwargs)
 
 
+class CopyOnWriteDict(MutableMapping):
+    """A dictionary that shares its data with other CopyOnWriteDicts until it is modified.
+
+    The cells of a table column share their rect_kw and textprops this way. Modifying
+    the dictionary of a single cell copies the data first, so the other cells are not
+    affected.
+    """
+
+    __slots__ = ("_data", "_owned")
+
+    def __init__(self, data: Dict[str, Any] = None):
+        """
+        Args:
+            data (Dict[str, Any], optional):
+                the shared data. It is never modified. Defaults to None.
+        """
+        self._data = data if data is not None else {}
+        self._owned = False
+
+    def share(self) -> CopyOnWriteDict:
+        """Returns a new CopyOnWriteDict that shares the data of this one."""
+        return CopyOnWriteDict(self._data)
+
+    def _own(self) -> None:
+        if not self._owned:
+            self._data = dict(self._data)
+            self._owned = True
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._own()
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        self._own()
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self._data)
+
+    def __repr__(self) -> str:
+        return f"CopyOnWriteDict({self._data})"
+
+
 class Cell:
     """A cell is a rectangle defined by the lower left corner xy and it's width and height."""
 
+    __slots__ = ("_xy", "_width", "_height")
+
     def __init__(self, xy: Tuple[float, float], width: float = 1, height: float = 1):
         """
         Args:
@@ -35,9 +138,33 @@ class Cell:
             width (float, optional): width of the rectangle cell. Defaults to 1.
             height (float, optional): height of the rectangle cell. Defaults to 1.
         """
-        self.xy = xy
-        self.width = width
-        self.height = height
+        self._xy = xy
+        self._width = width
+        self._height = height
+
+    @property
+    def xy(self) -> Tuple[float, float]:
+        return self._xy
+
+    @xy.setter
+    def xy(self, xy: Tuple[float, float]) -> None:
+        self._xy = xy
+
+    @property
+    def width(self) -> float:
+        return self._width
+
+    @width.setter
+    def width(self, width: float) -> None:
+        self._width = width
+
+    @property
+    def height(self) -> float:
+        return self._height
+
+    @height.setter
+    def height(self, height: float) -> None:
+        self._height = height
 
     @property
     def x(self) -> float:
@@ -54,6 +181,18 @@ class Cell:
 class TableCell(Cell):
     """A TableCell class for a plottable.table.Table."""
 
+    __slots__ = (
+        "index",
+        "content",
+        "row_idx",
+        "col_idx",
+        "ax",
+        "rect_kw",
+        "collection",
+        "rectangle_patch",
+        "grid",
+    )
+
     def __init__(
         self,
         xy: Tuple[float, float],
@@ -64,6 +203,8 @@ class TableCell(Cell):
         height: float = 1,
         ax: mpl.axes.Axes = None,
         rect_kw: Dict[str, Any] = {},
+        collection: RectangleCollection = None,
+        grid: TableGrid = None,
     ):
         """
         Args:
@@ -83,6 +224,15 @@ class TableCell(Cell):
                 matplotlib Axes object. Defaults to None.
             rect_kw (Dict[str, Any], optional):
                 keywords passed to matplotlib.patches.Rectangle. Defaults to {}.
+                A CopyOnWriteDict, as returned by TableCell.resolve_rect_kw, is taken
+                as is and shared with other cells.
+            collection (RectangleCollection, optional):
+                RectangleCollection to draw the cells rectangle in. If None, the cell
+                gets its own matplotlib.patches.Rectangle. Defaults to None.
+            grid (TableGrid, optional):
+                TableGrid that holds the cells geometry at (row_idx, col_idx). If given,
+                the cell is a view on the grid and xy, width and height are read from
+                it. Setting them on the cell raises an AttributeError. Defaults to None.
         """
 
         super().__init__(xy, width, height)
@@ -90,30 +240,262 @@ class TableCell(Cell):
         self.content = content
         self.row_idx = row_idx
         self.col_idx = col_idx
+        self.grid = grid
         self.ax = ax or plt.gca()
-        self.rect_kw = {
+
+        if isinstance(rect_kw, CopyOnWriteDict):
+            self.rect_kw = rect_kw.share()
+        else:
+            self.rect_kw = self.resolve_rect_kw(self.ax, width, height, rect_kw).copy()
+
+        self.collection = collection
+
+        if collection is not None:
+            self.rectangle_patch = collection.add_rectangle(xy, **self.rect_kw)
+        else:
+            self.rectangle_patch = Rectangle(xy, **self.rect_kw)
+
+    @Cell.xy.getter
+    def xy(self) -> Tuple[float, float]:
+        if self.grid is None:
+            return self._xy
+        return self.grid.get_xy(self.row_idx, self.col_idx)
+
+    @xy.setter
+    def xy(self, xy: Tuple[float, float]) -> None:
+        self._check_geometry_settable("xy")
+        self._xy = xy
+
+    @Cell.width.getter
+    def width(self) -> float:
+        if self.grid is None:
+            return self._width
+        return self.grid.column_widths[self.col_idx]
+
+    @width.setter
+    def width(self, width: float) -> None:
+        self._check_geometry_settable("width")
+        self._width = width
+
+    @Cell.height.getter
+    def height(self) -> float:
+        if self.grid is None:
+            return self._height
+        return self.grid.row_heights[self.row_idx]
+
+    @height.setter
+    def height(self, height: float) -> None:
+        self._check_geometry_settable("height")
+        self._height = height
+
+    def _check_geometry_settable(self, name: str) -> None:
+        if self.grid is not None:
+            raise AttributeError(
+                f"The {name} of a cell is read from its TableGrid and can't be set on "
+                "the cell."
+            )
+
+    @staticmethod
+    def resolve_rect_kw(
+        ax: mpl.axes.Axes, width: float, height: float, rect_kw: Dict[str, Any] = {}
+    ) -> CopyOnWriteDict:
+        """Merges rect_kw into the default rectangle keywords, so that the result can be
+        shared by all cells with the same ax, width, height and rect_kw.
+
+        Args:
+            ax (mpl.axes.Axes): matplotlib Axes object.
+            width (float): width of the rectangle cell.
+            height (float): height of the rectangle cell.
+            rect_kw (Dict[str, Any], optional):
+                keywords passed to matplotlib.patches.Rectangle. Defaults to {}.
+
+        Returns:
+            CopyOnWriteDict: the rectangle keywords
+        """
+        _rect_kw = {
             "linewidth": 0.0,
-            "edgecolor": self.ax.get_facecolor(),
-            "facecolor": self.ax.get_facecolor(),
+            "edgecolor": ax.get_facecolor(),
+            "facecolor": ax.get_facecolor(),
             "width": width,
             "height": height,
         }
-
-        self.rect_kw.update(rect_kw)
-        self.rectangle_patch = Rectangle(xy, **self.rect_kw)
+        _rect_kw.update(rect_kw)
+        return CopyOnWriteDict(_rect_kw)
 
     def draw(self):
-        self.ax.add_patch(self.rectangle_patch)
+        # rectangles of a RectangleCollection are drawn by the collection itself
+        if self.collection is None:
+            self.ax.add_patch(self.rectangle_patch)
 
     def __repr__(self) -> str:
         return f"TableCell(xy={self.xy}, row_idx={self.index[0]}, col_idx={self.index[1]})"  # noqa
 
 
+class _LazyTicksMixin:
+    """Keeps the ticks of an Axis from being created by setting its clip path or tick
+    parameters. They are stored and applied to the ticks once they are accessed."""
+
+    def _call_without_ticks(self, fn: Callable, *args, **kwargs) -> Any:
+        # the tick lists are lazily created on first access. They are replaced by
+        # empty lists while fn runs and made lazy again afterwards.
+        placeholders = {}
+        for name in ("majorTicks", "minorTicks"):
+            if name not in vars(self):
+                placeholders[name] = []
+                setattr(self, name, placeholders[name])
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            for name, placeholder in placeholders.items():
+                if vars(self).get(name) is placeholder:
+                    delattr(self, name)
+
+    def set_clip_path(self, path, transform=None):
+        self._call_without_ticks(super().set_clip_path, path, transform)
+
+    def set_tick_params(self, which="major", reset=False, **kwargs):
+        self._call_without_ticks(super().set_tick_params, which, reset, **kwargs)
+
+    def _get_tick(self, major: bool):
+        tick = super()._get_tick(major)
+        if self._clippath is not None:
+            tick.set_clip_path(self._clippath)
+        return tick
+
+
+class _InsetXAxis(_LazyTicksMixin, mpl.axis.XAxis):
+    pass
+
+
+class _InsetYAxis(_LazyTicksMixin, mpl.axis.YAxis):
+    pass
+
+
+class InsetAxes(mpl.axes.Axes):
+    """A lightweight Axes for the axes insets of SubplotCells.
+
+    Creating a matplotlib Axes spends most of its time on creating ticks, tick labels
+    and gridlines, that an axes inset with its axis turned off never draws. The ticks of
+    an InsetAxes are only created when they are accessed, ie. by turning its axis on,
+    and its axis is turned off when it is created.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.set_axis_off()
+
+    def _init_axis(self):
+        # like Axes._init_axis of the installed matplotlib, with axis classes that
+        # create their ticks lazily. Axes.clear clears the axis afterwards, which is
+        # why matplotlib >= 3.8 creates it with clear=False.
+        axis_kw = {"clear": False} if mpl.__version_info__ >= (3, 8) else {}
+        self.xaxis = _InsetXAxis(self, **axis_kw)
+        self.spines.bottom.register_axis(self.xaxis)
+        self.spines.top.register_axis(self.xaxis)
+        self.yaxis = _InsetYAxis(self, **axis_kw)
+        self.spines.left.register_axis(self.yaxis)
+        self.spines.right.register_axis(self.yaxis)
+        if mpl.__version_info__ < (3, 7):
+            self._update_transScale()
+
+    def reset(self) -> None:
+        """Removes the artists of the axes and resets its data and view limits,
+        autoscaling, margins and aspect, so that it can be plotted on again.
+
+        This is much cheaper than Axes.clear, which recreates the axis, spines and
+        titles, but it keeps settings a plot_fn changed on those.
+        """
+        for artist in list(self._children):
+            artist.remove()
+        self.containers = []
+        self.legend_ = None
+
+        self.dataLim.set_points(Bbox.null().get_points())
+        self.ignore_existing_data_limits = True
+        self.set_xmargin(plt.rcParams["axes.xmargin"])
+        self.set_ymargin(plt.rcParams["axes.ymargin"])
+        self.use_sticky_edges = True
+        # setting the limits after the margins cancels the autoscaling they request,
+        # like in a new axes only adding artists requests it
+        self.set_xlim(0, 1, auto=True)
+        self.set_ylim(0, 1, auto=True)
+        self.set_aspect("auto")
+        self.set_adjustable("box")
+        self.set_anchor("C")
+        self.set_axis_off()
+
+
+class InsetAxesPool:
+    """A pool of axes insets of a figure, that are reused when a table is rebuilt on the
+    figure instead of creating new ones.
+
+    Pass the same pool to each Table that replaces the previous one. The axes insets of
+    the previous table are reset and moved to the new cells, new ones are only created
+    if the new table has more SubplotCells, and the remaining ones are removed from
+    the figure.
+
+    Args:
+        fig (mpl.figure.Figure): the figure of the tables
+    """
+
+    def __init__(self, fig: mpl.figure.Figure):
+        self.fig = fig
+        self.axes: List[mpl.axes.Axes] = []
+        self.n_used = 0
+
+    def release(self) -> None:
+        """Marks all axes of the pool as unused, ie. before a table is rebuilt."""
+        self.n_used = 0
+
+    def acquire(self, rect: List[float], axes_class: type = InsetAxes) -> mpl.axes.Axes:
+        """Gets an unused axes of the pool at rect, or adds a new one to the figure.
+
+        Args:
+            rect (List[float]):
+                left, bottom, width and height of the axes in figure coordinates
+            axes_class (type, optional):
+                the class of new axes. Defaults to InsetAxes.
+
+        Returns:
+            mpl.axes.Axes: the axes
+        """
+        if self.n_used < len(self.axes):
+            ax = self.axes[self.n_used]
+            ax.set_position(rect)
+            if isinstance(ax, InsetAxes):
+                ax.reset()
+            else:
+                ax.clear()
+        else:
+            ax = self.fig.add_axes(rect, axes_class=axes_class)
+            self.axes.append(ax)
+
+        self.n_used += 1
+        return ax
+
+    def trim(self) -> None:
+        """Removes the unused axes of the pool from the figure."""
+        for ax in self.axes[self.n_used :]:
+            ax.remove()
+        del self.axes[self.n_used :]
+
+    def __len__(self) -> int:
+        return len(self.axes)
+
+    def __repr__(self) -> str:
+        return f"InsetAxesPool(n_axes={len(self)}, n_used={self.n_used})"
+
+
 class SubplotCell(TableCell):
     """A SubplotTableCell class for a plottable.table.Table that creates a subplot on top of
     it's rectangle patch.
     """
 
+    __slots__ = ("_plot_fn", "_plot_kw", "fig", "axes_inset")
+
+    # the class of the axes insets
+    axes_class = InsetAxes
+
     def __init__(
         self,
         xy: Tuple[float, float],
@@ -126,6 +508,8 @@ class SubplotCell(TableCell):
         height: float = 1,
         ax: mpl.axes.Axes = None,
         rect_kw: Dict[str, Any] = {},
+        collection: RectangleCollection = None,
+        grid: TableGrid = None,
     ):
         """
         Args:
@@ -149,6 +533,10 @@ class SubplotCell(TableCell):
                 matplotlib Axes object. Defaults to None.
             rect_kw (Dict[str, Any], optional):
                 keywords passed to matplotlib.patches.Rectangle. Defaults to {}.
+            collection (RectangleCollection, optional):
+                RectangleCollection to draw the cells rectangle in. Defaults to None.
+            grid (TableGrid, optional):
+                TableGrid that holds the cells geometry. Defaults to None.
         """
         super().__init__(
             xy=xy,
@@ -159,6 +547,8 @@ class SubplotCell(TableCell):
             col_idx=col_idx,
             ax=ax,
             rect_kw=rect_kw,
+            collection=collection,
+            grid=grid,
         )
 
         self._plot_fn = plot_fn
@@ -169,25 +559,55 @@ class SubplotCell(TableCell):
     def plot(self):
         self._plot_fn(self.axes_inset, self.content, **self._plot_kw)
 
-    def make_axes_inset(self):
-        rect_fig_coords = self._get_rectangle_bounds()
-        self.axes_inset = self.fig.add_axes(rect_fig_coords)
+    def set_content(self, content: Any) -> None:
+        """Sets the content of the cell and plots it again on its axes inset, if the cell
+        has one.
+
+        Args:
+            content (Any): the content of the cell
+        """
+        self.content = content
+
+        axes_inset = getattr(self, "axes_inset", None)
+        if axes_inset is None:
+            return
+
+        if isinstance(axes_inset, InsetAxes):
+            axes_inset.reset()
+        else:
+            axes_inset.clear()
+            axes_inset.axis("off")
+        self.plot()
+
+    def make_axes_inset(
+        self, rect: List[float] = None, pool: InsetAxesPool = None
+    ) -> mpl.axes.Axes:
+        """Adds the axes inset of the cell to the figure. It is an instance of
+        SubplotCell.axes_class, which defaults to the lightweight InsetAxes.
+
+        Args:
+            rect (List[float], optional):
+                left, bottom, width and height of the axes inset in figure coordinates,
+                ie. precomputed for many cells with get_axes_inset_bounds.
+                Defaults to None, which computes it from the cells rectangle.
+            pool (InsetAxesPool, optional):
+                a pool to reuse an axes inset from. Defaults to None.
+
+        Returns:
+            mpl.axes.Axes: the axes inset
+        """
+        if rect is None:
+            rect = self._get_rectangle_bounds()
+        if pool is not None:
+            self.axes_inset = pool.acquire(rect, axes_class=self.axes_class)
+        else:
+            self.axes_inset = self.fig.add_axes(rect, axes_class=self.axes_class)
         return self.axes_inset
 
     def _get_rectangle_bounds(self, padding: float = 0.2) -> List[float]:
-        transformer = self.fig.transFigure.inverted()
-        display_coords = self.rectangle_patch.get_window_extent()
-        (xmin, ymin), (xmax, ymax) = transformer.transform(display_coords)
-        y_range = ymax - ymin
-        return [
-            xmin,
-            ymin + padding * y_range,
-            xmax - xmin,
-            ymax - ymin - 2 * padding * y_range,
-        ]
-
-    def draw(self):
-        self.ax.add_patch(self.rectangle_patch)
+        x, y = self.xy
+        bounds = [x, y, self.width, self.height]
+        return list(get_axes_inset_bounds(self.ax, bounds, padding=padding)[0])
 
     def __repr__(self) -> str:
         return f"SubplotCell(xy={self.xy}, row_idx={self.index[0]}, col_idx={self.index[1]})"  # noqa
@@ -196,6 +616,8 @@ class SubplotCell(TableCell):
 class TextCell(TableCell):
     """A TextCell class for a plottable.table.Table that creates a text inside it's rectangle patch."""
 
+    __slots__ = ("textprops", "ha", "va", "padding", "formatted_content", "text")
+
     def __init__(
         self,
         xy: Tuple[float, float],
@@ -208,6 +630,9 @@ class TextCell(TableCell):
         rect_kw: Dict[str, Any] = {},
         textprops: Dict[str, Any] = {},
         padding: float = 0.1,
+        collection: RectangleCollection = None,
+        formatted_content: str = None,
+        grid: TableGrid = None,
     ):
         """
         Args:
@@ -229,8 +654,16 @@ class TextCell(TableCell):
                 keywords passed to matplotlib.patches.Rectangle. Defaults to {}.
             textprops (Dict[str, Any], optional):
                 textprops passed to matplotlib.text.Text. Defaults to {}.
+                A CopyOnWriteDict, as returned by TextCell.resolve_textprops, is taken
+                as is and shared with other cells.
             padding (float, optional):
                 Padding around the text within the rectangle patch. Defaults to 0.1.
+            collection (RectangleCollection, optional):
+                RectangleCollection to draw the cells rectangle in. Defaults to None.
+            formatted_content (str, optional):
+                the text to plot. Defaults to None, which plots str(content).
+            grid (TableGrid, optional):
+                TableGrid that holds the cells geometry. Defaults to None.
 
         """
         super().__init__(
@@ -242,16 +675,38 @@ class TextCell(TableCell):
             col_idx=col_idx,
             ax=ax,
             rect_kw=rect_kw,
+            collection=collection,
+            grid=grid,
         )
 
-        self.textprops = {"ha": "right", "va": "center"}
-        self.textprops.update(textprops)
+        if isinstance(textprops, CopyOnWriteDict):
+            self.textprops = textprops.share()
+        else:
+            self.textprops = self.resolve_textprops(textprops).copy()
+
         self.ha = self.textprops["ha"]
         self.va = self.textprops["va"]
         self.padding = padding
+        self.formatted_content = formatted_content
+
+    @staticmethod
+    def resolve_textprops(textprops: Dict[str, Any] = {}) -> CopyOnWriteDict:
+        """Merges textprops into the default textprops, so that the result can be shared
+        by all cells with the same textprops.
+
+        Args:
+            textprops (Dict[str, Any], optional):
+                textprops passed to matplotlib.text.Text. Defaults to {}.
+
+        Returns:
+            CopyOnWriteDict: the textprops
+        """
+        _textprops = {"ha": "right", "va": "center"}
+        _textprops.update(textprops)
+        return CopyOnWriteDict(_textprops)
 
     def draw(self):
-        self.ax.add_patch(self.rectangle_patch)
+        super().draw()
         self.set_text()
 
     def set_text(self):
@@ -277,12 +732,352 @@ class TextCell(TableCell):
         elif self.va == "top":
             y = y - (1 - self.padding) * self.height
 
-        self.text = self.ax.text(x, y, str(self.content), **self.textprops)
+        self.text = self.ax.text(x, y, self._get_text(), **self.textprops)
+
+    def _get_text(self) -> str:
+        if self.formatted_content is not None:
+            return self.formatted_content
+        return str(self.content)
+
+    def set_content(self, content: str | Number, formatted_content: str = None) -> None:
+        """Sets the content of the cell and updates its text in place.
+
+        Args:
+            content (str | Number): the content of the cell
+            formatted_content (str, optional):
+                the text to plot. Defaults to None, which plots str(content).
+        """
+        self.content = content
+        self.formatted_content = formatted_content
+        self.text.set_text(self._get_text())
 
     def __repr__(self) -> str:
         return f"TextCell(xy={self.xy}, content={self.content}, row_idx={self.index[0]}, col_idx={self.index[1]})"  # noqa
 
 
+class RectangleCollection(PolyCollection):
+    """A matplotlib PolyCollection that draws the rectangles of many TableCells as a
+    single artist.
+
+    Each rectangle keeps its own facecolor, edgecolor, linewidth, linestyle and alpha in
+    per-cell arrays. Setting a property only writes to these arrays, which are pushed to
+    the collection once it is drawn.
+
+    Keywords passed at initialization apply to the whole collection
+    (ie. zorder or hatch).
+    """
+
+    # rectangle keywords that are stored per cell
+    CELL_KEYS = (
+        "facecolor",
+        "edgecolor",
+        "color",
+        "linewidth",
+        "linestyle",
+        "alpha",
+        "fill",
+        "width",
+        "height",
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__([], **kwargs)
+        self._n_cells = 0
+        self._cell_bounds = np.zeros((0, 4))
+        self._cell_facecolors = np.zeros((0, 4))
+        self._cell_edgecolors = np.zeros((0, 4))
+        self._cell_linewidths = np.zeros(0)
+        self._cell_alphas = np.zeros(0)
+        self._cell_fill = np.zeros(0, dtype=bool)
+        self._cell_linestyles = []
+        self._verts_stale = True
+        self._colors_stale = True
+
+    def __len__(self) -> int:
+        return self._n_cells
+
+    def reserve(self, n: int) -> None:
+        """Grows the per-cell arrays to hold at least n cells, so that adding n cells
+        does not reallocate them.
+
+        Args:
+            n (int): number of cells
+        """
+        capacity = len(self._cell_linewidths)
+        if n <= capacity:
+            return
+
+        capacity = max(n, 2 * capacity, 16)
+
+        def _resize(arr: np.ndarray) -> np.ndarray:
+            new = np.zeros((capacity,) + arr.shape[1:], dtype=arr.dtype)
+            new[: len(arr)] = arr
+            return new
+
+        self._cell_bounds = _resize(self._cell_bounds)
+        self._cell_facecolors = _resize(self._cell_facecolors)
+        self._cell_edgecolors = _resize(self._cell_edgecolors)
+        self._cell_linewidths = _resize(self._cell_linewidths)
+        self._cell_alphas = _resize(self._cell_alphas)
+        self._cell_fill = _resize(self._cell_fill)
+
+    def add_rectangle(
+        self, xy: Tuple[float, float], width: float = 1, height: float = 1, **kwargs
+    ) -> CollectionPatch:
+        """Adds a rectangle to the collection.
+
+        Args:
+            xy (Tuple[float, float]): lower left corner of the rectangle
+            width (float, optional): width of the rectangle. Defaults to 1.
+            height (float, optional): height of the rectangle. Defaults to 1.
+            kwargs are the per cell keywords of matplotlib.patches.Rectangle
+                (see RectangleCollection.CELL_KEYS). Other keywords are ignored.
+
+        Returns:
+            CollectionPatch: a stand-in for the rectangles patch.
+        """
+        kwargs = normalize_kwargs(kwargs, Patch)
+        idx = self._n_cells
+        self.reserve(idx + 1)
+        self._n_cells += 1
+
+        color = kwargs.get("color")
+        facecolor = kwargs.get("facecolor", color)
+        edgecolor = kwargs.get("edgecolor", color)
+        linewidth = kwargs.get("linewidth")
+
+        self._cell_bounds[idx] = (xy[0], xy[1], width, height)
+        self._cell_facecolors[idx] = to_rgba(
+            facecolor if facecolor is not None else plt.rcParams["patch.facecolor"]
+        )
+        self._cell_edgecolors[idx] = to_rgba(
+            edgecolor if edgecolor is not None else plt.rcParams["patch.edgecolor"]
+        )
+        self._cell_linewidths[idx] = (
+            linewidth if linewidth is not None else plt.rcParams["patch.linewidth"]
+        )
+        alpha = kwargs.get("alpha")
+        self._cell_alphas[idx] = np.nan if alpha is None else alpha
+        self._cell_fill[idx] = kwargs.get("fill", True)
+        self._cell_linestyles.append(kwargs.get("linestyle", "solid"))
+
+        self._verts_stale = True
+        self._colors_stale = True
+
+        return CollectionPatch(self, idx)
+
+    def get_cell_bounds(self, idx: int) -> Tuple[float, float, float, float]:
+        """Returns the (x, y, width, height) of the cell rectangle at idx."""
+        return tuple(self._cell_bounds[idx])
+
+    def _indices(self, indices: List[int] | slice = None) -> List[int] | slice:
+        return slice(0, self._n_cells) if indices is None else indices
+
+    def get_cell_facecolors(self, indices: List[int] | slice = None) -> np.ndarray:
+        """Returns an (n, 4) array of the rectangles rgba facecolors.
+
+        Args:
+            indices (List[int] | slice, optional):
+                indices of the rectangles. Defaults to None, meaning all rectangles.
+        """
+        indices = self._indices(indices)
+        rgba = self._cell_facecolors[indices].copy()
+        alphas = self._cell_alphas[indices]
+        has_alpha = ~np.isnan(alphas)
+        rgba[has_alpha, 3] = alphas[has_alpha]
+        rgba[~self._cell_fill[indices], 3] = 0
+        return rgba
+
+    def get_cell_edgecolors(self, indices: List[int] | slice = None) -> np.ndarray:
+        """Returns an (n, 4) array of the rectangles rgba edgecolors.
+
+        Args:
+            indices (List[int] | slice, optional):
+                indices of the rectangles. Defaults to None, meaning all rectangles.
+        """
+        indices = self._indices(indices)
+        rgba = self._cell_edgecolors[indices].copy()
+        alphas = self._cell_alphas[indices]
+        has_alpha = ~np.isnan(alphas)
+        rgba[has_alpha, 3] = alphas[has_alpha]
+        return rgba
+
+    def get_cell_linewidths(self, indices: List[int] | slice = None) -> np.ndarray:
+        """Returns an (n,) array of the rectangles linewidths.
+
+        Args:
+            indices (List[int] | slice, optional):
+                indices of the rectangles. Defaults to None, meaning all rectangles.
+        """
+        return self._cell_linewidths[self._indices(indices)].copy()
+
+    def set_cell_facecolor(self, indices: List[int] | slice, color) -> None:
+        self._cell_facecolors[indices] = to_rgba(color)
+        self._colors_stale = True
+        self.stale = True
+
+    def set_cell_facecolors(self, indices: List[int] | slice, colors) -> None:
+        """Sets the facecolor of each rectangle at indices to the respective color.
+
+        Args:
+            indices (List[int] | slice): indices of the rectangles
+            colors: a sequence of colors or an (n, 4) rgba array
+        """
+        self._cell_facecolors[indices] = to_rgba_array(colors)
+        self._colors_stale = True
+        self.stale = True
+
+    def set_cell_edgecolor(self, indices: List[int] | slice, color) -> None:
+        self._cell_edgecolors[indices] = to_rgba(color)
+        self._colors_stale = True
+        self.stale = True
+
+    def set_cell_color(self, indices: List[int] | slice, color) -> None:
+        self.set_cell_facecolor(indices, color)
+        self.set_cell_edgecolor(indices, color)
+
+    def set_cell_alpha(self, indices: List[int] | slice, alpha: float | None) -> None:
+        self._cell_alphas[indices] = np.nan if alpha is None else alpha
+        self._colors_stale = True
+        self.stale = True
+
+    def set_cell_fill(self, indices: List[int] | slice, fill: bool) -> None:
+        self._cell_fill[indices] = bool(fill)
+        self._colors_stale = True
+        self.stale = True
+
+    def set_cell_linewidth(self, indices: List[int] | slice, linewidth: float) -> None:
+        self._cell_linewidths[indices] = linewidth
+        self._colors_stale = True
+        self.stale = True
+
+    def set_cell_linestyle(self, indices: List[int] | slice, linestyle) -> None:
+        for idx in np.arange(self._n_cells)[indices]:
+            self._cell_linestyles[idx] = linestyle
+        self._colors_stale = True
+        self.stale = True
+
+    def set_cell_hatch(self, indices: List[int] | slice, hatch: str) -> None:
+        # matplotlib collections only support a single hatch for all elements
+        self.set_hatch(hatch)
+
+    def _update_verts(self) -> None:
+        x, y, w, h = self._cell_bounds[: self._n_cells].T
+        verts = np.stack(
+            [
+                np.column_stack([x, y]),
+                np.column_stack([x + w, y]),
+                np.column_stack([x + w, y + h]),
+                np.column_stack([x, y + h]),
+            ],
+            axis=1,
+        )
+        self.set_verts(verts)
+        self._verts_stale = False
+
+    def _update_colors(self) -> None:
+        super().set_facecolor(self.get_cell_facecolors())
+        super().set_edgecolor(self.get_cell_edgecolors())
+        super().set_linewidth(self.get_cell_linewidths())
+        super().set_linestyle(self._cell_linestyles)
+        self._colors_stale = False
+
+    def get_paths(self):
+        if self._verts_stale:
+            self._update_verts()
+        return super().get_paths()
+
+    def draw(self, renderer):
+        if self._verts_stale:
+            self._update_verts()
+        if self._colors_stale:
+            self._update_colors()
+        super().draw(renderer)
+
+
+class CollectionPatch:
+    """A lightweight stand-in for the matplotlib.patches.Rectangle of a TableCell whose
+    rectangle is drawn by a RectangleCollection.
+
+    It supports the parts of the Rectangle API that plottable uses and writes all changes
+    to the collections per-cell arrays.
+    """
+
+    __slots__ = ("collection", "index")
+
+    def __init__(self, collection: RectangleCollection, index: int):
+        """
+        Args:
+            collection (RectangleCollection): the collection the rectangle belongs to
+            index (int): index of the rectangle within the collection
+        """
+        self.collection = collection
+        self.index = index
+
+    @property
+    def xy(self) -> Tuple[float, float]:
+        return self.get_xy()
+
+    def get_xy(self) -> Tuple[float, float]:
+        x, y, _, _ = self.collection.get_cell_bounds(self.index)
+        return x, y
+
+    def get_x(self) -> float:
+        return self.get_xy()[0]
+
+    def get_y(self) -> float:
+        return self.get_xy()[1]
+
+    def get_width(self) -> float:
+        return self.collection.get_cell_bounds(self.index)[2]
+
+    def get_height(self) -> float:
+        return self.collection.get_cell_bounds(self.index)[3]
+
+    def get_facecolor(self) -> Tuple[float, float, float, float]:
+        return tuple(self.collection.get_cell_facecolors([self.index])[0])
+
+    def get_edgecolor(self) -> Tuple[float, float, float, float]:
+        return tuple(self.collection.get_cell_edgecolors([self.index])[0])
+
+    def get_linewidth(self) -> float:
+        return self.collection.get_cell_linewidths([self.index])[0]
+
+    def get_window_extent(self, renderer=None) -> Bbox:
+        x, y, width, height = self.collection.get_cell_bounds(self.index)
+        corners = self.collection.axes.transData.transform(
+            [(x, y), (x + width, y + height)]
+        )
+        return Bbox([corners.min(axis=0), corners.max(axis=0)])
+
+    def set_facecolor(self, color) -> None:
+        self.collection.set_cell_facecolor([self.index], color)
+
+    def set_edgecolor(self, color) -> None:
+        self.collection.set_cell_edgecolor([self.index], color)
+
+    def set_color(self, color) -> None:
+        self.collection.set_cell_color([self.index], color)
+
+    def set_alpha(self, alpha: float | None) -> None:
+        self.collection.set_cell_alpha([self.index], alpha)
+
+    def set_fill(self, fill: bool) -> None:
+        self.collection.set_cell_fill([self.index], fill)
+
+    def set_linewidth(self, linewidth: float) -> None:
+        self.collection.set_cell_linewidth([self.index], linewidth)
+
+    def set_linestyle(self, linestyle) -> None:
+        self.collection.set_cell_linestyle([self.index], linestyle)
+
+    def set_hatch(self, hatch: str) -> None:
+        self.collection.set_cell_hatch([self.index], hatch)
+
+    def __repr__(self) -> str:
+        return f"CollectionPatch(index={self.index})"
+
+
 class Sequence:  # Row and Column can inherit from this
     """A Sequence of Table Cells."""
 
@@ -304,25 +1099,69 @@ class Sequence:  # Row and Column can inherit from this
         """
         self.cells.append(cell)
 
-    def set_alpha(self, *args) -> Sequence:
-        """Sets the alpha for all cells of the Sequence and returns self.
+    def _set_patch_property(self, prop: str, *args) -> Sequence:
+        """Calls `set_{prop}` on the rectangle patches of all cells and returns self.
+        Rectangles drawn by a RectangleCollection are set with a single call per collection.
 
         Return:
             self[Sequence]: A Sequence of Cells
         """
+        collection_indices = defaultdict(list)
+
         for cell in self.cells:
-            cell.rectangle_patch.set_alpha(*args)
+            patch = cell.rectangle_patch
+            if isinstance(patch, CollectionPatch):
+                collection_indices[patch.collection].append(patch.index)
+            else:
+                getattr(patch, f"set_{prop}")(*args)
+
+        for collection, indices in collection_indices.items():
+            getattr(collection, f"set_cell_{prop}")(indices, *args)
+
+        return self
+
+    def set_facecolors(self, colors) -> Sequence:
+        """Sets the facecolor of each cell of the Sequence to the respective color of
+        `colors` and returns self.
+        Rectangles drawn by a RectangleCollection are set with a single call per collection.
+
+        Args:
+            colors: a sequence of colors or an (n, 4) rgba array, one for each cell.
+
+        Return:
+            self[Sequence]: A Sequence of Cells
+        """
+        collection_indices = defaultdict(list)
+        collection_colors = defaultdict(list)
+
+        for cell, color in zip(self.cells, colors):
+            patch = cell.rectangle_patch
+            if isinstance(patch, CollectionPatch):
+                collection_indices[patch.collection].append(patch.index)
+                collection_colors[patch.collection].append(color)
+            else:
+                patch.set_facecolor(color)
+
+        for collection, indices in collection_indices.items():
+            collection.set_cell_facecolors(indices, collection_colors[collection])
+
         return self
 
+    def set_alpha(self, *args) -> Sequence:
+        """Sets the alpha for all cells of the Sequence and returns self.
+
+        Return:
+            self[Sequence]: A Sequence of Cells
+        """
+        return self._set_patch_property("alpha", *args)
+
     def set_color(self, *args) -> Sequence:
         """Sets the color for all cells of the Sequence and returns self.
 
         Return:
             self[Sequence]: A Sequence of Cells
         """
-        for cell in self.cells:
-            cell.rectangle_patch.set_color(*args)
-        return self
+        return self._set_patch_property("color", *args)
 
     def set_facecolor(self, *args) -> Sequence:
         """Sets the facecolor for all cells of the Sequence and returns self.
@@ -330,9 +1169,7 @@ class Sequence:  # Row and Column can inherit from this
         Return:
             self[Sequence]: A Sequence of Cells
         """
-        for cell in self.cells:
-            cell.rectangle_patch.set_facecolor(*args)
-        return self
+        return self._set_patch_property("facecolor", *args)
 
     def set_edgecolor(self, *args) -> Sequence:
         """Sets the edgecolor for all cells of the Sequence and returns self.
@@ -340,9 +1177,7 @@ class Sequence:  # Row and Column can inherit from this
         Return:
             self[Sequence]: A Sequence of Cells
         """
-        for cell in self.cells:
-            cell.rectangle_patch.set_edgecolor(*args)
-        return self
+        return self._set_patch_property("edgecolor", *args)
 
     def set_fill(self, *args) -> Sequence:
         """Sets the fill for all cells of the Sequence and returns self.
@@ -350,9 +1185,7 @@ class Sequence:  # Row and Column can inherit from this
         Return:
             self[Sequence]: A Sequence of Cells
         """
-        for cell in self.cells:
-            cell.rectangle_patch.set_fill(*args)
-        return self
+        return self._set_patch_property("fill", *args)
 
     def set_hatch(self, *args) -> Sequence:
         """Sets the hatch for all cells of the Sequence and returns self.
@@ -360,9 +1193,7 @@ class Sequence:  # Row and Column can inherit from this
         Return:
             self[Sequence]: A Sequence of Cells
         """
-        for cell in self.cells:
-            cell.rectangle_patch.set_hatch(*args)
-        return self
+        return self._set_patch_property("hatch", *args)
 
     def set_linestyle(self, *args) -> Sequence:
         """Sets the linestyle for all cells of the Sequence and returns self.
@@ -370,9 +1201,7 @@ class Sequence:  # Row and Column can inherit from this
         Return:
             self[Sequence]: A Sequence of Cells
         """
-        for cell in self.cells:
-            cell.rectangle_patch.set_linestyle(*args)
-        return self
+        return self._set_patch_property("linestyle", *args)
 
     def set_linewidth(self, *args) -> Sequence:
         """Sets the linewidth for all cells of the Sequence and returns self.
@@ -380,9 +1209,7 @@ class Sequence:  # Row and Column can inherit from this
         Return:
             self[Sequence]: A Sequence of Cells
         """
-        for cell in self.cells:
-            cell.rectangle_patch.set_linewidth(*args)
-        return self
+        return self._set_patch_property("linewidth", *args)
 
     def set_fontcolor(self, *args) -> Sequence:
         """Sets the fontcolor for all cells texts of the Sequence and returns self.
@@ -443,8 +1270,18 @@ class Sequence:  # Row and Column can inherit from this
 class Row(Sequence):
     """A Row of TableCells."""
 
-    def __init__(self, cells: List[TableCell], index: int):
+    def __init__(self, cells: List[TableCell], index: int, grid: TableGrid = None):
+        """
+        Args:
+            cells (List[TableCell]): List of TableCells.
+            index (int): the rows index in a Table.
+            grid (TableGrid, optional):
+                TableGrid that holds the rows geometry at `index`. If given, ranges
+                are read from the grid instead of computed from the cells.
+                Defaults to None.
+        """
         super().__init__(cells=cells, index=index)
+        self.grid = grid
 
     def get_xrange(self) -> Tuple[float, float]:
         """Gets the xrange of the Row.
@@ -452,6 +1289,9 @@ class Row(Sequence):
         Returns:
             Tuple[float, float]: Tuple of min and max x.
         """
+        if self.grid is not None:
+            return self.grid.get_xrange()
+
         return min([cell.xy[0] for cell in self.cells]), max(
             [cell.xy[0] + cell.width for cell in self.cells]
         )
@@ -462,19 +1302,28 @@ class Row(Sequence):
         Returns:
             Tuple[float, float]: Tuple of min and max y.
         """
+        if self.grid is not None:
+            return self.grid.get_yrange(self.index)
+
         cell = self.cells[0]
         return cell.xy[1], cell.xy[1] + cell.height
 
     @property
     def x(self) -> float:
+        if self.grid is not None:
+            return self.grid.get_xrange()[0]
         return self.cells[0].xy[0]
 
     @property
     def y(self) -> float:
+        if self.grid is not None:
+            return self.grid.row_y[self.index]
         return self.cells[0].xy[1]
 
     @property
     def height(self) -> float:
+        if self.grid is not None:
+            return self.grid.row_heights[self.index]
         return self.cells[0].height
 
     def __repr__(self) -> str:
@@ -484,9 +1333,26 @@ class Row(Sequence):
 class Column(Sequence):
     """A Column of TableCells."""
 
-    def __init__(self, cells: List[TableCell], index: int, name: str = None):
+    def __init__(
+        self,
+        cells: List[TableCell],
+        index: int,
+        name: str = None,
+        grid: TableGrid = None,
+    ):
+        """
+        Args:
+            cells (List[TableCell]): List of TableCells.
+            index (int): the columns index in a Table.
+            name (str, optional): the column name. Defaults to None.
+            grid (TableGrid, optional):
+                TableGrid that holds the columns geometry at `index`. If given, ranges
+                are read from the grid instead of computed from the cells.
+                Defaults to None.
+        """
         super().__init__(cells=cells, index=index)
         self.name = name
+        self.grid = grid
 
     def get_xrange(self) -> Tuple[float, float]:
         """Gets the xrange of the Column.
@@ -494,6 +1360,9 @@ class Column(Sequence):
         Returns:
             Tuple[float, float]: Tuple of min and max x.
         """
+        if self.grid is not None:
+            return self.grid.get_xrange(self.index)
+
         cell = self.cells[0]
         return cell.xy[0], cell.xy[0] + cell.width
 
@@ -503,20 +1372,29 @@ class Column(Sequence):
         Returns:
             Tuple[float, float]: Tuple of min and max y.
         """
+        if self.grid is not None:
+            return self.grid.get_yrange()
+
         return min([cell.xy[1] for cell in self.cells]), max(
             [cell.xy[1] + cell.height for cell in self.cells]
         )
 
     @property
     def x(self) -> float:
+        if self.grid is not None:
+            return self.grid.column_x[self.index]
         return self.cells[0].xy[0]
 
     @property
     def y(self) -> float:
+        if self.grid is not None:
+            return self.grid.get_yrange()[0]
         return self.cells[0].xy[1]
 
     @property
     def width(self) -> float:
+        if self.grid is not None:
+            return self.grid.column_widths[self.index]
         return self.cells[0].width
 
     def __repr__(self) -> str:
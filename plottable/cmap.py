@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Sequence
 
 import matplotlib
+import numpy as np
 import pandas as pd
-from matplotlib.colors import TwoSlopeNorm
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Colormap, TwoSlopeNorm, to_rgba_array
 
 
 def normed_cmap(
@@ -71,3 +73,49 @@ def centered_cmap(
     m = matplotlib.cm.ScalarMappable(norm=norm, cmap=cmap)
 
     return m.to_rgba
+
+
+def _is_vectorized(cmap_fn: Callable) -> bool:
+    """Checks whether cmap_fn is known to map an array of values to an array of rgba values.
+    This is the case for matplotlib Colormaps and for the `to_rgba` method of a
+    ScalarMappable, as returned by normed_cmap and centered_cmap.
+
+    Args:
+        cmap_fn (Callable): a cmap function
+
+    Returns:
+        bool: whether cmap_fn can be called with an array of values
+    """
+    if isinstance(cmap_fn, Colormap):
+        return True
+
+    owner = getattr(cmap_fn, "__self__", None)
+    return isinstance(owner, ScalarMappable) and cmap_fn.__name__ == "to_rgba"
+
+
+def apply_cmap(cmap_fn: Callable, values: Sequence) -> np.ndarray:
+    """Applies a cmap function to all values.
+
+    Colormaps and the functions returned by normed_cmap and centered_cmap are called once
+    with an array of all values, other Callables are called once per value.
+
+    Args:
+        cmap_fn (Callable):
+            a Callable that returns a color based on a value.
+        values (Sequence):
+            the values to map to colors
+
+    Returns:
+        np.ndarray: an (n, 4) array of rgba values
+    """
+    if len(values) == 0:
+        return np.zeros((0, 4))
+
+    if _is_vectorized(cmap_fn):
+        values = np.asarray(values)
+        if values.dtype == object:
+            # infer the numeric dtype of values like the per value calls would see it
+            values = np.asarray(values.tolist())
+        return to_rgba_array(cmap_fn(values))
+
+    return to_rgba_array([cmap_fn(value) for value in values])
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping
 
 from matplotlib.colors import LinearSegmentedColormap
 
@@ -62,6 +63,14 @@ class ColumnDefinition:
         border: str | List = None:
             Plots a vertical borderline.
             can be either "left" / "l", "right" / "r" or "both"
+        column_plot_fn: Callable = None
+            A Callable that plots all cells of the column at once onto the tables axes,
+            instead of a plot_fn per cell on a subplot. It is called as
+            column_plot_fn(ax, values, bounds, **plot_kw), with the tables axes, an
+            array of the columns values and an (N, 4) array of the x, y, width and
+            height of its cells in data coordinates of the tables axes.
+            It returns a list of the artists it created.
+            See the column renderers in plottable.plots, ie. plottable.plots.bar_column.
 
     Formatting digits reference:
 
@@ -96,6 +105,7 @@ class ColumnDefinition:
     plot_fn: Callable = None
     plot_kw: Dict[str, Any] = field(default_factory=dict)
     border: str | List = None
+    column_plot_fn: Callable = None
 
     def _asdict(self) -> Dict[str, Any]:
         """Returns the attributes as a dictionary.
@@ -107,12 +117,40 @@ class ColumnDefinition:
 
     def _as_non_none_dict(self) -> Dict[str, Any]:
         """Returns the attributes as a dictionary, filtering out
-        keys with None values.
+        keys with None values. Values are not copied.
 
         Returns:
             Dict[str, Any]: Dictionary of Column Attributes.
         """
-        return _filter_none_values(asdict(self))
+        return _filter_none_values(
+            {f.name: getattr(self, f.name) for f in fields(self)}
+        )
+
+    def _resolve(self) -> Mapping[str, Any]:
+        """Returns a read-only mapping of the attributes that are not None.
+
+        The mapping is created once and reused by every Table the ColumnDefinition is
+        passed to, until one of its attributes is set. Values like textprops or plot_kw
+        are not copied.
+
+        Returns:
+            Mapping[str, Any]: read-only Mapping of Column Attributes.
+        """
+        spec = self.__dict__.get("_spec")
+        if spec is None:
+            spec = MappingProxyType(self._as_non_none_dict())
+            object.__setattr__(self, "_spec", spec)
+        return spec
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # invalidate the resolved mapping
+        self.__dict__.pop("_spec", None)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_spec", None)
+        return state
 
 
 # abbreviated name to reduce writing
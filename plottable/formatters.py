@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from numbers import Number
-from typing import Callable
+from typing import Callable, List, Sequence
+
+import numpy as np
 
 
 def apply_string_formatter(fmt: str, val: str | Number) -> str:
@@ -87,3 +89,89 @@ def signed_integer(val: int) -> str:
         return str(val)
     else:
         return f"+{val}"
+
+
+def _decimal_to_percent_array(values: np.ndarray) -> np.ndarray:
+    """Vectorized version of decimal_to_percent for numeric arrays."""
+    values = values.astype(float)
+    percents = np.char.add(np.rint(values * 100).astype(np.int64).astype(str), "%")
+    return np.select(
+        [values == 0, values == 1, values < 0.01, values > 0.99],
+        ["–", "✓", "<1%", ">99%"],
+        default=percents,
+    )
+
+
+def _tickcross_array(values: np.ndarray) -> np.ndarray:
+    """Vectorized version of tickcross for numeric arrays."""
+    return np.where(values.astype(bool), "✔", "✖")
+
+
+def _signed_integer_array(values: np.ndarray) -> np.ndarray:
+    """Vectorized version of signed_integer for integer arrays."""
+    return np.char.add(np.where(values > 0, "+", ""), values.astype(str))
+
+
+# vectorized versions of builtin formatters and the dtype kinds they support
+_VECTORIZED_FORMATTERS = {
+    decimal_to_percent: (_decimal_to_percent_array, "biuf"),
+    tickcross: (_tickcross_array, "biuf"),
+    signed_integer: (_signed_integer_array, "iu"),
+}
+
+
+def compile_formatter(formatter: str | Callable) -> Callable:
+    """Resolves a formatter once into a Callable that formats a single value.
+
+    Args:
+        formatter (str | Callable):
+            the string formatter.
+            Can either be a string format, ie "{:2f}" for 2 decimal places.
+            Or a Callable that is applied to the content.
+
+    Raises:
+        TypeError: when formatter is not of type str or Callable.
+
+    Returns:
+        Callable: a Callable that takes a value and returns a formatted string
+    """
+    if isinstance(formatter, str):
+        return formatter.format
+    elif isinstance(formatter, Callable):
+        return formatter
+    else:
+        raise TypeError("formatter needs to be either a `Callable` or a string.")
+
+
+def format_values(formatter: str | Callable, values: Sequence) -> List[str]:
+    """Applies a formatter to all values.
+
+    The formatter is resolved once. For numeric arrays, format strings and the
+    builtin formatters decimal_to_percent, tickcross and signed_integer take a
+    vectorized fast path.
+
+    Args:
+        formatter (str | Callable):
+            the string formatter.
+            Can either be a string format, ie "{:2f}" for 2 decimal places.
+            Or a Callable that is applied to the content.
+        values (Sequence):
+            the values to format
+
+    Returns:
+        List[str]: a list of formatted strings
+    """
+    fn = compile_formatter(formatter)
+
+    if isinstance(values, np.ndarray) and len(values) > 0:
+        kind = values.dtype.kind
+
+        if formatter in _VECTORIZED_FORMATTERS:
+            vectorized_fn, kinds = _VECTORIZED_FORMATTERS[formatter]
+            if kind in kinds and np.isfinite(values.astype(float)).all():
+                return vectorized_fn(values).tolist()
+
+        if isinstance(formatter, str) and kind in "biuf":
+            return list(map(fn, values.tolist()))
+
+    return [fn(value) for value in values]
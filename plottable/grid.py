@@ -0,0 +1,159 @@
+"""Module containing the TableGrid, a struct-of-arrays model of a Tables layout."""
+
+from __future__ import annotations
+
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+
+
+class TableGrid:
+    """A struct-of-arrays model of the layout of a Tables body cells.
+
+    Column x offsets and widths and row y offsets and heights are stored as NumPy arrays.
+    Rows are indexed by their integer location in the DataFrame, columns by their index
+    in Table.column_names. Each cell also has a style index into `styles`.
+
+    Cells, Rows and Columns of a Table read their geometry from the grid, so ranges and
+    bounds are computed from the arrays instead of by iterating cells.
+
+    Args:
+        column_widths (Sequence[float]): the width of each column
+        row_heights (Sequence[float]): the height of each row
+    """
+
+    def __init__(self, column_widths: Sequence[float], row_heights: Sequence[float]):
+        self.column_widths = np.asarray(column_widths, dtype=float)
+        self.column_x = np.cumsum(np.concatenate([[0], self.column_widths]))[:-1]
+        self.row_heights = np.asarray(row_heights, dtype=float)
+        self.row_y = np.cumsum(np.concatenate([[0], self.row_heights]))[:-1]
+
+        self.styles: List[Any] = []
+        self.style_ids = np.zeros((self.n_rows, self.n_cols), dtype=np.intp)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.row_heights)
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.column_widths)
+
+    @property
+    def n_cells(self) -> int:
+        return self.n_rows * self.n_cols
+
+    def get_xy(self, row: int, col: int) -> Tuple[float, float]:
+        """Gets the lower left corner of a cell.
+
+        Args:
+            row (int): row index
+            col (int): column index
+
+        Returns:
+            Tuple[float, float]: x and y of the cell
+        """
+        return self.column_x[col], self.row_y[row]
+
+    def get_cell_bounds(self, row: int, col: int) -> Tuple[float, float, float, float]:
+        """Gets the bounds of a cell.
+
+        Args:
+            row (int): row index
+            col (int): column index
+
+        Returns:
+            Tuple[float, float, float, float]: x, y, width and height of the cell
+        """
+        return (
+            self.column_x[col],
+            self.row_y[row],
+            self.column_widths[col],
+            self.row_heights[row],
+        )
+
+    def get_bounds(self) -> np.ndarray:
+        """Gets the bounds of all cells.
+
+        Returns:
+            np.ndarray:
+                (n_rows, n_cols, 4) array of the x, y, width and height of each cell
+        """
+        shape = (self.n_rows, self.n_cols)
+        return np.stack(
+            [
+                np.broadcast_to(self.column_x[np.newaxis, :], shape),
+                np.broadcast_to(self.row_y[:, np.newaxis], shape),
+                np.broadcast_to(self.column_widths[np.newaxis, :], shape),
+                np.broadcast_to(self.row_heights[:, np.newaxis], shape),
+            ],
+            axis=-1,
+        )
+
+    def get_xrange(self, col: int = None) -> Tuple[float, float]:
+        """Gets the xrange of a column or of the whole grid.
+
+        Args:
+            col (int, optional): column index. Defaults to None, meaning all columns.
+
+        Returns:
+            Tuple[float, float]: Tuple of min and max x.
+        """
+        if col is None:
+            if self.n_cols == 0:
+                return 0.0, 0.0
+            return self.column_x[0], self.column_x[-1] + self.column_widths[-1]
+        return self.column_x[col], self.column_x[col] + self.column_widths[col]
+
+    def get_yrange(self, row: int = None) -> Tuple[float, float]:
+        """Gets the yrange of a row or of the whole grid.
+
+        Args:
+            row (int, optional): row index. Defaults to None, meaning all rows.
+
+        Returns:
+            Tuple[float, float]: Tuple of min and max y.
+        """
+        if row is None:
+            if self.n_rows == 0:
+                return 0.0, 0.0
+            return self.row_y[0], self.row_y[-1] + self.row_heights[-1]
+        return self.row_y[row], self.row_y[row] + self.row_heights[row]
+
+    def add_style(self, style: Any) -> int:
+        """Adds a style to the grid.
+
+        Args:
+            style (Any): the style, ie. a dictionary of cell keywords.
+
+        Returns:
+            int: the index of the style
+        """
+        self.styles.append(style)
+        return len(self.styles) - 1
+
+    def get_style(self, row: int, col: int) -> Any:
+        """Gets the style of a cell.
+
+        Args:
+            row (int): row index
+            col (int): column index
+
+        Returns:
+            Any: the cells style
+        """
+        return self.styles[self.style_ids[row, col]]
+
+    def get_row_styles(self, row: int) -> List[Any]:
+        """Gets the styles of all cells of a row.
+
+        Args:
+            row (int): row index
+
+        Returns:
+            List[Any]: the styles of the rows cells
+        """
+        return [self.styles[style_id] for style_id in self.style_ids[row]]
+
+    def __repr__(self) -> str:
+        return f"TableGrid(n_rows={self.n_rows}, n_cols={self.n_cols})"
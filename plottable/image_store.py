@@ -0,0 +1,299 @@
+"""Module containing a compact on-disk store of preprocessed images, that the image plots
+read by memory mapping instead of decoding the image files.
+
+A store is built from a directory of images with the command line entry point::
+
+    plottable-images build path/to/crests path/to/crests.store --sizes 32 64 128
+
+or `python -m plottable.image_store build ...`, and registered in a process with
+`use_image_store("path/to/crests.store")`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from . import images
+from .images import _decode_image, _mask_circle, _to_rgba, get_fitted_size, resize_image
+
+DEFAULT_SIZES = (32, 64, 128, 256)
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tif", ".tiff", ".webp")
+
+# the variants of each image in a store and the PIL mode they are read with
+VARIANTS = {
+    "rgba": None,
+    "LA": "LA",
+    "circled": None,
+}
+
+_INDEX_FILE = "index.json"
+_DATA_FILE = "images.npy"
+_VERSION = 2
+
+
+def _to_uint8(img: np.ndarray) -> np.ndarray:
+    return np.rint(_to_rgba(img) * 255).astype(np.uint8)
+
+
+def _make_variant(path: str, variant: str) -> np.ndarray:
+    """Decodes an image file as uint8 RGBA array of a variant."""
+    img = _to_uint8(_decode_image(path, VARIANTS[variant]))
+    if variant == "circled":
+        img = _to_uint8(_mask_circle(_to_rgba(img)))
+    return img
+
+
+class ImageStore:
+    """A store of preprocessed images, that are memory mapped from a single file.
+
+    Each image is stored as uint8 RGBA array at its full size and at each of the stores
+    sizes that is smaller, in the variants "rgba", "LA" (monochrome) and "circled"
+    (cropped to a circle by its alpha channel). Images are looked up by their path
+    relative to the `root` directory they were stored from. An image file whose size or
+    modification time differs from when the store was built is not read from the store.
+
+    Args:
+        path (str | os.PathLike): path to the store, see build_image_store
+        root (str | os.PathLike, optional):
+            the directory the image paths are relative to. Defaults to None, which uses
+            the directory the store was built from.
+    """
+
+    def __init__(self, path: str | os.PathLike, root: str | os.PathLike = None):
+        self.path = os.path.abspath(path)
+
+        with open(os.path.join(self.path, _INDEX_FILE)) as f:
+            index = json.load(f)
+
+        if index.get("version") != _VERSION:
+            raise ValueError(
+                f"{path} is not an image store of version {_VERSION}. "
+                "Rebuild it with `plottable-images build`."
+            )
+
+        self.root = os.path.abspath(index["root"] if root is None else root)
+        self.sizes = tuple(index["sizes"])
+        self.index: Dict[str, Dict] = index["images"]
+        self.data = np.load(os.path.join(self.path, _DATA_FILE), mmap_mode="r")
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, path: str | os.PathLike) -> bool:
+        return self._get_name(path) is not None
+
+    def _get_name(self, path: str | os.PathLike) -> str | None:
+        if not isinstance(path, (str, os.PathLike)):
+            return None
+
+        name = os.path.relpath(os.path.abspath(path), self.root)
+        name = name.replace(os.sep, "/")
+        entry = self.index.get(name)
+        if entry is None:
+            return None
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # the images of files that are not available are read from the store
+            return name
+
+        # a file that has changed since the store was built is decoded again
+        if stat.st_size != entry["filesize"] or stat.st_mtime_ns != entry["mtime_ns"]:
+            return None
+
+        return name
+
+    def get(
+        self,
+        path: str | os.PathLike,
+        variant: str = "rgba",
+        min_size: Tuple[int, int] = None,
+    ) -> Tuple[np.ndarray, Tuple] | None:
+        """Gets the smallest stored image of path that covers min_size.
+
+        Args:
+            path (str | os.PathLike): path to the image file
+            variant (str, optional): one of "rgba", "LA" or "circled". Defaults to "rgba".
+            min_size (Tuple[int, int], optional):
+                the width and height the image will be shown with. Defaults to None,
+                which gets the full size image.
+
+        Returns:
+            Tuple[np.ndarray, Tuple] | None:
+                a read-only view of the image and a key that identifies it, or None if
+                the image is not in the store.
+        """
+        name = self._get_name(path)
+        if name is None:
+            return None
+
+        entries = self.index[name]["variants"].get(variant)
+        if entries is None:
+            return None
+
+        # entries are ordered by decreasing size, the first is the full size image
+        width, height, offset = entries[0]
+        if min_size is not None:
+            needed = get_fitted_size((height, width), min_size) or (width, height)
+            for entry in entries:
+                if entry[0] >= needed[0] and entry[1] >= needed[1]:
+                    width, height, offset = entry
+
+        img = self.data[offset : offset + width * height * 4].reshape(height, width, 4)
+        return img, (self.path, name, variant, width, height)
+
+    def __repr__(self) -> str:
+        return f"ImageStore({self.path!r}, n_images={len(self)}, sizes={self.sizes})"
+
+
+def build_image_store(
+    directory: str | os.PathLike,
+    output: str | os.PathLike,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    variants: Sequence[str] = tuple(VARIANTS),
+) -> ImageStore:
+    """Decodes all images of a directory and its subdirectories into an image store.
+
+    Args:
+        directory (str | os.PathLike): the directory of images
+        output (str | os.PathLike): the directory to write the store to
+        sizes (Sequence[int], optional):
+            the maximum width and height of the downsampled images that are stored in
+            addition to the full size image. Defaults to (32, 64, 128, 256).
+        variants (Sequence[str], optional):
+            the variants to store. Defaults to all of "rgba", "LA" and "circled".
+
+    Returns:
+        ImageStore: the store
+    """
+    directory = os.path.abspath(directory)
+    sizes = sorted(set(sizes), reverse=True)
+    unknown = set(variants) - set(VARIANTS)
+    if unknown:
+        raise ValueError(f"Unknown variants {sorted(unknown)}. Use {list(VARIANTS)}.")
+
+    arrays: List[np.ndarray] = []
+    index: Dict[str, Dict] = {}
+    offset = 0
+
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if not filename.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+
+            path = os.path.join(dirpath, filename)
+            name = os.path.relpath(path, directory).replace(os.sep, "/")
+            stat = os.stat(path)
+            entry = {
+                "filesize": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "variants": {},
+            }
+
+            for variant in variants:
+                img = _make_variant(path, variant)
+                resized = [img]
+                for size in sizes:
+                    fitted = get_fitted_size(img.shape, (size, size))
+                    if fitted is not None:
+                        resized.append(resize_image(img, fitted))
+
+                entry["variants"][variant] = []
+                for arr in resized:
+                    height, width = arr.shape[:2]
+                    entry["variants"][variant].append([width, height, offset])
+                    arrays.append(arr.ravel())
+                    offset += arr.size
+
+            index[name] = entry
+
+    os.makedirs(output, exist_ok=True)
+    data = np.concatenate(arrays) if arrays else np.zeros(0, dtype=np.uint8)
+    np.save(os.path.join(output, _DATA_FILE), data)
+
+    with open(os.path.join(output, _INDEX_FILE), "w") as f:
+        json.dump(
+            {"version": _VERSION, "root": directory, "sizes": sizes, "images": index},
+            f,
+        )
+
+    return ImageStore(output)
+
+
+def use_image_store(
+    store: str | os.PathLike | ImageStore, root: str | os.PathLike = None
+) -> ImageStore:
+    """Registers an image store, so that plottable.images.read_image and the image plots
+    read the images it contains from it.
+
+    Args:
+        store (str | os.PathLike | ImageStore): an image store or the path to one
+        root (str | os.PathLike, optional):
+            the directory the image paths are relative to, see ImageStore.
+            Defaults to None.
+
+    Returns:
+        ImageStore: the registered store
+    """
+    if not isinstance(store, ImageStore):
+        store = ImageStore(store, root=root)
+    images.image_stores.append(store)
+    return store
+
+
+def clear_image_stores() -> None:
+    """Unregisters all image stores."""
+    images.image_stores.clear()
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """The plottable-images command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="plottable-images",
+        description="Preprocess images for plottable's image plots.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser(
+        "build", help="decode a directory of images into an image store"
+    )
+    build.add_argument("directory", help="the directory of images")
+    build.add_argument("output", help="the directory to write the store to")
+    build.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="maximum width and height of the downsampled images (default: %(default)s)",
+    )
+    build.add_argument(
+        "--variants",
+        nargs="+",
+        choices=list(VARIANTS),
+        default=list(VARIANTS),
+        help="the variants to store (default: %(default)s)",
+    )
+
+    args = parser.parse_args(argv)
+
+    store = build_image_store(
+        args.directory, args.output, sizes=args.sizes, variants=args.variants
+    )
+    print(
+        f"Stored {len(store)} images ({store.data.nbytes / 1024**2:.1f} MB) "
+        f"in {store.path}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,401 @@
+"""Module containing a process-wide cache of decoded images for the image plots."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Hashable, Iterable, List, Sequence, Tuple
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import Normalize
+from matplotlib.image import pil_to_array
+from PIL import Image
+
+from .cache import BoundedCache
+
+
+class ImageCache(BoundedCache):
+    """A least recently used cache of decoded images that holds at most `maxbytes`
+    bytes of image data and records its hits and misses.
+
+    Args:
+        maxbytes (int, optional):
+            maximum number of bytes of the cached arrays. Once it is exceeded, the least
+            recently used images are discarded. Defaults to 256 MB.
+    """
+
+    def __init__(self, maxbytes: int = 256 * 1024**2):
+        super().__init__(maxsize=None)
+        self.maxbytes = maxbytes
+        self.currbytes = 0
+
+    def set(self, key: Hashable, value: np.ndarray) -> None:
+        """Stores an image for key, discarding the least recently used images if the
+        cache holds more than `maxbytes` bytes. Images larger than `maxbytes` are not
+        cached.
+
+        Args:
+            key (Hashable): the key
+            value (np.ndarray): the image
+        """
+        if value.nbytes > self.maxbytes:
+            return
+
+        if key in self._data:
+            self.currbytes -= self._data.pop(key).nbytes
+
+        self._data[key] = value
+        self.currbytes += value.nbytes
+
+        while self.currbytes > self.maxbytes:
+            _, discarded = self._data.popitem(last=False)
+            self.currbytes -= discarded.nbytes
+
+    def clear(self) -> None:
+        """Removes all images and resets the statistics."""
+        super().clear()
+        self.currbytes = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ImageCache({self.info()}, currbytes={self.currbytes}, "
+            f"maxbytes={self.maxbytes})"
+        )
+
+
+image_cache = ImageCache()
+
+# image stores that images are read from before they are decoded,
+# see plottable.image_store.use_image_store
+image_stores: List[Any] = []
+
+
+def _get_file_key(path: str | os.PathLike, *args: Any) -> Tuple | None:
+    """Gets a key of a file from its absolute path, modification time and size, so that
+    a modified file is decoded again. Returns None for paths that are not files."""
+    if not isinstance(path, (str, os.PathLike)):
+        return None
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size) + args
+
+
+def _decode_image(path: str | os.PathLike, mode: str = None) -> np.ndarray:
+    if mode is None:
+        return plt.imread(path)
+
+    with Image.open(path) as img:
+        return pil_to_array(img.convert(mode))
+
+
+def _decode_read_only(path: str | os.PathLike, mode: str = None) -> np.ndarray:
+    img = _decode_image(path, mode)
+    img.setflags(write=False)
+    return img
+
+
+def _get_stored_image(
+    path: str | os.PathLike,
+    mode: str = None,
+    min_size: Tuple[int, int] = None,
+    circled: bool = False,
+) -> Tuple[np.ndarray, Tuple] | None:
+    """Gets an image and its key from the first registered image store containing it."""
+    if not image_stores:
+        return None
+
+    if mode is None:
+        variant = "circled" if circled else "rgba"
+    elif mode == "LA" and not circled:
+        variant = "LA"
+    else:
+        return None
+
+    for store in image_stores:
+        stored = store.get(path, variant, min_size)
+        if stored is not None:
+            return stored
+    return None
+
+
+def get_fitted_size(
+    shape: Tuple[int, ...], max_size: Tuple[int, int]
+) -> Tuple[int, int] | None:
+    """Gets the size of an image that is scaled down to fit into max_size pixels while
+    keeping its aspect ratio.
+
+    Args:
+        shape (Tuple[int, ...]): the shape of the image array
+        max_size (Tuple[int, int]): maximum width and height in pixels
+
+    Returns:
+        Tuple[int, int] | None:
+            width and height of the scaled image, or None if the image already fits.
+    """
+    height, width = shape[:2]
+    scale = min(max_size[0] / width, max_size[1] / height)
+    if scale >= 1:
+        return None
+    return max(1, int(np.ceil(width * scale))), max(1, int(np.ceil(height * scale)))
+
+
+def resize_image(img: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+    """Resizes an image array with a Lanczos filter, keeping its dtype and channels.
+
+    Args:
+        img (np.ndarray): the image
+        size (Tuple[int, int]): width and height in pixels
+
+    Returns:
+        np.ndarray: the resized image
+    """
+    channels = img.reshape(img.shape[:2] + (-1,)).astype(np.float32)
+    resized = np.stack(
+        [
+            np.asarray(Image.fromarray(channels[..., idx]).resize(size, Image.LANCZOS))
+            for idx in range(channels.shape[-1])
+        ],
+        axis=-1,
+    ).reshape((size[1], size[0]) + img.shape[2:])
+
+    if np.issubdtype(img.dtype, np.integer):
+        info = np.iinfo(img.dtype)
+        return np.clip(np.rint(resized), info.min, info.max).astype(img.dtype)
+    if img.dtype.kind == "f" and img.max(initial=0) <= 1:
+        return np.clip(resized, 0, 1).astype(img.dtype)
+    return resized.astype(img.dtype)
+
+
+def _resize_read_only(img: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+    resized = resize_image(img, size)
+    resized.setflags(write=False)
+    return resized
+
+
+def read_image(
+    path: str | os.PathLike,
+    mode: str = None,
+    max_size: Tuple[int, int] = None,
+    cache: ImageCache = None,
+) -> np.ndarray:
+    """Reads an image as an array, like plt.imread, and caches the decoded array.
+
+    Images are cached by their path, modification time, size and mode, so an image that
+    is shown in many cells or tables is decoded once per process. Downsampled images
+    are cached per max_size as well. The cached arrays are read-only.
+
+    Images contained in a registered image store (see plottable.image_store) are not
+    decoded, but read from the memory mapped store as uint8 RGBA arrays. Downsampled
+    images are resized from the smallest stored size that covers max_size.
+
+    Args:
+        path (str | os.PathLike):
+            path to image file. Objects that are not paths, ie. file-like objects, are
+            decoded without caching.
+        mode (str, optional):
+            a PIL mode to convert the image to, ie. "LA" for monochrome images.
+            Defaults to None, which reads the image with plt.imread.
+        max_size (Tuple[int, int], optional):
+            maximum width and height in pixels. Larger images are downsampled to fit
+            into it. Defaults to None.
+        cache (ImageCache, optional):
+            the cache to use. Defaults to None, which uses plottable.images.image_cache.
+
+    Returns:
+        np.ndarray: the image
+    """
+    if cache is None:
+        cache = image_cache
+
+    stored = _get_stored_image(path, mode, max_size)
+    if stored is not None:
+        img, key = stored
+    else:
+        key = _get_file_key(path, mode)
+        if key is None:
+            img = _decode_image(path, mode)
+            size = None if max_size is None else get_fitted_size(img.shape, max_size)
+            return img if size is None else resize_image(img, size)
+
+        img = cache.memoize(key, partial(_decode_read_only, path, mode))
+
+    if max_size is None:
+        return img
+
+    size = get_fitted_size(img.shape, max_size)
+    if size is None:
+        return img
+
+    return cache.memoize(key + (size,), partial(_resize_read_only, img, size))
+
+
+def prefetch_images(
+    paths: Iterable[str | os.PathLike],
+    mode: str = None,
+    max_workers: int = None,
+    cache: ImageCache = None,
+) -> int:
+    """Decodes images that are not cached yet in a thread pool and stores them in the
+    cache, so that reading them afterwards doesn't decode them one after another.
+
+    Decoding PNGs and JPEGs releases the GIL for most of the work. The images are
+    stored in the cache by the calling thread.
+
+    Args:
+        paths (Iterable[str | os.PathLike]):
+            paths to image files. Duplicates and values that are not paths of existing
+            files are skipped, as well as images of a registered image store.
+        mode (str, optional):
+            a PIL mode to convert the images to, see read_image. Defaults to None.
+        max_workers (int, optional):
+            maximum number of threads. Defaults to None, which uses
+            min(8, os.cpu_count()).
+        cache (ImageCache, optional):
+            the cache to use. Defaults to None, which uses plottable.images.image_cache.
+
+    Returns:
+        int: the number of decoded images
+    """
+    if cache is None:
+        cache = image_cache
+
+    keys = {}
+    for path in paths:
+        key = _get_file_key(path, mode)
+        if key is None or key in cache or key in keys:
+            continue
+        if _get_stored_image(path, mode) is None:
+            keys[key] = path
+
+    if not keys:
+        return 0
+
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        images = executor.map(partial(_decode_read_only, mode=mode), keys.values())
+        for key, img in zip(keys, images):
+            cache.misses += 1
+            cache.set(key, img)
+
+    return len(keys)
+
+
+def _to_rgba(img: np.ndarray) -> np.ndarray:
+    """Converts an image array to float RGBA values between 0 and 1 like imshow does."""
+    if img.dtype.kind in "ui":
+        img = img / np.iinfo(img.dtype).max
+
+    if img.ndim == 2:
+        return plt.get_cmap()(Normalize()(img))
+
+    if img.shape[-1] == 3:
+        img = np.concatenate([img, np.ones(img.shape[:2] + (1,))], axis=-1)
+
+    return img.astype(float)
+
+
+def _mask_circle(img: np.ndarray) -> np.ndarray:
+    """Makes the pixels of an RGBA image transparent outside of the largest circle
+    centered in it, with an antialiased edge."""
+    height, width = img.shape[:2]
+    radius = min(width, height) / 2
+    ys, xs = np.ogrid[:height, :width]
+    distance = np.hypot(xs + 0.5 - width / 2, ys + 0.5 - height / 2)
+
+    img = img.copy()
+    img[..., 3] *= np.clip(radius - distance + 0.5, 0, 1)
+    return img
+
+
+def _get_tile(
+    path: str | os.PathLike,
+    size: Tuple[int, int],
+    mode: str = None,
+    circled: bool = False,
+    cache: ImageCache = None,
+) -> np.ndarray:
+    """Gets an image resized to size as float RGBA tile of an atlas."""
+    if cache is None:
+        cache = image_cache
+
+    stored = _get_stored_image(path, mode, size, circled=circled)
+
+    def _make_tile() -> np.ndarray:
+        if stored is not None:
+            img = stored[0]
+        else:
+            img = read_image(path, mode=mode, cache=cache)
+        if img.shape[1::-1] != size:
+            img = resize_image(img, size)
+        tile = _to_rgba(img)
+        if circled and stored is None:
+            tile = _mask_circle(tile)
+        tile.setflags(write=False)
+        return tile
+
+    key = stored[1] if stored is not None else _get_file_key(path, mode)
+    if key is None:
+        return _make_tile()
+    return cache.memoize(key + ("tile", size, circled), _make_tile)
+
+
+def make_image_atlas(
+    paths: Sequence[str | os.PathLike],
+    rects: np.ndarray,
+    shape: Tuple[int, int],
+    mode: str = None,
+    circled: bool = False,
+    cache: ImageCache = None,
+) -> np.ndarray:
+    """Packs images into a single RGBA array. Each image is scaled to fit into its
+    pixel rectangle while keeping its aspect ratio, and centered in it.
+
+    Tiles are created once per distinct image and size and cached, so an image that
+    occurs in many rectangles is only decoded and resized once.
+
+    Args:
+        paths (Sequence[str | os.PathLike]):
+            paths to image files. Values that are not paths are left empty.
+        rects (np.ndarray):
+            (N, 4) array of the left, top, width and height of the pixel rectangle of
+            each image in the atlas
+        shape (Tuple[int, int]): height and width of the atlas in pixels
+        mode (str, optional):
+            a PIL mode to convert the images to, see read_image. Defaults to None.
+        circled (bool, optional):
+            whether to crop each image to the largest circle within it. Defaults to False.
+        cache (ImageCache, optional):
+            the cache to use. Defaults to None, which uses plottable.images.image_cache.
+
+    Returns:
+        np.ndarray: the (height, width, 4) atlas
+    """
+    atlas = np.zeros(tuple(shape) + (4,))
+
+    for path, (left, top, width, height) in zip(paths, rects):
+        if not isinstance(path, (str, os.PathLike)) or width < 1 or height < 1:
+            continue
+
+        img_height, img_width = read_image(path, mode=mode, cache=cache).shape[:2]
+        scale = min(width / img_width, height / img_height)
+        size = (
+            max(1, int(round(img_width * scale))),
+            max(1, int(round(img_height * scale))),
+        )
+        tile = _get_tile(path, size, mode=mode, circled=circled, cache=cache)
+
+        x0 = int(round(left + (width - size[0]) / 2))
+        y0 = int(round(top + (height - size[1]) / 2))
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x0 + size[0], shape[1]), min(y0 + size[1], shape[0])
+        atlas[y0:y1, x0:x1] = tile[: y1 - y0, : x1 - x0]
+
+    return atlas
@@ -1,58 +1,131 @@
+from __future__ import annotations
+
+import os
+from functools import partial
 from statistics import mean
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Sequence, Tuple
 
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.patches import BoxStyle, Circle, FancyBboxPatch, Rectangle, Wedge
-from PIL import Image
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.cbook import normalize_kwargs
+from matplotlib.collections import PathCollection, PolyCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+from matplotlib.markers import MarkerStyle
+from matplotlib.patches import (
+    BoxStyle,
+    Circle,
+    FancyBboxPatch,
+    Patch,
+    Rectangle,
+    Wedge,
+)
+from matplotlib.path import Path
+from matplotlib.text import Text
+from matplotlib.transforms import Bbox, IdentityTransform
+
+from .cache import BoundedCache
+from .cmap import apply_cmap
+from .formatters import apply_formatter, format_values
+from .images import make_image_atlas, prefetch_images, read_image
+
+
+def _get_render_dpi(fig: matplotlib.figure.Figure) -> float:
+    """Gets the larger of the figures dpi and the dpi figures are saved with."""
+    savefig_dpi = plt.rcParams["savefig.dpi"]
+    return fig.dpi if savefig_dpi == "figure" else max(fig.dpi, savefig_dpi)
+
+
+def _get_axes_pixel_size(ax: matplotlib.axes.Axes) -> Tuple[int, int]:
+    """Gets the width and height of the axes in pixels at the larger of the figures dpi
+    and the dpi figures are saved with."""
+    scale = _get_render_dpi(ax.figure) / ax.figure.dpi
+    return (
+        max(1, int(np.ceil(ax.bbox.width * scale))),
+        max(1, int(np.ceil(ax.bbox.height * scale))),
+    )
+
 
-from .formatters import apply_formatter
+def _imshow(
+    ax: matplotlib.axes.Axes, path: str, mode: str = None, downsample: bool = True
+) -> matplotlib.image.AxesImage:
+    """Reads an image from the image cache and shows it on the axes.
+
+    If downsample is True, the image is downsampled to the pixel size of the axes
+    before it is shown. It keeps the extent of the full size image, so the axes limits
+    don't change.
+    """
+    if not downsample:
+        return ax.imshow(read_image(path, mode=mode))
 
+    img = read_image(path, mode=mode)
+    height, width = img.shape[:2]
+    img = read_image(path, mode=mode, max_size=_get_axes_pixel_size(ax))
 
-def image(ax: matplotlib.axes.Axes, path: str) -> matplotlib.image.AxesImage:
+    return ax.imshow(img, extent=(-0.5, width - 0.5, height - 0.5, -0.5))
+
+
+def image(
+    ax: matplotlib.axes.Axes, path: str, downsample: bool = True
+) -> matplotlib.image.AxesImage:
     """Plots an image on the axes.
+    The decoded image is cached, see plottable.images.read_image.
 
     Args:
         ax (matplotlib.axes.Axes): Axes
         path (str): path to image file
+        downsample (bool, optional):
+            whether to downsample the image to the pixel size of the axes before
+            plotting it. Defaults to True.
 
     Returns:
        matplotlib.image.AxesImage
     """
-    img = plt.imread(path)
-    im = ax.imshow(img)
+    im = _imshow(ax, path, downsample=downsample)
     im.set_clip_on(False)
     ax.axis("off")
     return im
 
 
-def monochrome_image(ax: matplotlib.axes.Axes, path: str) -> matplotlib.image.AxesImage:
+def monochrome_image(
+    ax: matplotlib.axes.Axes, path: str, downsample: bool = True
+) -> matplotlib.image.AxesImage:
     """Plots a monochrome image on the axes.
+    The decoded image is cached, see plottable.images.read_image.
 
     Args:
         ax (matplotlib.axes.Axes): Axes
         path (str): path to image file
+        downsample (bool, optional):
+            whether to downsample the image to the pixel size of the axes before
+            plotting it. Defaults to True.
 
     Returns:
        matplotlib.image.AxesImage
     """
-    img = Image.open(path).convert("LA")
-    im = ax.imshow(img)
+    im = _imshow(ax, path, mode="LA", downsample=downsample)
     im.set_clip_on(False)
     ax.axis("off")
     return im
 
 
 def circled_image(
-    ax: matplotlib.axes.Axes, path: str, **circle_kwargs
+    ax: matplotlib.axes.Axes, path: str, downsample: bool = True, **circle_kwargs
 ) -> matplotlib.image.AxesImage:
     """Plots an image cropped to a circle on the axes.
     The cropping radius is the minimum of (width, height) of the image.
+    The decoded image is cached, see plottable.images.read_image.
 
     Args:
         ax (matplotlib.axes.Axes): Axes
         path (str): path to image file
+        downsample (bool, optional):
+            whether to downsample the image to the pixel size of the axes before
+            plotting it. Defaults to True.
 
     Returns:
         matplotlib.image.AxesImage
@@ -66,8 +139,7 @@ def circled_image(
 
     circle_kw.update(circle_kwargs)
 
-    img = plt.imread(path)
-    im = ax.imshow(img)
+    im = _imshow(ax, path, downsample=downsample)
     ax.axis("off")
 
     radius = min(max(ax.get_xlim()), max(ax.get_ylim())) / 2
@@ -173,7 +245,7 @@ def percentile_bars(
     cmap: matplotlib.colors.Colormap = None,
     is_pct=False,
     rect_kw: Dict[str, Any] = {},
-) -> List[matplotlib.patches.FancyBboxPatch]:
+) -> matplotlib.collections.PathCollection:
     """Plots percentile bars on the axes.
 
     Args:
@@ -189,70 +261,29 @@ def percentile_bars(
             whether the value is given not as a decimal, but as a value between 0 and 100.
             Defaults to False.
         rect_kw (Dict[str, Any], optional):
-            rect keywords passed to matplotlib.patches.FancyBboxPatch. Defaults to {}.
+            rect keywords of the bars, ie. linewidth and the boxstyle of a
+            matplotlib.patches.FancyBboxPatch. Defaults to {}.
 
     Returns:
-        List[matplotlib.patches.FancyBboxPatch]
+        matplotlib.collections.PathCollection:
+            a single collection of the background, the bars and their edges
     """
-
-    _rect_kw = {
-        "linewidth": 2.5,
-        "boxstyle": BoxStyle("Round", pad=0, rounding_size=0.05),
-    }
-
-    _rect_kw.update(rect_kw)
-
-    edgecolor = ax.get_facecolor()
-
-    if background_color is None:
-        background_color = ax.get_facecolor()
-
-    if is_pct is False:
-        val = val / 100
-
-    if cmap is not None:
-        color = cmap(val)
-    elif color is None:
-        color = "C1"
-
-    value_patch = Rectangle(
-        xy=(0, 0), width=val, height=1, color="w", alpha=0.75, transform=ax.transData
+    bars = _make_percentile_bars(
+        ax,
+        [val],
+        np.array([[0, 0, 1, 1]]),
+        color=color,
+        background_color=background_color,
+        cmap=cmap,
+        is_pct=is_pct,
+        rect_kw=rect_kw,
     )
-
-    bg_rects = []
-    rects = []
-
-    for x in np.linspace(0, 0.9, 10):
-
-        bg_rect = FancyBboxPatch(
-            xy=(x, 0),
-            width=0.1,
-            height=1,
-            facecolor=background_color,
-            edgecolor=edgecolor,
-            alpha=1,
-            **_rect_kw,
-            zorder=0.1,
-        )
-        bg_rects.append(bg_rect)
-        ax.add_patch(bg_rect)
-
-        rect = FancyBboxPatch(
-            xy=(x, 0),
-            width=0.1,
-            height=1,
-            facecolor=color,
-            edgecolor=edgecolor,
-            **_rect_kw,
-            zorder=0.2,
-        )
-        rects.append(rect)
-        ax.add_patch(rect)
-        rect.set_clip_path(value_patch)
-
+    ax.add_collection(bars, autolim=False)
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
     ax.axis("off")
 
-    return rects
+    return bars
 
 
 def percentile_stars(
@@ -392,3 +423,1023 @@ def progress_donut(
     ax.axis("off")
 
     return wedges
+
+
+# Column renderers draw a builtin plot for all cells of a column at once on the tables
+# axes, instead of on one axes inset per cell. They take the tables axes, the values of
+# the column and the (N, 4) bounds (x, y, width, height) of its cells in data
+# coordinates, followed by the keywords of the plot function they render.
+
+
+def _get_plot_areas(bounds: np.ndarray, padding: float = 0.2) -> np.ndarray:
+    """Gets the areas of the cells that their axes insets would cover.
+
+    Args:
+        bounds (np.ndarray): (N, 4) array of the cells x, y, width and height
+        padding (float, optional):
+            vertical padding as a ratio of the cells height. Defaults to 0.2.
+
+    Returns:
+        np.ndarray: (N, 4) array of the areas x, y, width and height
+    """
+    x, y, width, height = np.asarray(bounds, dtype=float).reshape(-1, 4).T
+    return np.column_stack([x, y + padding * height, width, (1 - 2 * padding) * height])
+
+
+def _to_table_coords(
+    areas: np.ndarray, u: np.ndarray, v: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Maps coordinates within the unit square of each area to data coordinates of the
+    tables axes. Like in an axes inset, v runs from the bottom to the top of the area,
+    while the yaxis of a table is inverted.
+
+    Args:
+        areas (np.ndarray): (N, 4) array of the areas x, y, width and height
+        u (np.ndarray): horizontal coordinates of shape (N,) or (N, M)
+        v (np.ndarray): vertical coordinates of shape (N,) or (N, M)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: x and y data coordinates
+    """
+    u, v = np.asarray(u, dtype=float), np.asarray(v, dtype=float)
+    shape = (-1,) + (1,) * (max(u.ndim, v.ndim) - 1)
+    x, y, width, height = (areas[:, i].reshape(shape) for i in range(4))
+    return x + u * width, y + (1 - v) * height
+
+
+def _scale_values(values: Any, is_pct: bool) -> np.ndarray:
+    """Converts values to a float array of decimals, like the is_pct argument does."""
+    values = np.asarray(values, dtype=float)
+    if is_pct is False:
+        values = values / 100
+    return values
+
+
+class AnnotationCollection(Artist):
+    """An Artist that draws many texts that share their textprops, by reusing a single
+    matplotlib.text.Text, instead of adding a Text artist per text.
+
+    Args:
+        xs (Sequence[float]): x positions of the texts
+        ys (Sequence[float]): y positions of the texts
+        texts (Sequence[str]): the texts
+        ha (str | Sequence[str], optional):
+            horizontal alignment of all texts or of each text. Defaults to "center".
+        textprops are passed to the matplotlib.text.Text.
+    """
+
+    def __init__(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        texts: Sequence[str],
+        ha: str | Sequence[str] = "center",
+        **textprops,
+    ):
+        super().__init__()
+        self.zorder = textprops.pop("zorder", Text.zorder)
+        self._xs = np.asarray(xs, dtype=float)
+        self._ys = np.asarray(ys, dtype=float)
+        self._texts = [str(text) for text in texts]
+        if isinstance(ha, str):
+            ha = [ha] * len(self._texts)
+        self._has = list(ha)
+        self._text = Text(0, 0, "", **textprops)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def get_texts(self) -> List[str]:
+        """Returns the texts."""
+        return self._texts
+
+    def get_positions(self) -> np.ndarray:
+        """Returns the (N, 2) positions of the texts."""
+        return np.column_stack([self._xs, self._ys])
+
+    def _iter_texts(self) -> Iterator[Text]:
+        text = self._text
+        text.set_figure(self.figure)
+        text.set_transform(self.get_transform())
+        text.set_clip_on(False)
+        for x, y, _text, ha in zip(self._xs, self._ys, self._texts, self._has):
+            text.set_position((x, y))
+            text.set_text(_text)
+            text.set_horizontalalignment(ha)
+            yield text
+
+    def get_window_extent(self, renderer=None) -> Bbox:
+        bboxes = [text.get_window_extent(renderer) for text in self._iter_texts()]
+        if not bboxes:
+            return Bbox.null()
+        return Bbox.union(bboxes)
+
+    def draw(self, renderer) -> None:
+        if not self.get_visible():
+            return
+
+        for text in self._iter_texts():
+            text.draw(renderer)
+
+        self.stale = False
+
+
+def _get_rectangle_verts(
+    x0: np.ndarray, y0: np.ndarray, x1: np.ndarray, y1: np.ndarray
+) -> np.ndarray:
+    """Gets the (N, 4, 2) vertices of rectangles from their opposite corners."""
+    return np.stack(
+        [
+            np.column_stack([x0, y0]),
+            np.column_stack([x1, y0]),
+            np.column_stack([x1, y1]),
+            np.column_stack([x0, y1]),
+        ],
+        axis=1,
+    )
+
+
+def _format_annotations(formatter: str | Callable, values: np.ndarray) -> List[str]:
+    """Formats the annotations of a column like ax.text formats a single value."""
+    if formatter is not None:
+        return format_values(formatter, values)
+    return [str(val) for val in values]
+
+
+def bar_column(
+    ax: matplotlib.axes.Axes,
+    values: np.ndarray,
+    bounds: np.ndarray,
+    xlim: Tuple[float, float] = (0, 1),
+    cmap: matplotlib.colors.Colormap = None,
+    plot_bg_bar: bool = False,
+    annotate: bool = False,
+    textprops: Dict[str, Any] = {},
+    formatter: Callable = None,
+    **kwargs,
+) -> List[matplotlib.artist.Artist]:
+    """Plots a bar in each cell of a column on the tables axes.
+    See plottable.plots.bar for the arguments.
+
+    The background bars and the bars are a single PolyCollection, the annotations a
+    single AnnotationCollection.
+
+    Returns:
+        List[matplotlib.artist.Artist]
+    """
+    kwargs = kwargs.copy()
+    color = kwargs.pop("color", "C1")
+    bar_height = kwargs.pop("height", 0.8)
+
+    # like in bar, the annotations show the values as they are, ie. 14 for an integer
+    texts = values
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+
+    if cmap is not None:
+        colors = apply_cmap(cmap, values)
+    else:
+        colors = to_rgba_array([color] * n)
+
+    areas = _get_plot_areas(bounds)
+    margin = 0.025 * abs(xlim[1] - xlim[0])
+    xmin, xmax = xlim[0] - margin, xlim[1] + margin
+
+    def _u(x):
+        return (np.asarray(x, dtype=float) - xmin) / (xmax - xmin)
+
+    v0 = np.full(n, 0.5 - bar_height / 2)
+    v1 = np.full(n, 0.5 + bar_height / 2)
+
+    x0, y0 = _to_table_coords(areas, np.full(n, _u(0)), v0)
+    x1, y1 = _to_table_coords(areas, _u(values), v1)
+    verts = _get_rectangle_verts(x0, y0, x1, y1)
+    facecolors = colors
+    edgecolors = np.zeros((n, 4))
+
+    if plot_bg_bar:
+        # like in bar, the outlines of the background bars are drawn on top
+        x0, y0 = _to_table_coords(areas, np.full(n, _u(xlim[0])), v0)
+        x1, y1 = _to_table_coords(areas, np.full(n, _u(xlim[1])), v1)
+        verts = np.concatenate([verts, _get_rectangle_verts(x0, y0, x1, y1)])
+        facecolors = np.concatenate([facecolors, np.zeros((n, 4))])
+        edgecolors = np.concatenate(
+            [edgecolors, to_rgba_array([plt.rcParams["text.color"]] * n)]
+        )
+
+    bars = PolyCollection(
+        verts, facecolors=facecolors, edgecolors=edgecolors, zorder=2.1, **kwargs
+    )
+    ax.add_collection(bars, autolim=False)
+    artists = [bars]
+
+    if annotate:
+        offset = 0.025 * abs(xlim[1] - xlim[0])
+        is_left = values < 0.5 * xlim[1]
+        text_x = np.where(is_left, values + offset, values - offset)
+        xs, ys = _to_table_coords(areas, _u(text_x), np.full(n, 0.5))
+
+        annotations = AnnotationCollection(
+            xs,
+            ys,
+            _format_annotations(formatter, texts),
+            ha=np.where(is_left, "left", "right").tolist(),
+            va="center",
+            **textprops,
+        )
+        ax.add_artist(annotations)
+        artists.append(annotations)
+
+    return artists
+
+
+_SEGMENT_PATHS = BoundedCache(maxsize=64)
+
+
+def _get_boxstyle_key(boxstyle: str | BoxStyle) -> Any:
+    """Gets a hashable key of a boxstyle from its name and parameters."""
+    if isinstance(boxstyle, str):
+        return boxstyle
+    return type(boxstyle).__name__, tuple(sorted(vars(boxstyle).items()))
+
+
+def _get_segments_path(
+    n_segments: int,
+    boxstyle: str | BoxStyle,
+    mutation_scale: float = 1,
+    mutation_aspect: float = 1,
+) -> Path:
+    """Gets a compound path of n_segments rounded segments that span the unit square
+    from left to right. Each segment has the same number of vertices.
+
+    The paths are cached per segment count and box style.
+
+    Args:
+        n_segments (int): number of segments
+        boxstyle (str | BoxStyle): the boxstyle of a FancyBboxPatch
+        mutation_scale (float, optional):
+            mutation scale of the boxstyle. Defaults to 1.
+        mutation_aspect (float, optional):
+            mutation aspect of the boxstyle. Defaults to 1.
+
+    Returns:
+        Path: the compound path of the segments
+    """
+
+    def _make_path() -> Path:
+        segment = FancyBboxPatch(
+            xy=(0, 0),
+            width=1 / n_segments,
+            height=1,
+            boxstyle=boxstyle,
+            mutation_scale=mutation_scale,
+            mutation_aspect=mutation_aspect,
+        ).get_path()
+        offsets = np.column_stack(
+            [np.arange(n_segments) / n_segments, np.zeros(n_segments)]
+        )
+        vertices = segment.vertices[np.newaxis] + offsets[:, np.newaxis]
+        codes = np.tile(segment.codes, n_segments)
+        return Path(vertices.reshape(-1, 2), codes)
+
+    key = (
+        n_segments,
+        _get_boxstyle_key(boxstyle),
+        mutation_scale,
+        mutation_aspect,
+    )
+    return _SEGMENT_PATHS.memoize(key, _make_path)
+
+
+def _make_percentile_bars(
+    ax: matplotlib.axes.Axes,
+    values: Any,
+    areas: np.ndarray,
+    color: str = None,
+    background_color: str = None,
+    cmap: matplotlib.colors.Colormap = None,
+    is_pct=False,
+    rect_kw: Dict[str, Any] = {},
+    n_segments: int = 10,
+) -> PathCollection:
+    """Creates a single PathCollection of the percentile bars of each area.
+
+    The collection first fills the background of the segments, then the bars and then
+    strokes the edges of all segments. The partially reached segment is cut at the
+    value instead of clipped.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes
+        values (Any): the values
+        areas (np.ndarray): (N, 4) array of the x, y, width and height of each area
+        n_segments (int, optional): number of segments. Defaults to 10.
+        See percentile_bars for the other arguments.
+
+    Returns:
+        PathCollection
+    """
+    _rect_kw = {
+        "linewidth": 2.5,
+        "boxstyle": BoxStyle("Round", pad=0, rounding_size=0.05),
+    }
+    _rect_kw.update(normalize_kwargs(rect_kw, Patch))
+
+    linewidth = _rect_kw.pop("linewidth")
+    unit_path = _get_segments_path(
+        n_segments,
+        _rect_kw.pop("boxstyle"),
+        _rect_kw.pop("mutation_scale", 1),
+        _rect_kw.pop("mutation_aspect", 1),
+    )
+
+    edgecolor = ax.get_facecolor()
+
+    if background_color is None:
+        background_color = ax.get_facecolor()
+
+    values = np.nan_to_num(_scale_values(values, is_pct))
+
+    if cmap is not None:
+        colors = list(apply_cmap(cmap, values))
+    else:
+        colors = [color or "C1"] * len(values)
+
+    n_vertices = len(unit_path.vertices) // n_segments
+    seg_width = 1 / n_segments
+
+    def _to_area(vertices, area):
+        x, y, width, height = area
+        return vertices * (width, height) + (x, y)
+
+    bg_paths = []
+    paths = []
+
+    for area, val in zip(areas, values):
+        bg_paths.append(Path(_to_area(unit_path.vertices, area), unit_path.codes))
+
+        n_full = int(np.clip(np.floor(val / seg_width + 1e-9), 0, n_segments))
+        end = n_full * n_vertices
+        vertices = unit_path.vertices[:end]
+        codes = unit_path.codes[:end]
+
+        if n_full < n_segments and val > n_full * seg_width:
+            # cut the partially reached segment at the value
+            partial = unit_path.vertices[end : end + n_vertices].copy()
+            partial[:, 0] = np.minimum(partial[:, 0], val)
+            vertices = np.concatenate([vertices, partial])
+            codes = unit_path.codes[: end + n_vertices]
+
+        paths.append(Path(_to_area(vertices, area), codes))
+
+    n = len(bg_paths)
+
+    return PathCollection(
+        bg_paths + paths + bg_paths,
+        facecolors=[background_color] * n + colors + ["none"] * n,
+        edgecolors=["none"] * 2 * n + [edgecolor] * n,
+        linewidths=[0] * 2 * n + [linewidth] * n,
+        **_rect_kw,
+    )
+
+
+def percentile_bars_column(
+    ax: matplotlib.axes.Axes,
+    values: np.ndarray,
+    bounds: np.ndarray,
+    color: str = None,
+    background_color: str = None,
+    cmap: matplotlib.colors.Colormap = None,
+    is_pct=False,
+    rect_kw: Dict[str, Any] = {},
+) -> List[matplotlib.collections.PathCollection]:
+    """Plots percentile bars in each cell of a column on the tables axes.
+    See plottable.plots.percentile_bars for the arguments.
+
+    Returns:
+        List[matplotlib.collections.PathCollection]:
+            a single collection of the background, the bars and their edges
+    """
+    bars = _make_percentile_bars(
+        ax,
+        values,
+        _get_plot_areas(bounds),
+        color=color,
+        background_color=background_color,
+        cmap=cmap,
+        is_pct=is_pct,
+        rect_kw=rect_kw,
+    )
+    bars.set_zorder(2.1)
+    ax.add_collection(bars, autolim=False)
+
+    return [bars]
+
+
+_MARKER_PATHS = BoundedCache(maxsize=256)
+
+# partially filled stars are rounded to 1 / _N_FILL_BUCKETS of a star
+_N_FILL_BUCKETS = 20
+
+
+def _get_marker_path(marker: str, fill: float = 1) -> Path:
+    """Gets the path of a scatter marker that is filled from the left up to a fraction
+    of its width. The paths are cut geometrically instead of clipped when they are
+    drawn and cached per marker and fill bucket.
+
+    Args:
+        marker (str): a matplotlib marker, ie. "*"
+        fill (float, optional): the filled fraction of the markers width. Defaults to 1.
+
+    Returns:
+        Path: the markers path in the units scatter scales by its sizes
+    """
+    bucket = int(round(np.clip(fill, 0, 1) * _N_FILL_BUCKETS))
+
+    def _make_path() -> Path:
+        marker_style = MarkerStyle(marker)
+        path = marker_style.get_path().transformed(marker_style.get_transform())
+        if bucket == _N_FILL_BUCKETS:
+            return path
+
+        xmin, ymin = path.vertices.min(axis=0)
+        xmax, ymax = path.vertices.max(axis=0)
+        x_cut = xmin + bucket / _N_FILL_BUCKETS * (xmax - xmin)
+        return path.clip_to_bbox(Bbox([[xmin - 1, ymin - 1], [x_cut, ymax + 1]]))
+
+    return _MARKER_PATHS.memoize((marker, bucket), _make_path)
+
+
+def percentile_stars_column(
+    ax: matplotlib.axes.Axes,
+    values: np.ndarray,
+    bounds: np.ndarray,
+    n_stars: int = 5,
+    color: str = "orange",
+    background_color: str = None,
+    is_pct: bool = False,
+    padding: float = 0.1,
+    **kwargs,
+) -> List[matplotlib.collections.PathCollection]:
+    """Plots percentile stars in each cell of a column on the tables axes.
+    See plottable.plots.percentile_stars for the arguments.
+
+    All stars are drawn with one background and one foreground collection. A partially
+    reached star is filled by the fraction of its share of the value range that is
+    reached, in steps of 5%.
+
+    Returns:
+        List[matplotlib.collections.PathCollection]:
+            the background and the foreground stars
+    """
+    if background_color is None:
+        background_color = ax.get_facecolor()
+
+    values = np.nan_to_num(_scale_values(values, is_pct))
+
+    if "s" not in kwargs:
+        kwargs["s"] = 200
+
+    areas = _get_plot_areas(bounds)
+    star_bounds = np.linspace(0, 1, n_stars + 1)
+    # percentile_stars pads the axes limits of the inset
+    star_u = ((star_bounds[:-1] + star_bounds[1:]) / 2 + padding) / (1 + 2 * padding)
+    star_u = np.broadcast_to(star_u, (len(values), n_stars))
+    xs, ys = _to_table_coords(areas, star_u, np.full(star_u.shape, 0.5))
+
+    bg_stars = ax.scatter(
+        x=xs.ravel(),
+        y=ys.ravel(),
+        color=background_color,
+        marker="*",
+        zorder=2.1,
+        alpha=1,
+        **kwargs,
+    )
+
+    # the filled fraction of each star
+    fills = np.clip(
+        (values[:, np.newaxis] - star_bounds[np.newaxis, :-1]) * n_stars, 0, 1
+    )
+    is_filled = fills > 0.5 / _N_FILL_BUCKETS
+
+    stars = ax.scatter(
+        x=xs[is_filled], y=ys[is_filled], color=color, marker="*", zorder=2.2, **kwargs
+    )
+    stars.set_paths([_get_marker_path("*", fill) for fill in fills[is_filled]])
+
+    return [bg_stars, stars]
+
+
+class CellMarkerCollection(PathCollection):
+    """A PathCollection of markers that are centered in areas of the tables axes, with
+    a diameter that is a ratio of the smaller side of their area.
+
+    The sizes of the markers are computed from the areas in display coordinates at
+    each draw, so that the markers keep fitting their areas when the figure is resized,
+    laid out again or saved with another dpi.
+
+    Args:
+        ax (matplotlib.axes.Axes): the tables axes
+        paths (Sequence[Path]): marker paths with a radius of 0.5
+        areas (np.ndarray): (N, 4) array of the areas x, y, width and height
+        diameter (float, optional):
+            diameter of the markers as a ratio of the smaller side of their area.
+            Defaults to 1.
+        kwargs are passed to matplotlib.collections.PathCollection.
+    """
+
+    def __init__(
+        self,
+        ax: matplotlib.axes.Axes,
+        paths: Sequence[Path],
+        areas: np.ndarray,
+        diameter: float = 1,
+        **kwargs,
+    ):
+        xs, ys = _to_table_coords(areas, 0.5, 0.5)
+        super().__init__(
+            paths,
+            offsets=np.column_stack([xs, ys]),
+            offset_transform=ax.transData,
+            transform=IdentityTransform(),
+            **kwargs,
+        )
+        self.set_figure(ax.figure)
+        self._areas = np.asarray(areas, dtype=float)
+        self._diameter = diameter
+        self.set_sizes(self.get_diameters() ** 2)
+
+    def get_diameters(self) -> np.ndarray:
+        """Returns the current diameters of the markers in points."""
+        areas = self._areas
+        corners = self.get_offset_transform().transform(
+            np.concatenate([areas[:, :2], areas[:, :2] + areas[:, 2:]])
+        )
+        sides = np.abs(corners[len(areas) :] - corners[: len(areas)])
+        return self._diameter * sides.min(axis=1) * 72 / self.figure.dpi
+
+    def draw(self, renderer) -> None:
+        self.set_sizes(self.get_diameters() ** 2)
+        super().draw(renderer)
+
+
+def progress_donut_column(
+    ax: matplotlib.axes.Axes,
+    values: np.ndarray,
+    bounds: np.ndarray,
+    radius: float = 0.45,
+    color: str = None,
+    background_color: str = None,
+    width: float = 0.05,
+    is_pct: bool = False,
+    textprops: Dict[str, Any] = {},
+    formatter: Callable = None,
+    **kwargs,
+) -> List[matplotlib.artist.Artist]:
+    """Plots a progress donut in each cell of a column on the tables axes.
+    See plottable.plots.progress_donut for the arguments.
+
+    The background wedges and the wedges are a single CellMarkerCollection, so they stay
+    circular on the tables axes and keep their size relative to the cells when the
+    figure is resized. The texts are a single AnnotationCollection.
+
+    Returns:
+        List[matplotlib.artist.Artist]
+    """
+    if color is None:
+        color = "C1"
+
+    values = _scale_values(values, is_pct)
+    n = len(values)
+    areas = _get_plot_areas(bounds)
+
+    # marker paths have a radius of 0.5
+    wedge_width = 0.5 * width / radius
+    paths = [
+        Wedge((0, 0), 0.5, 90, 90 + val * 360, width=wedge_width).get_path()
+        for val in values
+    ]
+    colors = to_rgba_array([color] * n)
+
+    if background_color is not None:
+        # the background wedges are drawn first
+        bg_path = Wedge((0, 0), 0.5, 90, 360 + 90, width=wedge_width).get_path()
+        paths = [bg_path] * n + paths
+        colors = np.concatenate([to_rgba_array([background_color] * n), colors])
+        areas = np.tile(areas, (2, 1))
+
+    # like in an axes inset with an equal aspect, the radius is relative to the
+    # smaller side of the area
+    donut_kw = {
+        "facecolor": colors,
+        "edgecolor": "face",
+        "linewidth": plt.rcParams["lines.linewidth"],
+        "zorder": 2.1,
+    }
+    donut_kw.update(normalize_kwargs(kwargs, PathCollection))
+    donuts = CellMarkerCollection(ax, paths, areas, diameter=2 * radius, **donut_kw)
+    ax.add_collection(donuts, autolim=False)
+
+    xs, ys = _to_table_coords(areas[-n:], 0.5, 0.5)
+    annotations = AnnotationCollection(
+        xs,
+        ys,
+        _format_annotations(formatter, values),
+        ha="center",
+        va="center",
+        **textprops,
+    )
+    ax.add_artist(annotations)
+
+    return [donuts, annotations]
+
+
+# the largest width or height of an image atlas in pixels when images are not downsampled
+_MAX_ATLAS_SIZE = 8192
+
+
+def _get_pixel_scale(ax: matplotlib.axes.Axes) -> np.ndarray:
+    """Gets the pixels per data unit in x and y of the tables axes at the dpi the table
+    is drawn with."""
+    width_px, height_px = _get_axes_pixel_size(ax)
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+    return np.array(
+        [width_px / abs(xlim[1] - xlim[0]), height_px / abs(ylim[1] - ylim[0])]
+    )
+
+
+def _get_atlas_rects(
+    areas: np.ndarray, scale: np.ndarray
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """Gets the pixel rectangles of areas in an atlas that spans all of them, and the
+    shape of the atlas.
+
+    Args:
+        areas (np.ndarray): (N, 4) array of the areas x, y, width and height
+        scale (np.ndarray): pixels per data unit in x and y
+
+    Returns:
+        Tuple[np.ndarray, Tuple[int, int]]:
+            (N, 4) array of the left, top, width and height of each area in pixels and
+            the height and width of the atlas
+    """
+    origin = areas[:, :2].min(axis=0)
+    extent = (areas[:, :2] + areas[:, 2:]).max(axis=0) - origin
+    rects = np.column_stack([areas[:, :2] - origin, areas[:, 2:]]) * np.tile(scale, 2)
+    shape = (
+        max(1, int(np.ceil(extent[1] * scale[1]))),
+        max(1, int(np.ceil(extent[0] * scale[0]))),
+    )
+    return rects, shape
+
+
+def _add_atlas(
+    ax: matplotlib.axes.Axes, atlas: np.ndarray, areas: np.ndarray
+) -> matplotlib.image.AxesImage:
+    """Adds an atlas that spans the areas to the tables axes."""
+    left, top = areas[:, :2].min(axis=0)
+    right, bottom = (areas[:, :2] + areas[:, 2:]).max(axis=0)
+
+    im = AxesImage(ax, origin="upper", zorder=2.1)
+    im.set_data(atlas)
+    im.set_extent((left, right, bottom, top))
+    im.set_clip_on(False)
+    ax.add_image(im)
+    return im
+
+
+def _image_column(
+    ax: matplotlib.axes.Axes,
+    values: np.ndarray,
+    bounds: np.ndarray,
+    mode: str = None,
+    circled: bool = False,
+    downsample: bool = True,
+) -> Tuple[matplotlib.image.AxesImage, np.ndarray]:
+    """Draws the images of a column as a single image atlas on the tables axes.
+
+    The atlas spans the plot areas of the columns cells and has the pixel size they
+    are drawn with, so each image is resized once and shown without resampling.
+
+    Returns:
+        Tuple[matplotlib.image.AxesImage, np.ndarray]:
+            the image and the (N, 4) pixel rectangles of the cells in the atlas
+    """
+    values = list(values)
+    prefetch_images(values, mode=mode)
+
+    areas = _get_plot_areas(bounds)
+    scale = _get_pixel_scale(ax)
+
+    if not downsample:
+        # scale the atlas up until no image is shown smaller than its full size
+        img_sizes = np.array(
+            [
+                (
+                    read_image(path, mode=mode).shape[1::-1]
+                    if isinstance(path, (str, os.PathLike))
+                    else (0, 0)
+                )
+                for path in values
+            ]
+        ).reshape(-1, 2)
+        ratios = img_sizes / np.maximum(areas[:, 2:] * scale, 1)
+        extent = (areas[:, :2] + areas[:, 2:]).max(axis=0) - areas[:, :2].min(axis=0)
+        max_ratio = _MAX_ATLAS_SIZE / (extent * scale).max()
+        scale = scale * np.clip(ratios.max(initial=1), 1, max(1, max_ratio))
+
+    rects, shape = _get_atlas_rects(areas, scale)
+    atlas = make_image_atlas(values, rects, shape, mode=mode, circled=circled)
+
+    return _add_atlas(ax, atlas, areas), rects
+
+
+def image_column(
+    ax: matplotlib.axes.Axes,
+    values: np.ndarray,
+    bounds: np.ndarray,
+    downsample: bool = True,
+) -> List[matplotlib.artist.Artist]:
+    """Plots the image of each cell of a column on the tables axes.
+    See plottable.plots.image for the arguments.
+
+    The images are resized to the cells and packed into a single image atlas, that is
+    drawn as one image. Each distinct image is decoded and resized once.
+
+    Returns:
+        List[matplotlib.artist.Artist]
+    """
+    im, _ = _image_column(ax, values, bounds, downsample=downsample)
+    return [im]
+
+
+def monochrome_image_column(
+    ax: matplotlib.axes.Axes,
+    values: np.ndarray,
+    bounds: np.ndarray,
+    downsample: bool = True,
+) -> List[matplotlib.artist.Artist]:
+    """Plots the monochrome image of each cell of a column on the tables axes.
+    See plottable.plots.monochrome_image for the arguments.
+
+    The images are drawn as a single image atlas, like in image_column.
+
+    Returns:
+        List[matplotlib.artist.Artist]
+    """
+    im, _ = _image_column(ax, values, bounds, mode="LA", downsample=downsample)
+    return [im]
+
+
+def circled_image_column(
+    ax: matplotlib.axes.Axes,
+    values: np.ndarray,
+    bounds: np.ndarray,
+    downsample: bool = True,
+    **circle_kwargs,
+) -> List[matplotlib.artist.Artist]:
+    """Plots the image of each cell of a column cropped to a circle on the tables axes.
+    See plottable.plots.circled_image for the arguments.
+
+    The images are drawn as a single image atlas, like in image_column, and cropped by
+    masking the pixels outside of the circle in the atlas instead of by clip paths.
+    If the circles are visible, their outlines are a single collection of markers.
+
+    Returns:
+        List[matplotlib.artist.Artist]
+    """
+    circle_kw = {
+        "visible": False,
+        "linewidth": 1,
+    }
+    circle_kw.update(normalize_kwargs(circle_kwargs, Patch))
+
+    values = list(values)
+    im, rects = _image_column(ax, values, bounds, circled=True, downsample=downsample)
+
+    if not circle_kw["visible"]:
+        return [im]
+
+    # the circles have the diameter of the smaller side of the fitted images
+    diameters = []
+    for path, (_, _, width, height) in zip(values, rects):
+        if not isinstance(path, (str, os.PathLike)):
+            diameters.append(0)
+            continue
+        img_height, img_width = read_image(path).shape[:2]
+        scale = min(width / img_width, height / img_height)
+        diameters.append(min(img_width, img_height) * scale)
+
+    left, right, _, _ = im.get_extent()
+    points_per_pixel = (
+        (
+            ax.transData.transform([[right, 0]])[0, 0]
+            - ax.transData.transform([[left, 0]])[0, 0]
+        )
+        / im.get_array().shape[1]
+        * 72
+        / ax.figure.dpi
+    )
+
+    xs, ys = _to_table_coords(_get_plot_areas(bounds), 0.5, 0.5)
+    circles = ax.scatter(
+        xs,
+        ys,
+        s=(np.array(diameters) * points_per_pixel) ** 2,
+        marker="o",
+        facecolors="none",
+        edgecolors=circle_kw.get("edgecolor", plt.rcParams["patch.edgecolor"]),
+        linewidths=circle_kw["linewidth"],
+        linestyles=circle_kw.get("linestyle", "solid"),
+        alpha=circle_kw.get("alpha"),
+        zorder=2.2,
+    )
+
+    return [im, circles]
+
+
+# glyphs rendered by glyph_column, keyed by plot_fn, value, plot_kw, size and dpi
+glyph_cache = BoundedCache(maxsize=512)
+
+# glyphs are rendered with a margin around their axes as a ratio of the axes height,
+# so that what a plot_fn draws just outside of its axes, ie. marker edges, is kept
+_GLYPH_MARGIN = 0.25
+
+
+def _freeze(obj: Any) -> Any:
+    """Converts (nested) mappings to frozensets so that they can be hashed."""
+    if isinstance(obj, Mapping):
+        return frozenset((key, _freeze(value)) for key, value in obj.items())
+    return obj
+
+
+def get_glyph_key(
+    plot_fn: Callable, value: Any, plot_kw: Dict[str, Any] = {}
+) -> Tuple | None:
+    """Gets the key of the glyph that plot_fn draws for value.
+
+    Args:
+        plot_fn (Callable): a plot function
+        value (Any): the value plotted
+        plot_kw (Dict[str, Any], optional): keywords of the plot function. Defaults to {}.
+
+    Returns:
+        Tuple | None:
+            the key, or None if value or plot_kw are not hashable or value is NaN.
+            The key holds the type of value, so that 1, 1.0 and True get distinct keys.
+    """
+    # NaN is unequal to itself, so its glyph would never be found in a cache
+    if isinstance(value, (float, np.floating)) and np.isnan(value):
+        return None
+
+    try:
+        key = (plot_fn, type(value), value, _freeze(plot_kw))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def render_glyph(
+    plot_fn: Callable,
+    value: Any,
+    size: Tuple[int, int],
+    dpi: float,
+    plot_kw: Dict[str, Any] = {},
+    margin: int = 0,
+) -> np.ndarray:
+    """Renders what plot_fn draws for value on an axes of size pixels to an offscreen
+    RGBA buffer.
+
+    Args:
+        plot_fn (Callable): a plot function
+        value (Any): the value plotted
+        size (Tuple[int, int]): width and height of the buffer in pixels
+        dpi (float): dots per inch
+        plot_kw (Dict[str, Any], optional): keywords of the plot function. Defaults to {}.
+        margin (int, optional):
+            pixels between the axes and the edges of the buffer. Defaults to 0.
+
+    Returns:
+        np.ndarray: (height, width, 4) uint8 RGBA array
+    """
+    width, height = size
+    fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    fig.patch.set_alpha(0)
+    ax = fig.add_axes(
+        [
+            margin / width,
+            margin / height,
+            max(width - 2 * margin, 1) / width,
+            max(height - 2 * margin, 1) / height,
+        ]
+    )
+    ax.axis("off")
+    plot_fn(ax, value, **plot_kw)
+    canvas.draw()
+
+    glyph = np.array(canvas.buffer_rgba())
+    glyph.setflags(write=False)
+    return glyph
+
+
+def glyph_column(
+    ax: matplotlib.axes.Axes,
+    values: np.ndarray,
+    bounds: np.ndarray,
+    plot_fn: Callable,
+    cache: BoundedCache = None,
+    **plot_kw,
+) -> List[matplotlib.artist.Artist]:
+    """Plots any plot function in each cell of a column on the tables axes, by rendering
+    it offscreen once per distinct value and stamping the glyph into every cell with
+    that value.
+
+    The glyphs are rendered at the pixel size of the cells axes insets at the larger of
+    the figures dpi and the dpi figures are saved with, and drawn as a single image
+    atlas. Anything plot_fn draws further than a quarter of the insets height outside
+    of it is cut off, and vector output contains the glyphs as images.
+
+    Args:
+        ax (matplotlib.axes.Axes): the tables axes
+        values (np.ndarray): the values of the column
+        bounds (np.ndarray): (N, 4) array of the cells x, y, width and height
+        plot_fn (Callable): the plot function, ie. plottable.plots.percentile_stars
+        cache (BoundedCache, optional):
+            the cache of rendered glyphs. Defaults to None, which uses
+            plottable.plots.glyph_cache. Values are rendered without caching if they
+            or plot_kw are not hashable.
+
+    Returns:
+        List[matplotlib.artist.Artist]
+    """
+    if cache is None:
+        cache = glyph_cache
+
+    if plot_fn in _IMAGE_PLOT_MODES:
+        prefetch_images(values, mode=_IMAGE_PLOT_MODES[plot_fn])
+
+    scale = _get_pixel_scale(ax)
+    areas = _get_plot_areas(bounds)
+    margins = np.round(areas[:, 3] * scale[1] * _GLYPH_MARGIN)
+    areas = areas + np.column_stack(
+        [
+            -margins / scale[0],
+            -margins / scale[1],
+            2 * margins / scale[0],
+            2 * margins / scale[1],
+        ]
+    )
+    rects, shape = _get_atlas_rects(areas, scale)
+    dpi = _get_render_dpi(ax.figure)
+    atlas = np.zeros(shape + (4,), dtype=np.uint8)
+
+    for value, (left, top, width, height), margin in zip(values, rects, margins):
+        x0, y0 = int(round(left)), int(round(top))
+        size = (max(1, int(round(width))), max(1, int(round(height))))
+        margin = int(margin)
+
+        render = partial(render_glyph, plot_fn, value, size, dpi, plot_kw, margin)
+        key = get_glyph_key(plot_fn, value, plot_kw)
+        if key is None:
+            glyph = render()
+        else:
+            glyph = cache.memoize(key + (size, dpi, margin), render)
+
+        x1, y1 = min(x0 + size[0], shape[1]), min(y0 + size[1], shape[0])
+        atlas[y0:y1, x0:x1] = glyph[: y1 - y0, : x1 - x0]
+
+    return [_add_atlas(ax, atlas, areas)]
+
+
+# the PIL mode the image plots read their images with, see plottable.images.read_image
+_IMAGE_PLOT_MODES = {
+    image: None,
+    circled_image: None,
+    monochrome_image: "LA",
+}
+
+_COLUMN_RENDERERS = {
+    image: image_column,
+    monochrome_image: monochrome_image_column,
+    circled_image: circled_image_column,
+    bar: bar_column,
+    percentile_bars: percentile_bars_column,
+    percentile_stars: percentile_stars_column,
+    progress_donut: progress_donut_column,
+}
+
+
+def get_column_renderer(plot_fn: Callable) -> Callable | None:
+    """Gets the column renderer of a builtin plot function.
+
+    Args:
+        plot_fn (Callable): a plot function, ie. plottable.plots.bar
+
+    Returns:
+        Callable | None:
+            the function that plots plot_fn for a whole column on the tables axes,
+            or None if plot_fn has no column renderer.
+    """
+    return _COLUMN_RENDERERS.get(plot_fn)
@@ -2,18 +2,74 @@
 
 from __future__ import annotations
 
+from functools import partial
+from itertools import repeat
 from numbers import Number
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-
-from .cell import Column, Row, SubplotCell, TextCell, create_cell
+from matplotlib.cbook import normalize_kwargs
+from matplotlib.collections import LineCollection
+from matplotlib.patches import Patch
+
+from .cache import BoundedCache
+from .cell import (
+    Column,
+    InsetAxesPool,
+    RectangleCollection,
+    Row,
+    Sequence,
+    SubplotCell,
+    TableCell,
+    TextCell,
+    create_cell,
+    get_axes_inset_bounds,
+)
+from .cmap import apply_cmap
 from .column_def import ColumnDefinition, ColumnType
 from .font import contrasting_font_color
-from .formatters import apply_formatter
+from .formatters import format_values
+from .grid import TableGrid
 from .helpers import _replace_lw_key
+from .images import prefetch_images
+from .plots import (
+    _IMAGE_PLOT_MODES,
+    get_column_renderer,
+    get_glyph_key,
+    glyph_column,
+)
+
+
+def _get_changed(old: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """Compares two arrays of values elementwise. Missing values are equal to each other.
+    Values of different types, like 1 and 1.0, differ since they can be formatted
+    differently.
+
+    Args:
+        old (np.ndarray): the old values
+        new (np.ndarray): the new values
+
+    Returns:
+        np.ndarray: boolean array that is True where the values differ
+    """
+    if old.dtype != new.dtype:
+        return np.ones(len(new), dtype=bool)
+
+    same_type = np.ones(len(new), dtype=bool)
+    if new.dtype == object:
+        same_type[:] = [type(a) is type(b) for a, b in zip(old, new)]
+
+    old, new = pd.Series(old, dtype=object), pd.Series(new, dtype=object)
+    try:
+        equal = (old == new).to_numpy(dtype=bool)
+    except (TypeError, ValueError):
+        # values like arrays can't be compared with ==
+        equal = np.array([np.array_equal(a, b) for a, b in zip(old, new)], dtype=bool)
+    both_missing = (old.isna() & new.isna()).to_numpy()
+    return ~((equal & same_type) | both_missing)
 
 
 class Table:
@@ -49,13 +105,41 @@ class Table:
         row_dividers (bool, optional):
             Whether to plot divider lines between rows. Defaults to True.
         row_divider_kw (Dict[str, Any], optional):
-            row_divider_kw are passed to plt.plot. Defaults to {}.
+            row_divider_kw are passed to the row dividers
+            matplotlib.collections.LineCollection. Defaults to {}.
         column_border_kw (Dict[str, Any], optional):
-            column_border_kw are passed to plt.plot. Defaults to {}.
+            column_border_kw are passed to the column borders
+            matplotlib.collections.LineCollection. Defaults to {}.
         even_row_color (str | Tuple, optional):
             facecolor of the even row cell's patches. Top Row has an even (0) index.
         odd_row_color (str | Tuple, optional):
             facecolor of the even row cell's patches. Top Row has an even (0) index.
+        use_cell_collection (bool, optional):
+            Whether to draw the rectangles of all body cells as a single
+            plottable.cell.RectangleCollection instead of one
+            matplotlib.patches.Rectangle per cell. This is much faster for large tables.
+            Defaults to False.
+        column_cache_size (int, optional):
+            Formatted texts, cmap colors and font colors are computed once per distinct
+            value of a column and memoized. column_cache_size is the maximum number of
+            values memoized per column and computation. Defaults to 1024.
+        use_column_renderers (bool, optional):
+            Whether to plot columns with a builtin plot_fn of plottable.plots (bar,
+            percentile_bars, percentile_stars, progress_donut and the image plots)
+            directly on the tables axes, with a few collections or a single image
+            atlas per column instead of an axes inset per cell. Their artists are
+            stored in Table.column_artists. Defaults to False.
+        use_glyph_cache (bool, optional):
+            Whether to render the plot_fn of the other plot columns offscreen once per
+            distinct value and plot_kw, and stamp the rendered glyphs into the cells as
+            one image per column (see plottable.plots.glyph_column), instead of
+            plotting on an axes inset per cell. Columns with a plot_kw that is not
+            hashable still use axes insets. Defaults to False.
+        axes_pool (InsetAxesPool, optional):
+            A pool of axes insets to plot the SubplotCells on. When a table is rebuilt
+            on the same figure with the same pool, the axes insets of the previous table
+            are reset and reused instead of created again, and the ones that are left
+            over are removed. Defaults to None, which creates new axes insets.
 
     Examples
     --------
@@ -93,8 +177,14 @@ class Table:
         column_border_kw: Dict[str, Any] = {},
         even_row_color: str | Tuple = None,
         odd_row_color: str | Tuple = None,
+        use_cell_collection: bool = False,
+        column_cache_size: int = 1024,
+        use_column_renderers: bool = False,
+        use_glyph_cache: bool = False,
+        axes_pool: InsetAxesPool = None,
     ):
 
+        self.index_col = index_col
         if index_col is not None:
             if index_col in df.columns:
                 df = df.set_index(index_col)
@@ -102,8 +192,8 @@ class Table:
                 raise KeyError(
                     f"The index_col `{index_col}` you provided does not exist."
                 )
-            self.index_col = index_col
 
+        self._columns = columns
         if columns is not None:
             self.df = df[columns]
         else:
@@ -127,13 +217,21 @@ class Table:
         if "ha" not in textprops:
             self.textprops.update({"ha": "right"})
 
+        self.column_cache_size = column_cache_size
+        self.use_column_renderers = use_column_renderers
+        self.use_glyph_cache = use_glyph_cache
+        self.axes_pool = axes_pool
+        self.column_caches = {}
+
         self.cells = {}
+        self._fontcolor_settings = None
+        self._init_column_layout()
+        self._init_cell_collection(use_cell_collection)
         self._init_columns()
         self._init_rows()
         self.ax.axis("off")
 
         self.set_alternating_row_colors(even_row_color, odd_row_color)
-        self._apply_column_formatters()
         self._apply_column_cmaps()
         self._apply_column_text_cmaps()
 
@@ -145,11 +243,12 @@ class Table:
             self._plot_col_label_divider(**col_label_divider_kw)
         if footer_divider:
             self._plot_footer_divider(**footer_divider_kw)
+        self.row_divider_collection = None
         if row_dividers:
             self._plot_row_dividers(**row_divider_kw)
         self._plot_column_borders(**column_border_kw)
 
-        self.ax.set_xlim(-0.025, sum(self._get_column_widths()) + 0.025)
+        self.ax.set_xlim(-0.025, self.grid.get_xrange()[1] + 0.025)
         if self.col_group_cells:
             miny = -2
         else:
@@ -158,12 +257,14 @@ class Table:
         self.ax.set_ylim(miny - 0.025, ymax + 0.05)
         self.ax.invert_yaxis()
 
+        self._plot_columns()
         self._make_subplots()
 
     def _init_column_definitions(
         self, column_definitions: List[ColumnDefinition]
     ) -> None:
-        """Initializes the Tables ColumnDefinitions.
+        """Initializes the Tables ColumnDefinitions as read-only mappings of their
+        attributes, that are shared with the ColumnDefinition objects.
 
         Args:
             column_definitions (List[ColumnDefinition]):
@@ -171,15 +272,13 @@ class Table:
         """
         if column_definitions is not None:
             self.column_definitions = {
-                _def.name: _def._as_non_none_dict() for _def in column_definitions
+                _def.name: _def._resolve() for _def in column_definitions
             }
         else:
             self.column_definitions = {}
         for col in self.column_names:
             if col not in self.column_definitions:
-                self.column_definitions[col] = ColumnDefinition(
-                    name=col
-                )._as_non_none_dict()
+                self.column_definitions[col] = ColumnDefinition(name=col)._resolve()
 
     def _get_column_titles(self) -> List[str]:
         """Returns a List of Column Titles.
@@ -216,10 +315,12 @@ class Table:
         )
 
     def _plot_col_group_labels(self) -> None:
-        """Plots the column group labels."""
+        """Plots the column group labels. The lines below the group labels are plotted
+        as a single LineCollection, that is stored as col_group_line_collection."""
         col_groups = self._get_col_groups()
 
         self.col_group_cells = {}
+        segments = []
 
         for group in col_groups:
             columns = [
@@ -247,12 +348,28 @@ class Table:
                 textprops=textprops,
             )
             self.col_group_cells[group].draw()
-            self.ax.plot(
-                [x_min + 0.05 * dx, x_max - 0.05 * dx],
-                [y, y],
-                lw=0.2,
-                color=plt.rcParams["text.color"],
-            )
+            segments.append([(x_min + 0.05 * dx, y), (x_max - 0.05 * dx, y)])
+
+        self.col_group_line_collection = self._add_line_collection(
+            segments, linewidth=0.2, color=plt.rcParams["text.color"]
+        )
+
+    def _add_line_collection(self, segments: List, **kwargs) -> LineCollection:
+        """Adds a LineCollection of all segments to the table axes.
+
+        Args:
+            segments (List):
+                list of line segments, each a list of (x, y) points.
+            kwargs are passed to matplotlib.collections.LineCollection.
+
+        Returns:
+            LineCollection: the added LineCollection
+        """
+        # match the capstyle of the lines plt.plot would create
+        kwargs.setdefault("capstyle", plt.rcParams["lines.solid_capstyle"])
+        collection = LineCollection(segments, **kwargs)
+        self.ax.add_collection(collection, autolim=False)
+        return collection
 
     def _plot_col_label_divider(self, **kwargs):
         """Plots a line below the column labels."""
@@ -282,7 +399,8 @@ class Table:
         self.ax.plot([x0, x1], [y, y], **FOOTER_DIVIDER_KW)
 
     def _plot_row_dividers(self, **kwargs):
-        """Plots lines between all TableRows."""
+        """Plots lines between all TableRows as a single LineCollection, that is stored
+        as row_divider_collection."""
         ROW_DIVIDER_KW = {
             "color": plt.rcParams["text.color"],
             "linewidth": 0.2,
@@ -290,18 +408,24 @@ class Table:
         kwargs = _replace_lw_key(kwargs)
         ROW_DIVIDER_KW.update(kwargs)
 
+        segments = []
         for idx, row in list(self.rows.items())[1:]:
             x0, x1 = row.get_xrange()
+            segments.append([(x0, idx), (x1, idx)])
 
-            self.ax.plot([x0, x1], [idx, idx], **ROW_DIVIDER_KW)
+        self.row_divider_collection = self._add_line_collection(
+            segments, **ROW_DIVIDER_KW
+        )
 
     def _plot_column_borders(self, **kwargs):
-        """Plots lines between all TableColumns where "border" is defined."""
+        """Plots lines between all TableColumns where "border" is defined as a single
+        LineCollection, that is stored as column_border_collection."""
         COLUMN_BORDER_KW = {"linewidth": 1, "color": plt.rcParams["text.color"]}
 
         kwargs = _replace_lw_key(kwargs)
         COLUMN_BORDER_KW.update(kwargs)
 
+        segments = []
         for name, _def in self.column_definitions.items():
             if "border" in _def:
                 col = self.columns[name]
@@ -310,26 +434,142 @@ class Table:
 
                 if "l" in _def["border"].lower() or _def["border"].lower() == "both":
                     x = col.get_xrange()[0]
-                    self.ax.plot([x, x], [y0, y1], **COLUMN_BORDER_KW)
+                    segments.append([(x, y0), (x, y1)])
 
                 if "r" in _def["border"].lower() or _def["border"].lower() == "both":
                     x = col.get_xrange()[1]
-                    self.ax.plot([x, x], [y0, y1], **COLUMN_BORDER_KW)
+                    segments.append([(x, y0), (x, y1)])
+
+        self.column_border_collection = self._add_line_collection(
+            segments, **COLUMN_BORDER_KW
+        )
+
+    def _init_cell_collection(self, use_cell_collection: bool) -> None:
+        """Initializes the RectangleCollection that draws the body cells rectangles.
+
+        Args:
+            use_cell_collection (bool):
+                whether to use a RectangleCollection. If False, cell_collection is None.
+        """
+        if not use_cell_collection:
+            self.cell_collection = None
+            return
+
+        # per cell keywords are set on each rectangle, the others on the collection
+        collection_kw = {
+            k: v
+            for k, v in normalize_kwargs(self.cell_kw, Patch).items()
+            if k not in RectangleCollection.CELL_KEYS
+        }
+        self.cell_collection = RectangleCollection(**collection_kw)
+        self.cell_collection.reserve(self.grid.n_cells)
+        self.ax.add_collection(self.cell_collection, autolim=False)
 
     def _init_columns(self):
         """Initializes the Tables columns."""
         self.columns = {}
         for idx, name in enumerate(self.column_names):
-            self.columns[name] = Column(index=idx, cells=[], name=name)
+            self.columns[name] = Column(index=idx, cells=[], name=name, grid=self.grid)
+
+    def _init_column_layout(self) -> None:
+        """Initializes the TableGrid that holds the geometry of the body cells and
+        resolves the cell settings of each column once as one of the grids styles, so
+        that they don't need to be looked up again for each row."""
+        self.grid = TableGrid(self._get_column_widths(), [1] * self.n_rows)
+
+        for col_idx, colname in enumerate(self.column_names):
+            style_id = self.grid.add_style(
+                self._get_column_cell_kw(self.column_definitions[colname])
+            )
+            self.grid.style_ids[:, col_idx] = style_id
+
+    def _get_column_cell_kw(self, col_def: Dict[str, Any]) -> Dict[str, Any]:
+        """Gets the keywords that are passed to create_cell for each cell of a column.
+
+        Args:
+            col_def (Dict[str, Any]): the columns ColumnDefinition
+
+        Returns:
+            Dict[str, Any]: keywords for create_cell
+        """
+        # the style dicts are resolved once and shared by all cells of the column
+        rect_kw = TableCell.resolve_rect_kw(
+            self.ax, col_def.get("width", 1), 1, self.cell_kw
+        )
+
+        if "plot_fn" in col_def or "column_plot_fn" in col_def:
+            return {
+                "column_type": ColumnType.SUBPLOT,
+                "rect_kw": rect_kw,
+                "plot_fn": col_def.get("plot_fn"),
+                "plot_kw": col_def.get("plot_kw", {}),
+            }
+
+        return {
+            "column_type": ColumnType.STRING,
+            "rect_kw": rect_kw,
+            "textprops": TextCell.resolve_textprops(
+                self._get_column_textprops(col_def)
+            ),
+        }
+
+    def _get_column_values(self) -> List[np.ndarray]:
+        """Gets the values of the index and of each column of the DataFrame as arrays,
+        without copying the DataFrame into records.
+
+        Returns:
+            List[np.ndarray]: arrays of the index and column values
+        """
+        return [self.df.index.to_numpy()] + [
+            self.df.iloc[:, col_idx].to_numpy() for col_idx in range(self.n_cols)
+        ]
 
     def _init_rows(self):
         """Initializes the Tables Rows."""
         self.rows = {}
-        for idx, values in enumerate(self.df.to_records()):
-            self.rows[idx] = self._get_row(idx, values)
+        column_values = self._get_column_values()
+        formatted_columns = [
+            formatted if formatted is not None else repeat(None)
+            for formatted in self._get_formatted_columns(column_values)
+        ]
+
+        for idx, (content, formatted_content) in enumerate(
+            zip(zip(*column_values), zip(*formatted_columns))
+        ):
+            self.rows[idx] = self._get_row(idx, content, formatted_content)
 
         self.col_label_row = self._get_col_label_row(-1, self._get_column_titles())
 
+    def _get_formatted_columns(
+        self, column_values: List[np.ndarray]
+    ) -> List[List[str] | None]:
+        """Applies the ColumnDefinitions formatters to whole columns at once.
+
+        Args:
+            column_values (List[np.ndarray]): arrays of the index and column values
+
+        Returns:
+            List[List[str] | None]:
+                the formatted strings of each column or None if a column is not formatted
+        """
+        formatted_columns = []
+
+        for colname, values in zip(self.column_names, column_values):
+            col_def = self.column_definitions[colname]
+            formatter = col_def.get("formatter")
+
+            is_plot_column = "plot_fn" in col_def or "column_plot_fn" in col_def
+
+            if formatter is None or is_plot_column:
+                formatted_columns.append(None)
+            else:
+                cache = self._get_column_cache(colname, "formatter")
+                formatted_columns.append(
+                    cache.map(partial(format_values, formatter), values)
+                )
+
+        return formatted_columns
+
     def get_column(self, name: str) -> Column:
         """Gets a Column by its column_name.
 
@@ -396,7 +636,7 @@ class Table:
         Returns:
             Row: Column Label Row
         """
-        widths = self._get_column_widths()
+        widths = self.grid.column_widths
 
         if "height" in self.col_label_cell_kw:
             height = self.col_label_cell_kw["height"]
@@ -447,13 +687,114 @@ class Table:
             if isinstance(cell, SubplotCell)
         }
 
+    def _get_column_renderer(self, colname: str) -> Callable | None:
+        """Gets the function that plots a whole column on the tables axes.
+
+        Args:
+            colname (str): column name
+
+        Returns:
+            Callable | None:
+                the columns column_plot_fn, or the column renderer of its plot_fn if
+                use_column_renderers is True, or a glyph_column of its plot_fn if
+                use_glyph_cache is True. None if the column has neither.
+        """
+        col_def = self.column_definitions[colname]
+        if "column_plot_fn" in col_def:
+            return col_def["column_plot_fn"]
+
+        plot_fn = col_def.get("plot_fn")
+        if plot_fn is None:
+            return None
+
+        renderer = None
+        if self.use_column_renderers:
+            renderer = get_column_renderer(plot_fn)
+
+        plot_kw = col_def.get("plot_kw", {})
+        if (
+            renderer is None
+            and self.use_glyph_cache
+            and get_glyph_key(plot_fn, None, plot_kw) is not None
+        ):
+            renderer = partial(glyph_column, plot_fn=plot_fn)
+
+        return renderer
+
+    def _plot_columns(self) -> None:
+        """Plots the columns that have a column_plot_fn or a column renderer on the
+        tables axes."""
+        self.column_artists = {}
+        column_values = None
+        bounds = self.grid.get_bounds()
+
+        for col_idx, colname in enumerate(self.column_names):
+            renderer = self._get_column_renderer(colname)
+            if renderer is None:
+                continue
+
+            if column_values is None:
+                column_values = self._get_column_values()
+
+            plot_kw = self.column_definitions[colname].get("plot_kw", {})
+            self.column_artists[colname] = renderer(
+                self.ax, column_values[col_idx], bounds[:, col_idx], **plot_kw
+            )
+
+    def _replot_column(self, colname: str, values: np.ndarray) -> None:
+        """Removes the artists of a column that is plotted on the tables axes and plots
+        it again with values."""
+        for artist in self.column_artists[colname]:
+            artist.remove()
+
+        col_idx = self.column_name_to_idx[colname]
+        plot_kw = self.column_definitions[colname].get("plot_kw", {})
+        self.column_artists[colname] = self._get_column_renderer(colname)(
+            self.ax, values, self.grid.get_bounds()[:, col_idx], **plot_kw
+        )
+
+    def _prefetch_images(self) -> None:
+        """Decodes the images of all columns that plot an image in a thread pool, before
+        they are plotted cell by cell."""
+        column_values = None
+
+        for col_idx, colname in enumerate(self.column_names):
+            plot_fn = self.column_definitions[colname].get("plot_fn")
+            if plot_fn not in _IMAGE_PLOT_MODES or colname in self.column_artists:
+                continue
+
+            if column_values is None:
+                column_values = self._get_column_values()
+
+            prefetch_images(column_values[col_idx], mode=_IMAGE_PLOT_MODES[plot_fn])
+
     def _make_subplots(self) -> None:
+        self._prefetch_images()
         self.subplots = {}
-        for key, cell in self._get_subplot_cells().items():
-            self.subplots[key] = cell.make_axes_inset()
-            self.subplots[key].axis("off")
-            cell.draw()
-            cell.plot()
+        subplot_cells = {
+            key: cell
+            for key, cell in self._get_subplot_cells().items()
+            if self.column_names[key[1]] not in self.column_artists
+        }
+        if self.axes_pool is not None:
+            if self.axes_pool.fig is not self.figure:
+                raise ValueError(
+                    "The axes_pool belongs to a different figure than the Table."
+                )
+            self.axes_pool.release()
+
+        if subplot_cells:
+            # the axes inset rectangles of all cells are transformed at once
+            rows, cols = np.array(list(subplot_cells.keys())).T
+            rects = get_axes_inset_bounds(self.ax, self.grid.get_bounds()[rows, cols])
+
+            for (key, cell), rect in zip(subplot_cells.items(), rects):
+                self.subplots[key] = cell.make_axes_inset(rect, pool=self.axes_pool)
+                self.subplots[key].axis("off")
+                cell.plot()
+
+        if self.axes_pool is not None:
+            self.axes_pool.trim()
 
     def _get_column_textprops(self, col_def: ColumnDefinition) -> Dict[str, Any]:
         textprops = self.textprops.copy()
@@ -463,101 +804,185 @@ class Table:
 
         return textprops
 
-    def _get_row(self, idx: int, content: List[str | Number]) -> Row:
-        widths = self._get_column_widths()
-
-        x = 0
-
-        row = Row(cells=[], index=idx)
-
-        for col_idx, (colname, width, _content) in enumerate(
-            zip(self.column_names, widths, content)
+    def _get_row(
+        self,
+        idx: int,
+        content: List[str | Number],
+        formatted_content: List[str | None] = None,
+    ) -> Row:
+        if formatted_content is None:
+            formatted_content = [None] * len(self.column_names)
+
+        row = Row(cells=[], index=idx, grid=self.grid)
+
+        for col_idx, (colname, cell_kw, _content, _formatted) in enumerate(
+            zip(
+                self.column_names,
+                self.grid.get_row_styles(idx),
+                content,
+                formatted_content,
+            )
         ):
-            col_def = self.column_definitions[colname]
-
-            if "plot_fn" in col_def:
-                plot_fn = col_def.get("plot_fn")
-                plot_kw = col_def.get("plot_kw", {})
-
-                cell = create_cell(
-                    column_type=ColumnType.SUBPLOT,
-                    xy=(x, idx),
-                    content=_content,
-                    plot_fn=plot_fn,
-                    plot_kw=plot_kw,
-                    row_idx=idx,
-                    col_idx=col_idx,
-                    width=width,
-                    rect_kw=self.cell_kw,
-                    ax=self.ax,
-                )
+            x, y, width, height = self.grid.get_cell_bounds(idx, col_idx)
 
+            # SubplotCells plot their content and take no formatted text
+            if cell_kw["column_type"] is ColumnType.SUBPLOT:
+                text_kw = {}
             else:
-                textprops = self._get_column_textprops(col_def)
-
-                cell = create_cell(
-                    column_type=ColumnType.STRING,
-                    xy=(x, idx),
-                    content=_content,
-                    row_idx=idx,
-                    col_idx=col_idx,
-                    width=width,
-                    rect_kw=self.cell_kw,
-                    textprops=textprops,
-                    ax=self.ax,
-                )
+                text_kw = {"formatted_content": _formatted}
+
+            cell = create_cell(
+                xy=(x, y),
+                content=_content,
+                row_idx=idx,
+                col_idx=col_idx,
+                width=width,
+                height=height,
+                ax=self.ax,
+                collection=self.cell_collection,
+                grid=self.grid,
+                **cell_kw,
+                **text_kw,
+            )
 
             row.append(cell)
             self.columns[colname].append(cell)
             self.cells[(idx, col_idx)] = cell
             cell.draw()
 
-            x += width
-
         return row
 
-    def _apply_column_formatters(self) -> None:
-        for colname, _dict in self.column_definitions.items():
-            formatter = _dict.get("formatter")
-            if formatter is None:
-                continue
+    def _get_column_cache(self, colname: str, kind: str) -> BoundedCache:
+        """Gets the cache that memoizes a computation per distinct value of a column.
 
-            for cell in self.columns[colname].cells:
-                if not hasattr(cell, "text"):
-                    continue
+        Args:
+            colname (str): the column name
+            kind (str): the computation, ie. "formatter", "cmap" or "fontcolor"
 
-                formatted = apply_formatter(formatter, cell.content)
-                cell.text.set_text(formatted)
+        Returns:
+            BoundedCache: the columns cache
+        """
+        key = (colname, kind)
+        if key not in self.column_caches:
+            self.column_caches[key] = BoundedCache(maxsize=self.column_cache_size)
+        return self.column_caches[key]
+
+    @property
+    def cache_stats(self) -> pd.DataFrame:
+        """The hits, misses and hit rates of the per column caches.
+
+        Returns:
+            pd.DataFrame: DataFrame indexed by column name and computation.
+        """
+        stats = pd.DataFrame(
+            [
+                {
+                    "column": colname,
+                    "kind": kind,
+                    **cache.info()._asdict(),
+                    "hit_rate": cache.hit_rate,
+                }
+                for (colname, kind), cache in self.column_caches.items()
+            ],
+            columns=[
+                "column",
+                "kind",
+                "hits",
+                "misses",
+                "maxsize",
+                "currsize",
+                "hit_rate",
+            ],
+        )
+        return stats.set_index(["column", "kind"])
+
+    def _get_numeric_cells(
+        self, colname: str, cells: Optional[Dict[str, List[TableCell]]] = None
+    ) -> List[TableCell]:
+        """Gets the cells of a column that have numeric content.
+
+        Args:
+            colname (str): the column name
+            cells (Dict[str, List[TableCell]], optional):
+                a subset of cells by column name to choose from. Defaults to None, which
+                chooses from all cells of the column.
 
-    def _apply_column_cmaps(self) -> None:
+        Returns:
+            List[TableCell]: cells with numeric content
+        """
+        if cells is None:
+            column_cells = self.columns[colname].cells
+        else:
+            column_cells = cells.get(colname, [])
+
+        return [cell for cell in column_cells if isinstance(cell.content, Number)]
+
+    def _apply_column_cmaps(
+        self, cells: Optional[Dict[str, List[TableCell]]] = None
+    ) -> None:
+        """Colors the cells of the columns that have a cmap.
+
+        Args:
+            cells (Dict[str, List[TableCell]], optional):
+                the cells to color by column name. Defaults to None, which colors all
+                cells.
+        """
         for colname, _dict in self.column_definitions.items():
             cmap_fn = _dict.get("cmap")
             if cmap_fn is None:
                 continue
 
-            for cell in self.columns[colname].cells:
-                if not isinstance(cell.content, Number):
-                    continue
+            numeric_cells = self._get_numeric_cells(colname, cells)
+            cache = self._get_column_cache(colname, "cmap")
+            colors = cache.map(
+                partial(apply_cmap, cmap_fn), [c.content for c in numeric_cells]
+            )
+
+            rect_cells = []
+            rect_colors = []
 
+            for cell, color in zip(numeric_cells, colors):
                 if ("bbox" in _dict.get("textprops")) & hasattr(cell, "text"):
                     cell.text.set_bbox(
                         {
-                            "color": cmap_fn(cell.content),
+                            "color": tuple(color),
                             **_dict.get("textprops").get("bbox"),
                         }
                     )
                 else:
-                    cell.rectangle_patch.set_facecolor(cmap_fn(cell.content))
+                    rect_cells.append(cell)
+                    rect_colors.append(color)
 
-    def _apply_column_text_cmaps(self) -> None:
+            col_idx = self.column_name_to_idx[colname]
+            Sequence(rect_cells, index=col_idx).set_facecolors(rect_colors)
+
+    def _apply_column_text_cmaps(
+        self, cells: Optional[Dict[str, List[TableCell]]] = None
+    ) -> None:
+        """Colors the texts of the columns that have a text_cmap.
+
+        Args:
+            cells (Dict[str, List[TableCell]], optional):
+                the cells to color by column name. Defaults to None, which colors all
+                cells.
+        """
         for colname, _dict in self.column_definitions.items():
             cmap_fn = _dict.get("text_cmap")
             if cmap_fn is None:
                 continue
 
-            for cell in self.columns[colname].cells:
-                if isinstance(cell.content, Number) & hasattr(cell, "text"):
-                    cell.text.set_color(cmap_fn(cell.content))
+            text_cells = [
+                cell
+                for cell in self._get_numeric_cells(colname, cells)
+                if hasattr(cell, "text")
+            ]
+            cache = self._get_column_cache(colname, "text_cmap")
+            colors = cache.map(
+                partial(apply_cmap, cmap_fn), [c.content for c in text_cells]
+            )
+
+            for cell, color in zip(text_cells, colors):
+                cell.text.set_color(tuple(color))
 
     def autoset_fontcolors(
         self, fn: Callable = None, colnames: List[str] = None, **kwargs
@@ -582,6 +1007,9 @@ class Table:
             if "thresh" not in kwargs:
                 kwargs.update({"thresh": 150})
 
+        # the settings are kept to set the fontcolors of cells changed by Table.update
+        self._fontcolor_settings = (fn, colnames, kwargs)
+
         if colnames is not None:
             cells = []
             for col in colnames:
@@ -590,6 +1018,12 @@ class Table:
         else:
             cells = self.cells.values()
 
+        self._set_fontcolors(cells, fn, **kwargs)
+        return self
+
+    def _set_fontcolors(self, cells: List[TableCell], fn: Callable, **kwargs) -> None:
+        fn_key = (fn, tuple(sorted(kwargs.items())))
+
         for cell in cells:
             if hasattr(cell, "text"):
                 text_bbox = cell.text.get_bbox_patch()
@@ -599,7 +1033,94 @@ class Table:
                 else:
                     bg_color = cell.rectangle_patch.get_facecolor()
 
-                textcolor = fn(bg_color, **kwargs)
+                cache = self._get_column_cache(
+                    self.column_names[cell.col_idx], "fontcolor"
+                )
+                textcolor = cache.memoize(
+                    (fn_key, tuple(bg_color)), lambda: fn(bg_color, **kwargs)
+                )
                 cell.text.set_color(textcolor)
 
-        return self
+    def update(self, df: pd.DataFrame) -> Dict[Tuple[int, int], TableCell]:
+        """Updates the Table in place with the values of a DataFrame that has the same
+        shape, index name and columns.
+
+        Only the cells whose value changed are updated: their texts are formatted and
+        set, their cmap and text_cmap colors are applied and their fontcolors are set
+        again if autoset_fontcolors was used. SubplotCells are plotted again on their
+        axes insets. Columns that are plotted on the tables axes, ie. by a
+        column_plot_fn, are plotted again as a whole if any of their cells changed.
+
+        Args:
+            df (pd.DataFrame): the new DataFrame
+
+        Returns:
+            Dict[Tuple[int, int], TableCell]: the changed cells by (row, column) index
+        """
+        if self.index_col is not None:
+            df = df.set_index(self.index_col)
+        if self._columns is not None:
+            df = df[self._columns]
+        if df.index.name is None:
+            df = df.rename_axis("index")
+
+        if (
+            df.shape != self.df.shape
+            or df.index.name != self.df.index.name
+            or list(df.columns) != list(self.df.columns)
+        ):
+            raise ValueError(
+                "The DataFrame needs to have the same shape, index name and columns as "
+                "the DataFrame of the Table."
+            )
+
+        old_values = self._get_column_values()
+        self.df = df
+        column_values = self._get_column_values()
+
+        dirty = {}
+        dirty_by_column = {}
+        for col_idx, (colname, old, new) in enumerate(
+            zip(self.column_names, old_values, column_values)
+        ):
+            rows = np.flatnonzero(_get_changed(old, new)).tolist()
+            if len(rows) == 0:
+                continue
+
+            col_def = self.column_definitions[colname]
+            cells = [self.cells[(row, col_idx)] for row in rows]
+            dirty_by_column[colname] = cells
+            dirty.update(zip(((row, col_idx) for row in rows), cells))
+
+            if colname in self.column_artists:
+                for cell, value in zip(cells, new[rows]):
+                    cell.content = value
+                self._replot_column(colname, new)
+            elif isinstance(cells[0], SubplotCell):
+                for cell, value in zip(cells, new[rows]):
+                    cell.set_content(value)
+            else:
+                formatter = col_def.get("formatter")
+                if formatter is None:
+                    formatted = repeat(None)
+                else:
+                    cache = self._get_column_cache(colname, "formatter")
+                    formatted = cache.map(partial(format_values, formatter), new[rows])
+                for cell, value, text in zip(cells, new[rows], formatted):
+                    cell.set_content(value, text)
+
+        if not dirty:
+            return dirty
+
+        self._apply_column_cmaps(dirty_by_column)
+        self._apply_column_text_cmaps(dirty_by_column)
+
+        if self._fontcolor_settings is not None:
+            fn, colnames, kwargs = self._fontcolor_settings
+            if colnames is None:
+                colnames = self.column_names
+            cells = [cell for col in colnames for cell in dirty_by_column.get(col, [])]
+            self._set_fontcolors(cells, fn, **kwargs)
+
+        self.ax.stale = True
+        return dirty
@@ -4,7 +4,7 @@ with open("README.md", "r") as f:
     readme = f.read()
 
 INSTALL_REQUIRES = [
-    "matplotlib",
+    "matplotlib>=3.6",
     "numpy",
     "pandas",
     "Pillow",
@@ -47,6 +47,9 @@ setuptools.setup(
     },
     include_package_data=True,
     install_requires=INSTALL_REQUIRES,
+    entry_points={
+        "console_scripts": ["plottable-images=plottable.image_store:main"],
+    },
     extras_require=EXTRAS_REQUIRE,
     classifiers=CLASSIFIERS,
     python_requires=">=3.7",
@@ -0,0 +1,196 @@
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from plottable import ColumnDefinition, Table, plots
+from plottable.animation import (
+    TableAnimation,
+    get_animated_artists,
+    get_changed_artists,
+    get_frame_df,
+)
+
+
+@pytest.fixture
+def named_df(df) -> pd.DataFrame:
+    df = df.round(2)
+    df.insert(0, "name", list("vwxyz"))
+    return df
+
+
+def make_table(df: pd.DataFrame, **kwargs) -> Table:
+    fig, ax = plt.subplots(figsize=(5, 3))
+    return Table(df, ax=ax, **kwargs)
+
+
+def draw_frames(anim: TableAnimation) -> list:
+    # the first draw of the figure starts the animation
+    anim.table.figure.canvas.draw()
+    changed = []
+    while anim._step():
+        changed.append(set(anim.changed_cells))
+    return changed
+
+
+def get_pixels(fig: mpl.figure.Figure) -> np.ndarray:
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+
+def test_get_frame_df(named_df):
+    tab = make_table(named_df, index_col="name")
+    # the values of named_df are rounded to 0.01 in [0, 1], so 1.5 is always a change
+    df = get_frame_df(tab, {("x", "B"): 1.5, ("z", "E"): 1.25})
+
+    assert df.shape == named_df.shape
+    assert df.loc[2, "B"] == 1.5
+    assert df.loc[4, "E"] == 1.25
+    assert set(tab.update(df)) == {(2, 2), (4, 5)}
+
+
+def test_get_frame_df_of_dataframe(df):
+    tab = make_table(df)
+    assert get_frame_df(tab, df) is df
+
+
+def test_get_frame_df_errors(df):
+    tab = make_table(df)
+    with pytest.raises(TypeError):
+        get_frame_df(tab, [1, 2, 3])
+    with pytest.raises(KeyError):
+        get_frame_df(tab, {(0, "F"): 1})
+
+
+def test_get_changed_artists(df):
+    tab = make_table(
+        df,
+        column_definitions=[
+            ColumnDefinition("A", cmap=mpl.colormaps["RdYlGn"]),
+            ColumnDefinition("B", plot_fn=plots.bar),
+        ],
+    )
+    new_df = df.copy()
+    new_df.iloc[0, 0] = 0.5
+    new_df.iloc[1, 1] = 0.5
+    new_df.iloc[2, 2] = 0.5
+
+    artists = get_changed_artists(tab, tab.update(new_df))
+
+    assert artists == [
+        tab.cells[(0, 1)].text,
+        tab.cells[(0, 1)].rectangle_patch,
+        tab.subplots[(1, 2)],
+        tab.cells[(2, 3)].text,
+    ]
+
+
+def test_get_changed_artists_of_column_renderers(df):
+    tab = make_table(
+        df,
+        column_definitions=[ColumnDefinition("A", plot_fn=plots.bar)],
+        use_column_renderers=True,
+    )
+    new_df = df.copy()
+    new_df.iloc[0, 0] = 0.5
+    new_df.iloc[1, 0] = 0.5
+
+    assert get_changed_artists(tab, tab.update(new_df)) == tab.column_artists["A"]
+
+
+def test_get_animated_artists(df):
+    tab = make_table(
+        df,
+        column_definitions=[
+            ColumnDefinition("A", cmap=mpl.colormaps["RdYlGn"]),
+            ColumnDefinition("B", plot_fn=plots.bar),
+        ],
+    )
+    artists = get_animated_artists(tab)
+
+    texts = [cell.text for cell in tab.cells.values() if hasattr(cell, "text")]
+    rectangles = [tab.cells[(row, 1)].rectangle_patch for row in range(5)]
+    # the dividers are drawn above the rectangles of the cmap column
+    dividers = [*tab.ax.lines, *tab.ax.collections]
+    assert tab.row_divider_collection in dividers
+    assert set(artists) == {*texts, *rectangles, *dividers, *tab.subplots.values()}
+    assert tab.col_label_row.cells[0].text not in artists
+    assert artists[:5] == rectangles
+    assert set(artists[5 : 5 + len(dividers)]) == set(dividers)
+    assert set(artists[-5:]) == set(tab.subplots.values())
+
+
+def test_get_animated_artists_without_cmap(df):
+    tab = make_table(df)
+    texts = [cell.text for cell in tab.cells.values()]
+    assert get_animated_artists(tab) == texts
+
+
+def test_table_animation(named_df):
+    tab = make_table(named_df, index_col="name")
+    frames = [{("v", "A"): 2.5}, {("w", "B"): 1.5, ("x", "C"): 12.25}, {}]
+    anim = TableAnimation(tab, frames=frames, repeat=False)
+    tab.figure.canvas.draw()
+
+    assert all(artist.get_animated() for artist in get_animated_artists(tab))
+    assert not tab.col_label_row.cells[0].text.get_animated()
+
+    changed = []
+    while anim._step():
+        changed.append(set(anim.changed_cells))
+
+    assert changed == [{(0, 1)}, {(1, 2), (2, 3)}, set()]
+    assert tab.cells[(2, 3)].text.get_text() == "12.25"
+
+
+def test_table_animation_draws_changed_cells(named_df):
+    cmap = mpl.colormaps["RdYlGn"]
+    kwargs = {
+        "index_col": "name",
+        "column_definitions": [
+            ColumnDefinition("A", cmap=cmap),
+            ColumnDefinition("B", plot_fn=plots.bar),
+        ],
+    }
+    tab = make_table(named_df, **kwargs)
+    frames = [
+        {("v", "A"): 0.9, ("w", "B"): 0.1, ("x", "C"): 123456.75},
+        {("w", "A"): 0.1, ("x", "B"): 0.8, ("x", "C"): 1},
+    ]
+    anim = TableAnimation(tab, frames=frames, repeat=False)
+    draw_frames(anim)
+
+    expected = make_table(named_df, **kwargs)
+    expected.update(tab.df.reset_index())
+    expected.figure.canvas.draw()
+
+    assert np.array_equal(get_pixels(tab.figure), get_pixels(expected.figure))
+
+
+def test_table_animation_does_not_draw_static_artists(df):
+    tab = make_table(df)
+    new_df = df.copy()
+    new_df.iloc[2, 2] = 0.5
+    anim = TableAnimation(tab, frames=[new_df], repeat=False)
+    tab.figure.canvas.draw()
+
+    drawn = []
+    for text in tab.ax.texts:
+        text.draw = lambda renderer, text=text: drawn.append(text)
+    while anim._step():
+        pass
+
+    # the texts of the cells are drawn on the cached background without the labels
+    assert drawn == [cell.text for cell in tab.cells.values()]
+
+
+def test_table_animation_without_blit(df):
+    tab = make_table(df)
+    new_df = df.copy()
+    new_df.iloc[0, 0] = 0.5
+    anim = TableAnimation(tab, frames=[new_df], blit=False, repeat=False)
+    draw_frames(anim)
+
+    assert anim.changed_cells == {(0, 1): tab.cells[(0, 1)]}
+    assert tab.cells[(0, 1)].text.get_text() == "0.5"
+    assert not any(artist.get_animated() for artist in get_animated_artists(tab))
@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+
+from plottable.cache import BoundedCache, CacheInfo
+
+
+@pytest.fixture
+def cache() -> BoundedCache:
+    return BoundedCache(maxsize=2)
+
+
+def test_get_counts_hits_and_misses(cache):
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+    assert cache.hit_rate == 0.5
+
+
+def test_set_discards_least_recently_used(cache):
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_maxsize_zero_does_not_store():
+    cache = BoundedCache(maxsize=0)
+    cache.set("a", 1)
+    assert len(cache) == 0
+
+
+def test_clear(cache):
+    cache.set("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_memoize(cache):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        return "value"
+
+    assert cache.memoize("a", fn) == "value"
+    assert cache.memoize("a", fn) == "value"
+    assert len(calls) == 1
+    assert cache.info().hits == 1
+
+
+def test_memoize_unhashable_key(cache):
+    assert cache.memoize(["a"], lambda: "value") == "value"
+    assert len(cache) == 0
+
+
+def test_map_computes_distinct_values_once():
+    cache = BoundedCache()
+    batches = []
+
+    def fn(values):
+        batches.append(list(values))
+        return [f"{value:.1f}" for value in values]
+
+    values = np.array([1, 2, 1, 1, 3])
+    assert cache.map(fn, values) == ["1.0", "2.0", "1.0", "1.0", "3.0"]
+    assert batches == [[1, 2, 3]]
+    assert cache.info() == CacheInfo(hits=2, misses=3, maxsize=1024, currsize=3)
+
+    assert cache.map(fn, values) == ["1.0", "2.0", "1.0", "1.0", "3.0"]
+    assert len(batches) == 1
+    assert cache.info().hits == 7
+
+
+def test_map_keeps_dtype():
+    cache = BoundedCache()
+    dtypes = []
+
+    def fn(values):
+        dtypes.append(values.dtype)
+        return list(values)
+
+    cache.map(fn, np.array([1.5, 2.5]))
+    assert dtypes == [np.dtype(float)]
+
+
+def test_map_does_not_cache_nan():
+    cache = BoundedCache()
+    results = cache.map(lambda values: [str(v) for v in values], [1.0, np.nan, None])
+    assert results == ["1.0", "nan", "None"]
+    assert len(cache) == 1
+
+
+def test_map_unhashable_values():
+    cache = BoundedCache()
+    results = cache.map(lambda values: [str(v) for v in values], [[1], [2]])
+    assert results == ["[1]", "[2]"]
+    assert len(cache) == 0
+
+
+def test_map_is_bounded():
+    cache = BoundedCache(maxsize=10)
+    results = cache.map(lambda values: list(values * 2), np.arange(100))
+    assert results == list(range(0, 200, 2))
+    assert len(cache) == 10
+
+
+def test_map_empty(cache):
+    assert cache.map(lambda values: values, []) == []
+
+
+def test_map_keeps_equal_values_of_different_types_apart():
+    cache = BoundedCache()
+
+    def fn(values):
+        return [f"{type(value).__name__}: {value}" for value in values]
+
+    results = cache.map(fn, [1, 1.0, True, np.True_, 1])
+    numpy_bool = f"{type(np.True_).__name__}: True"
+    assert results == ["int: 1", "float: 1.0", "bool: True", numpy_bool, "int: 1"]
+    assert len(cache) == 4
+
+    assert cache.map(fn, np.array([1, 1])) == ["int64: 1", "int64: 1"]
+    assert cache.map(fn, np.array([1.0])) == ["float64: 1.0"]
+    assert len(cache) == 6
@@ -1,8 +1,24 @@
 import matplotlib
+import matplotlib.pyplot as plt
+import pytest
 
 from plottable import __version__
-from plottable.cell import Column, Row, SubplotCell, TextCell, create_cell
+from plottable.cell import (
+    CollectionPatch,
+    Column,
+    CopyOnWriteDict,
+    InsetAxes,
+    InsetAxesPool,
+    RectangleCollection,
+    Row,
+    SubplotCell,
+    TableCell,
+    TextCell,
+    create_cell,
+    get_axes_inset_bounds,
+)
 from plottable.column_def import ColumnType
+from plottable.grid import TableGrid
 from plottable.plots import percentile_bars
 
 
@@ -72,6 +88,22 @@ class TestTableCell:
             "height": 4,
         }
 
+    def test_table_cell_set_geometry(self, table_cell):
+        table_cell.xy = (5, 6)
+        table_cell.width = 7
+        table_cell.height = 8
+        assert (table_cell.xy, table_cell.width, table_cell.height) == ((5, 6), 7, 8)
+
+    def test_table_cell_on_grid_geometry_is_read_only(self):
+        grid = TableGrid([1, 2], [1, 1])
+        cell = TableCell(xy=(1, 1), content=1, row_idx=1, col_idx=1, grid=grid)
+        assert (cell.xy, cell.width, cell.height) == ((1, 1), 2, 1)
+
+        for name, value in [("xy", (0, 0)), ("width", 3), ("height", 3)]:
+            with pytest.raises(AttributeError, match="TableGrid"):
+                setattr(cell, name, value)
+        assert (cell.xy, cell.width, cell.height) == ((1, 1), 2, 1)
+
     def test_rectangle_patch(self, table_cell):
         _rect = matplotlib.patches.Rectangle(table_cell.xy, **table_cell.rect_kw)
         assert table_cell.rectangle_patch.xy == _rect.xy
@@ -100,6 +132,23 @@ class TestTextCell:
         assert text_cell.text.get_text() == _text.get_text()
         assert text_cell.text.get_position() == _text.get_position()
 
+    def test_set_text_formatted_content(self, text_cell):
+        text_cell.formatted_content = "Formatted"
+        text_cell.draw()
+        assert text_cell.text.get_text() == "Formatted"
+
+    def test_set_content(self, text_cell):
+        text_cell.draw()
+        text = text_cell.text
+
+        text_cell.set_content(1.5)
+        assert text_cell.content == 1.5
+        assert text_cell.text is text
+        assert text.get_text() == "1.5"
+
+        text_cell.set_content(2, "2.00")
+        assert text.get_text() == "2.00"
+
     def test_set_text_ha_is_left(self, text_cell):
         text_cell.ha = "left"
         text_cell.draw()
@@ -125,15 +174,188 @@ class TestSubplotCell:
     def test_subplot_cell_make_axes_inset(self, subplot_cell):
         subplot_cell.make_axes_inset()
         assert isinstance(subplot_cell.axes_inset, matplotlib.axes.Axes)
+        assert isinstance(subplot_cell.axes_inset, InsetAxes)
 
     def test_get_rectangle_bounds(self, subplot_cell):
-        # TODO
-        assert True
+        transformer = subplot_cell.fig.transFigure.inverted()
+        display_coords = subplot_cell.rectangle_patch.get_window_extent()
+        (xmin, ymin), (xmax, ymax) = transformer.transform(display_coords)
+        y_range = ymax - ymin
+        expected = [xmin, ymin + 0.2 * y_range, xmax - xmin, 0.6 * y_range]
+
+        assert subplot_cell._get_rectangle_bounds() == pytest.approx(expected)
+
+    def test_subplot_cell_make_axes_inset_with_rect(self, subplot_cell):
+        subplot_cell.make_axes_inset([0.1, 0.2, 0.3, 0.4])
+        assert subplot_cell.axes_inset.get_position().bounds == pytest.approx(
+            (0.1, 0.2, 0.3, 0.4)
+        )
 
     def test_subplot_cell_plot(self, subplot_cell):
         subplot_cell.make_axes_inset()
         subplot_cell.plot()
-        assert len(subplot_cell.axes_inset.patches) > 1
+        ax = subplot_cell.axes_inset
+
+        # percentile_bars draws its backgrounds, bars and edges as one collection
+        (bars,) = ax.collections
+        assert len(bars.get_paths()) == 3
+        # that fills the axes inset like the patches it replaced
+        assert ax.get_xlim() == (0, 1)
+        assert ax.get_ylim() == (0, 1)
+        extent = bars.get_paths()[0].get_extents()
+        assert (extent.x0, extent.x1) == pytest.approx((0, 1))
+
+    def test_subplot_cell_set_content(self, subplot_cell):
+        subplot_cell.make_axes_inset()
+        subplot_cell.plot()
+        collection = subplot_cell.axes_inset.collections[0]
+
+        subplot_cell.set_content(30)
+        assert subplot_cell.content == 30
+        assert len(subplot_cell.axes_inset.collections) == 1
+        assert subplot_cell.axes_inset.collections[0] is not collection
+
+
+def test_inset_axes_creates_no_ticks():
+    fig = plt.figure()
+    ax = fig.add_axes([0.1, 0.1, 0.5, 0.5], axes_class=InsetAxes)
+    ax.plot([0, 1], [0, 1])
+
+    assert not ax.axison
+    for axis in (ax.xaxis, ax.yaxis):
+        assert "majorTicks" not in vars(axis)
+        assert "minorTicks" not in vars(axis)
+    plt.close(fig)
+
+
+def test_inset_axes_clears_its_axis_like_axes(monkeypatch):
+    clears = []
+    clear = matplotlib.axis.Axis.clear
+
+    def counting_clear(self):
+        clears.append(self)
+        clear(self)
+
+    monkeypatch.setattr(matplotlib.axis.Axis, "clear", counting_clear)
+    fig = plt.figure()
+    fig.add_axes([0.1, 0.1, 0.5, 0.5])
+    n_axes_clears = len(clears)
+    clears.clear()
+    fig.add_axes([0.1, 0.1, 0.5, 0.5], axes_class=InsetAxes)
+
+    assert len(clears) == n_axes_clears
+    plt.close(fig)
+
+
+@pytest.mark.skipif(
+    matplotlib.__version_info__ < (3, 10),
+    reason="before matplotlib 3.10 a draw creates a tick to position the titles",
+)
+def test_inset_axes_draws_no_ticks():
+    fig = plt.figure()
+    ax = fig.add_axes([0.1, 0.1, 0.5, 0.5], axes_class=InsetAxes)
+    ax.plot([0, 1], [0, 1])
+    fig.canvas.draw()
+
+    for axis in (ax.xaxis, ax.yaxis):
+        assert "majorTicks" not in vars(axis)
+        assert "minorTicks" not in vars(axis)
+    plt.close(fig)
+
+
+def test_inset_axes_axis():
+    fig = plt.figure()
+    ax = fig.add_axes([0.1, 0.1, 0.5, 0.5], axes_class=InsetAxes)
+
+    assert isinstance(ax.xaxis, matplotlib.axis.XAxis)
+    assert isinstance(ax.yaxis, matplotlib.axis.YAxis)
+    assert ax.spines.bottom.axis is ax.xaxis
+    assert ax.spines.left.axis is ax.yaxis
+
+    ax.axis("on")
+    ax.set_xscale("log")
+    ax.plot([1, 10], [0, 1])
+    fig.canvas.draw()
+    assert ax.xaxis.get_scale() == "log"
+    assert len(ax.xaxis.get_major_ticks()) > 0
+    plt.close(fig)
+
+
+def test_inset_axes_ticks_are_created_on_access():
+    fig = plt.figure()
+    ax = fig.add_axes([0.1, 0.1, 0.5, 0.5], axes_class=InsetAxes)
+    ax.tick_params(labelsize=5, color="r")
+    ax.axis("on")
+    fig.canvas.draw()
+
+    tick = ax.xaxis.get_major_ticks()[0]
+    assert tick.label1.get_fontsize() == 5
+    assert tick.tick1line.get_color() == "r"
+    plt.close(fig)
+
+
+def test_inset_axes_reset():
+    fig = plt.figure()
+    ax = fig.add_axes([0.1, 0.1, 0.5, 0.5], axes_class=InsetAxes)
+    ax.imshow([[0, 1], [1, 0]])
+    ax.text(0, 0, "text")
+
+    ax.reset()
+    assert not ax.images and not ax.texts
+    assert ax.get_xlim() == (0, 1)
+    assert ax.get_ylim() == (0, 1)
+    assert ax.get_aspect() == "auto"
+    assert ax.get_autoscalex_on() and ax.get_autoscaley_on()
+
+    ax.plot([2, 3], [2, 3])
+    assert ax.get_xlim()[0] > 1
+    plt.close(fig)
+
+
+def test_inset_axes_pool():
+    fig = plt.figure()
+    pool = InsetAxesPool(fig)
+
+    first = [pool.acquire([0.1 * i, 0.1, 0.1, 0.1]) for i in range(3)]
+    assert len(pool) == 3
+    first[0].plot([0, 1])
+
+    pool.release()
+    second = [pool.acquire([0.1 * i, 0.5, 0.1, 0.1]) for i in range(2)]
+    pool.trim()
+
+    assert second == first[:2]
+    assert not second[0].lines
+    assert second[0].get_position().bounds == pytest.approx((0, 0.5, 0.1, 0.1))
+    assert len(pool) == 2
+    assert first[2] not in fig.axes
+    plt.close(fig)
+
+
+def test_get_axes_inset_bounds_matches_single_cells():
+    fig, ax = plt.subplots()
+    ax.set_xlim(0, 3)
+    ax.set_ylim(0, 2)
+    ax.invert_yaxis()
+
+    cells = [
+        SubplotCell((x, y), 0, y, x, plot_fn=percentile_bars, width=1, ax=ax)
+        for x in range(3)
+        for y in range(2)
+    ]
+    bounds = [(cell.xy[0], cell.xy[1], cell.width, cell.height) for cell in cells]
+    rects = get_axes_inset_bounds(ax, bounds)
+
+    assert rects.shape == (len(cells), 4)
+    for cell, rect in zip(cells, rects):
+        transformer = fig.transFigure.inverted()
+        (xmin, ymin), (xmax, ymax) = transformer.transform(
+            cell.rectangle_patch.get_window_extent()
+        )
+        assert list(rect) == pytest.approx(
+            [xmin, ymin + 0.2 * (ymax - ymin), xmax - xmin, 0.6 * (ymax - ymin)]
+        )
+    plt.close(fig)
 
 
 def test_create_cell_type_is_stringcell():
@@ -279,3 +501,140 @@ def test_column_y():
     ]
     col = Column(cells, index=0)
     assert col.y == 2
+
+
+class TestRectangleCollection:
+    @pytest.fixture
+    def collection(self) -> RectangleCollection:
+        collection = RectangleCollection()
+        for i in range(5):
+            collection.add_rectangle((i, 0), width=1, height=2, facecolor="w", lw=1)
+        return collection
+
+    def test_len(self, collection):
+        assert len(collection) == 5
+
+    def test_add_rectangle_returns_collection_patch(self, collection):
+        patch = collection.add_rectangle((5, 0), width=2, height=3)
+        assert isinstance(patch, CollectionPatch)
+        assert patch.index == 5
+        assert patch.xy == (5, 0)
+        assert patch.get_width() == 2
+        assert patch.get_height() == 3
+
+    def test_cell_linewidths(self, collection):
+        assert list(collection.get_cell_linewidths()) == [1] * 5
+
+    def test_set_cell_facecolor(self, collection):
+        collection.set_cell_facecolor([1, 3], "k")
+        facecolors = collection.get_cell_facecolors()
+        assert tuple(facecolors[1]) == (0, 0, 0, 1)
+        assert tuple(facecolors[3]) == (0, 0, 0, 1)
+        assert tuple(facecolors[0]) == (1, 1, 1, 1)
+
+    def test_set_cell_alpha(self, collection):
+        collection.set_cell_alpha([0], 0.5)
+        collection.set_cell_facecolor([0], "k")
+        assert tuple(collection.get_cell_facecolors([0])[0]) == (0, 0, 0, 0.5)
+
+    def test_set_cell_fill(self, collection):
+        collection.set_cell_fill([0], False)
+        assert collection.get_cell_facecolors([0])[0][3] == 0
+
+    def test_collection_patch_set_facecolor(self, collection):
+        patch = CollectionPatch(collection, 2)
+        patch.set_facecolor("r")
+        assert patch.get_facecolor() == (1, 0, 0, 1)
+
+    def test_sequence_sets_collection_arrays(self, collection):
+        cells = [
+            TableCell(xy=(i, 0), content=i, row_idx=0, col_idx=i, collection=collection)
+            for i in range(3)
+        ]
+        Row(cells, index=0).set_facecolor("r").set_linewidth(3)
+
+        for cell in cells:
+            assert cell.rectangle_patch.get_facecolor() == (1, 0, 0, 1)
+            assert cell.rectangle_patch.get_linewidth() == 3
+
+
+def test_sequence_set_facecolors():
+    cells = [
+        create_cell(
+            column_type=ColumnType.STRING,
+            xy=(0, i),
+            content=i,
+            row_idx=i,
+            col_idx=0,
+        )
+        for i in range(3)
+    ]
+    colors = [(1, 0, 0, 1), (0, 1, 0, 1), (0, 0, 1, 1)]
+    Column(cells, index=0).set_facecolors(colors)
+
+    for cell, color in zip(cells, colors):
+        assert cell.rectangle_patch.get_facecolor() == color
+
+
+@pytest.mark.parametrize("fixture", ["default_cell", "table_cell", "text_cell"])
+def test_cells_have_no_instance_dict(request, fixture):
+    cell = request.getfixturevalue(fixture)
+    assert not hasattr(cell, "__dict__")
+
+
+def test_subplot_cell_has_no_instance_dict(subplot_cell):
+    assert not hasattr(subplot_cell, "__dict__")
+
+
+class TestCopyOnWriteDict:
+    def test_share(self):
+        data = {"a": 1}
+        d = CopyOnWriteDict(data)
+        shared = d.share()
+        assert shared == {"a": 1}
+        assert shared._data is d._data
+
+    def test_setitem_copies(self):
+        data = {"a": 1}
+        d = CopyOnWriteDict(data)
+        shared = d.share()
+        shared["a"] = 2
+
+        assert shared == {"a": 2}
+        assert d == {"a": 1}
+        assert data == {"a": 1}
+
+    def test_delitem_copies(self):
+        data = {"a": 1, "b": 2}
+        d = CopyOnWriteDict(data)
+        del d["a"]
+        assert d == {"b": 2}
+        assert data == {"a": 1, "b": 2}
+
+    def test_unpacking(self):
+        d = CopyOnWriteDict({"a": 1})
+        assert dict(**d) == {"a": 1}
+
+
+def test_cells_share_resolved_textprops():
+    textprops = TextCell.resolve_textprops({"fontsize": 12})
+    rect_kw = TableCell.resolve_rect_kw(matplotlib.pyplot.gca(), 1, 1, {"lw": 1})
+    cells = [
+        TextCell(
+            xy=(0, i),
+            content=i,
+            row_idx=i,
+            col_idx=0,
+            rect_kw=rect_kw,
+            textprops=textprops,
+        )
+        for i in range(2)
+    ]
+
+    assert cells[0].textprops._data is cells[1].textprops._data
+    assert cells[0].rect_kw._data is cells[1].rect_kw._data
+    assert cells[0].textprops == {"ha": "right", "va": "center", "fontsize": 12}
+
+    cells[0].textprops["fontsize"] = 14
+    assert cells[0].textprops["fontsize"] == 14
+    assert cells[1].textprops["fontsize"] == 12
@@ -1,6 +1,7 @@
 import matplotlib
+import numpy as np
 import pandas as pd
-from plottable.cmap import normed_cmap
+from plottable.cmap import _is_vectorized, apply_cmap, centered_cmap, normed_cmap
 
 
 def test_normed_cmap():
@@ -47,3 +48,45 @@ def test_normed_cmap_three_stds():
         0.7635524798154556,
         1.0,
     )
+
+
+def test_is_vectorized():
+    s = pd.Series(list(range(0, 11)))
+    assert _is_vectorized(matplotlib.cm.PiYG)
+    assert _is_vectorized(normed_cmap(s, matplotlib.cm.PiYG))
+    assert _is_vectorized(centered_cmap(s, matplotlib.cm.PiYG))
+    assert not _is_vectorized(lambda x: "red")
+
+
+def test_apply_cmap_equals_scalar_calls():
+    s = pd.Series(list(range(0, 11)))
+    cmap_fn = normed_cmap(s, matplotlib.cm.PiYG)
+    colors = apply_cmap(cmap_fn, s.to_list())
+
+    assert colors.shape == (11, 4)
+    for value, color in zip(s, colors):
+        assert tuple(color) == cmap_fn(value)
+
+
+def test_apply_cmap_calls_colormap_once():
+    calls = []
+
+    class CountingColormap(matplotlib.colors.ListedColormap):
+        def __call__(self, X, *args, **kwargs):
+            calls.append(X)
+            return super().__call__(X, *args, **kwargs)
+
+    cmap = CountingColormap(["r", "g", "b"])
+    colors = apply_cmap(cmap, [0.0, 0.5, 1.0])
+
+    assert len(calls) == 1
+    assert np.array_equal(colors, cmap([0.0, 0.5, 1.0]))
+
+
+def test_apply_cmap_scalar_function():
+    colors = apply_cmap(lambda x: "r" if x > 0 else "b", [-1, 1])
+    assert colors.tolist() == [[0, 0, 1, 1], [1, 0, 0, 1]]
+
+
+def test_apply_cmap_empty():
+    assert apply_cmap(matplotlib.cm.PiYG, []).shape == (0, 4)
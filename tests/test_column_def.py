@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from plottable.column_def import ColumnDefinition, _filter_none_values
 
@@ -25,6 +27,7 @@ def test_column_definition_as_dict(col_def):
         "plot_fn": None,
         "plot_kw": {},
         "border": None,
+        "column_plot_fn": None,
     }
 
 
@@ -36,3 +39,38 @@ def test_column_definition_as_non_none_dict(col_def):
         "textprops": {},
         "plot_kw": {},
     }
+
+
+def test_as_non_none_dict_does_not_copy_values():
+    plot_kw = {"cmap": [1, 2, 3]}
+    col_def = ColumnDefinition(name="col", plot_kw=plot_kw)
+    assert col_def._as_non_none_dict()["plot_kw"] is plot_kw
+
+
+def test_resolve(col_def):
+    spec = col_def._resolve()
+    assert spec == col_def._as_non_none_dict()
+    assert spec["textprops"] is col_def.textprops
+
+
+def test_resolve_is_cached(col_def):
+    assert col_def._resolve() is col_def._resolve()
+
+
+def test_resolve_is_read_only(col_def):
+    with pytest.raises(TypeError):
+        col_def._resolve()["title"] = "Other"
+
+
+def test_resolve_is_updated_when_attribute_is_set(col_def):
+    spec = col_def._resolve()
+    col_def.title = "Other"
+    assert col_def._resolve() is not spec
+    assert col_def._resolve()["title"] == "Other"
+
+
+def test_column_definition_is_picklable(col_def):
+    col_def._resolve()
+    unpickled = pickle.loads(pickle.dumps(col_def))
+    assert unpickled == col_def
+    assert unpickled._resolve() == col_def._resolve()
@@ -1,9 +1,12 @@
+import numpy as np
 import pytest
 
 from plottable.formatters import (
     apply_formatter,
     apply_string_formatter,
+    compile_formatter,
     decimal_to_percent,
+    format_values,
     signed_integer,
     tickcross,
 )
@@ -62,3 +65,42 @@ def test_apply_string_formatter(content, fmt, output):
 )
 def test_apply_formatter(content, fmt, output):
     assert apply_formatter(fmt, content) == output
+
+
+def test_compile_string_formatter():
+    assert compile_formatter("{:.2f}")(1.23456) == "1.23"
+
+
+def test_compile_callable_formatter():
+    assert compile_formatter(tickcross) is tickcross
+
+
+def test_compile_formatter_raises_type_error():
+    with pytest.raises(TypeError):
+        compile_formatter(1)
+
+
+@pytest.mark.parametrize(
+    "formatter, values",
+    [
+        ("{:.2f}", np.array([1.23456, 0.5, -3])),
+        ("{:0>2d}", np.array([1, 10, 4])),
+        (decimal_to_percent, np.array([0, 1, 0.005, 0.995, 0.554, 0.555])),
+        (decimal_to_percent, np.array([0, 1, 1])),
+        (tickcross, np.array([0, 1, 0.0, 0.5])),
+        (tickcross, np.array([True, False])),
+        (signed_integer, np.array([-1, 0, 1])),
+        (signed_integer, np.array([-1.5, 0.0, 1.5])),
+        (decimal_to_percent, [0, 0.5, 1]),
+        ("${:}", np.array(["100", "200"], dtype=object)),
+        (lambda x: f"{x}!", np.array([1, 2])),
+    ],
+)
+def test_format_values_equals_apply_formatter(formatter, values):
+    assert format_values(formatter, values) == [
+        apply_formatter(formatter, value) for value in values
+    ]
+
+
+def test_format_values_is_empty():
+    assert format_values("{:.2f}", np.array([])) == []
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from plottable.grid import TableGrid
+
+
+@pytest.fixture
+def grid() -> TableGrid:
+    return TableGrid(column_widths=[1, 2, 0.5], row_heights=[1, 1, 2, 1])
+
+
+def test_grid_shape(grid):
+    assert grid.n_rows == 4
+    assert grid.n_cols == 3
+    assert grid.n_cells == 12
+    assert grid.style_ids.shape == (4, 3)
+
+
+def test_grid_offsets(grid):
+    assert list(grid.column_x) == [0, 1, 3]
+    assert list(grid.row_y) == [0, 1, 2, 4]
+
+
+def test_get_xy(grid):
+    assert grid.get_xy(2, 1) == (1, 2)
+
+
+def test_get_cell_bounds(grid):
+    assert grid.get_cell_bounds(3, 2) == (3, 4, 0.5, 1)
+
+
+def test_get_bounds(grid):
+    bounds = grid.get_bounds()
+    assert bounds.shape == (4, 3, 4)
+    for row in range(grid.n_rows):
+        for col in range(grid.n_cols):
+            assert tuple(bounds[row, col]) == grid.get_cell_bounds(row, col)
+
+
+def test_get_xrange(grid):
+    assert grid.get_xrange() == (0, 3.5)
+    assert grid.get_xrange(1) == (1, 3)
+
+
+def test_get_yrange(grid):
+    assert grid.get_yrange() == (0, 5)
+    assert grid.get_yrange(2) == (2, 4)
+
+
+def test_empty_grid_ranges():
+    grid = TableGrid([], [])
+    assert grid.get_xrange() == (0, 0)
+    assert grid.get_yrange() == (0, 0)
+    assert grid.get_bounds().shape == (0, 0, 4)
+
+
+def test_styles(grid):
+    first = grid.add_style({"a": 1})
+    second = grid.add_style({"a": 2})
+    grid.style_ids[:, 1] = second
+
+    assert first == 0 and second == 1
+    assert grid.get_style(0, 0) == {"a": 1}
+    assert grid.get_style(0, 1) == {"a": 2}
+    assert grid.get_row_styles(3) == [{"a": 1}, {"a": 2}, {"a": 1}]
+    assert np.all(grid.style_ids[:, 0] == first)
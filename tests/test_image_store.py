@@ -0,0 +1,154 @@
+import json
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+
+from plottable.image_store import (
+    ImageStore,
+    build_image_store,
+    clear_image_stores,
+    main,
+    use_image_store,
+)
+from plottable.images import ImageCache, make_image_atlas, prefetch_images, read_image
+
+
+@pytest.fixture
+def image_dir(tmp_path) -> str:
+    directory = tmp_path / "images"
+    (directory / "sub").mkdir(parents=True)
+    rng = np.random.default_rng(0)
+    Image.fromarray(rng.integers(0, 255, (80, 60, 4), dtype=np.uint8)).save(
+        directory / "a.png"
+    )
+    Image.fromarray(rng.integers(0, 255, (10, 20, 3), dtype=np.uint8)).save(
+        directory / "sub" / "b.png"
+    )
+    (directory / "notes.txt").write_text("not an image")
+    return str(directory)
+
+
+@pytest.fixture
+def store(image_dir, tmp_path) -> ImageStore:
+    store = build_image_store(image_dir, tmp_path / "images.store", sizes=(16, 32))
+    yield store
+    clear_image_stores()
+
+
+@pytest.fixture
+def cache() -> ImageCache:
+    return ImageCache()
+
+
+def test_build_image_store(store, image_dir):
+    assert len(store) == 2
+    assert os.path.join(image_dir, "a.png") in store
+    assert os.path.join(image_dir, "sub", "b.png") in store
+    assert os.path.join(image_dir, "notes.txt") not in store
+    assert store.sizes == (32, 16)
+    assert isinstance(store.data, np.memmap)
+
+
+def test_image_store_get(store, image_dir):
+    path = os.path.join(image_dir, "a.png")
+    img, _ = store.get(path)
+    assert img.shape == (80, 60, 4)
+    assert img.dtype == np.uint8
+    assert np.array_equal(img, np.rint(plt.imread(path) * 255))
+    assert not img.flags.writeable
+
+    assert store.get(path, min_size=(20, 20))[0].shape == (32, 24, 4)
+    assert store.get(path, min_size=(10, 10))[0].shape == (16, 12, 4)
+    assert store.get(path, min_size=(100, 100))[0].shape == (80, 60, 4)
+
+
+def test_image_store_variants(store, image_dir):
+    path = os.path.join(image_dir, "a.png")
+    monochrome, _ = store.get(path, "LA")
+    assert np.all(monochrome[..., 0] == monochrome[..., 1])
+
+    circled, _ = store.get(path, "circled")
+    assert circled[0, 0, 3] == 0
+    assert circled[40, 30, 3] == store.get(path)[0][40, 30, 3]
+
+
+def test_image_store_modified_file_is_not_used(store, image_dir):
+    path = os.path.join(image_dir, "a.png")
+    Image.new("RGB", (4, 4)).save(path)
+    assert store.get(path) is None
+
+
+def test_image_store_file_with_same_size_is_not_used(store, image_dir):
+    path = os.path.join(image_dir, "a.png")
+    with open(path, "r+b") as f:
+        data = bytearray(f.read())
+        data[-20] ^= 0xFF
+        f.seek(0)
+        f.write(data)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert os.path.getsize(path) == store.index["a.png"]["filesize"]
+    assert store.get(path) is None
+
+
+def test_image_store_of_old_version(store):
+    index_path = os.path.join(store.path, "index.json")
+    with open(index_path) as f:
+        index = json.load(f)
+    index["version"] = 1
+    with open(index_path, "w") as f:
+        json.dump(index, f)
+
+    with pytest.raises(ValueError, match="Rebuild"):
+        ImageStore(store.path)
+
+
+def test_image_store_root(store, image_dir, tmp_path):
+    moved = ImageStore(store.path, root=tmp_path / "elsewhere")
+    assert moved.get(tmp_path / "elsewhere" / "sub" / "b.png")[0].shape == (10, 20, 4)
+    assert moved.get(os.path.join(image_dir, "sub", "b.png")) is None
+
+
+def test_read_image_uses_image_store(store, image_dir, cache):
+    use_image_store(store)
+    path = os.path.join(image_dir, "a.png")
+
+    img = read_image(path, cache=cache)
+    assert isinstance(img, np.memmap)
+    assert len(cache) == 0
+
+    assert read_image(path, max_size=(24, 32), cache=cache).shape == (32, 24, 4)
+    assert read_image(path, max_size=(20, 20), cache=cache).shape == (20, 15, 4)
+    assert read_image(path, mode="LA", cache=cache).shape == (80, 60, 4)
+    assert prefetch_images([path], cache=cache) == 0
+
+
+def test_read_image_without_file(store, image_dir, cache):
+    use_image_store(store)
+    path = os.path.join(image_dir, "a.png")
+    os.remove(path)
+    assert read_image(path, cache=cache).shape == (80, 60, 4)
+
+
+def test_make_image_atlas_uses_circled_variant(store, image_dir, cache):
+    use_image_store(store)
+    path = os.path.join(image_dir, "a.png")
+    atlas = make_image_atlas(
+        [path], np.array([[0, 0, 6, 8]]), (8, 6), circled=True, cache=cache
+    )
+    assert atlas[0, 0, 3] == 0
+    assert len(cache) == 1
+
+
+def test_main(image_dir, tmp_path, capsys):
+    output = str(tmp_path / "out")
+    assert main(["build", image_dir, output, "--sizes", "8", "--variants", "rgba"]) == 0
+    assert "Stored 2 images" in capsys.readouterr().out
+
+    store = ImageStore(output)
+    assert store.sizes == (8,)
+    assert store.get(os.path.join(image_dir, "a.png"), "LA") is None
@@ -0,0 +1,206 @@
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+
+from plottable.images import (
+    ImageCache,
+    get_fitted_size,
+    image_cache,
+    make_image_atlas,
+    prefetch_images,
+    read_image,
+    resize_image,
+)
+from plottable.plots import circled_image, image, monochrome_image
+
+
+@pytest.fixture
+def image_path(tmp_path) -> str:
+    path = tmp_path / "image.png"
+    rng = np.random.default_rng(0)
+    Image.fromarray(rng.integers(0, 255, (8, 6, 4), dtype=np.uint8)).save(path)
+    return str(path)
+
+
+@pytest.fixture
+def cache() -> ImageCache:
+    return ImageCache(maxbytes=10_000)
+
+
+def test_read_image_matches_imread(image_path, cache):
+    img = read_image(image_path, cache=cache)
+    assert np.array_equal(img, plt.imread(image_path))
+    assert not img.flags.writeable
+
+
+def test_read_image_is_cached(image_path, cache):
+    img = read_image(image_path, cache=cache)
+    assert read_image(image_path, cache=cache) is img
+    assert cache.info().hits == 1
+    assert cache.info().misses == 1
+    assert cache.currbytes == img.nbytes
+
+
+def test_read_image_mode_is_part_of_the_key(image_path, cache):
+    img = read_image(image_path, cache=cache)
+    monochrome = read_image(image_path, mode="LA", cache=cache)
+    assert monochrome is not img
+    assert monochrome.shape == (8, 6, 4)
+    assert monochrome.dtype == np.uint8
+    assert len(cache) == 2
+
+
+def test_read_image_modified_file_is_decoded_again(image_path, cache):
+    img = read_image(image_path, cache=cache)
+    Image.fromarray(np.zeros((4, 4, 3), dtype=np.uint8)).save(image_path)
+    os.utime(image_path, ns=(0, 0))
+
+    assert read_image(image_path, cache=cache).shape == (4, 4, 3)
+    assert img.shape == (8, 6, 4)
+
+
+def test_read_image_file_object_is_not_cached(image_path, cache):
+    with open(image_path, "rb") as f:
+        img = read_image(f, cache=cache)
+    assert img.shape == (8, 6, 4)
+    assert len(cache) == 0
+
+
+def test_image_cache_byte_budget():
+    cache = ImageCache(maxbytes=250)
+    cache.set("a", np.zeros(100, dtype=np.uint8))
+    cache.set("b", np.zeros(100, dtype=np.uint8))
+    cache.get("a")
+    cache.set("c", np.zeros(100, dtype=np.uint8))
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.currbytes == 200
+
+    cache.set("d", np.zeros(300, dtype=np.uint8))
+    assert "d" not in cache
+
+
+def test_image_cache_clear(image_path, cache):
+    read_image(image_path, cache=cache)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.currbytes == 0
+    assert cache.info().misses == 0
+
+
+def test_image_plots_use_the_image_cache(image_path):
+    image_cache.clear()
+    fig, ax = plt.subplots()
+    image(ax, image_path)
+    circled_image(ax, image_path)
+    monochrome_image(ax, image_path)
+    plt.close(fig)
+
+    # the image is decoded once per mode
+    assert image_cache.info().misses == 2
+
+
+def test_get_fitted_size():
+    assert get_fitted_size((100, 200, 3), (50, 50)) == (50, 25)
+    assert get_fitted_size((100, 200, 3), (400, 400)) is None
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.float32])
+def test_resize_image_keeps_dtype_and_channels(dtype):
+    img = np.ones((40, 20, 4), dtype=dtype)
+    resized = resize_image(img, (10, 20))
+    assert resized.shape == (20, 10, 4)
+    assert resized.dtype == dtype
+    assert resized == pytest.approx(1)
+
+
+def test_read_image_max_size(image_path, cache):
+    small = read_image(image_path, max_size=(3, 3), cache=cache)
+    assert small.shape == (3, 3, 4)
+    assert not small.flags.writeable
+    assert read_image(image_path, max_size=(3, 3), cache=cache) is small
+
+    # the full size image is decoded once
+    assert cache.info().misses == 2
+    assert read_image(image_path, max_size=(100, 100), cache=cache).shape == (8, 6, 4)
+
+
+@pytest.fixture
+def large_image_path(tmp_path) -> str:
+    path = tmp_path / "large.png"
+    Image.fromarray(np.full((400, 300, 3), 128, dtype=np.uint8)).save(path)
+    return str(path)
+
+
+def test_image_is_downsampled_to_axes_size(large_image_path):
+    fig = plt.figure(figsize=(1, 1), dpi=100)
+    ax = fig.add_axes([0, 0, 0.5, 0.5])
+
+    im = image(ax, large_image_path)
+    assert max(im.get_array().shape[:2]) <= 100
+    assert list(im.get_extent()) == [-0.5, 299.5, 399.5, -0.5]
+
+    full = image(ax, large_image_path, downsample=False)
+    assert full.get_array().shape[:2] == (400, 300)
+    plt.close(fig)
+
+
+def test_prefetch_images(tmp_path, cache):
+    paths = []
+    for idx in range(5):
+        path = tmp_path / f"{idx}.png"
+        Image.fromarray(np.full((4, 4, 3), idx, dtype=np.uint8)).save(path)
+        paths.append(str(path))
+
+    n_decoded = prefetch_images(
+        paths + paths[:2] + [np.nan, "missing.png"], max_workers=2, cache=cache
+    )
+    assert n_decoded == 5
+    assert len(cache) == 5
+    assert cache.info().misses == 5
+
+    for idx, path in enumerate(paths):
+        assert read_image(path, cache=cache)[0, 0, 0] == pytest.approx(idx / 255)
+    assert cache.info().hits == 5
+
+    assert prefetch_images(paths, cache=cache) == 0
+    assert prefetch_images(paths, mode="LA", cache=cache) == 5
+
+
+def test_make_image_atlas(image_path, cache):
+    rects = np.array([[0, 0, 6, 8], [6, 0, 6, 8], [0, 8, 12, 8]])
+    atlas = make_image_atlas([image_path] * 3, rects, (16, 12), cache=cache)
+
+    assert atlas.shape == (16, 12, 4)
+    expected = plt.imread(image_path)
+    assert np.allclose(atlas[:8, :6], expected)
+    assert np.allclose(atlas[:8, 6:], expected)
+    # the last image is centered in its wider rectangle
+    assert np.allclose(atlas[8:, 3:9], expected)
+    assert not atlas[8:, :3].any()
+    # the image is decoded once and made into a single tile
+    assert cache.info().misses == 2
+
+
+def test_make_image_atlas_resizes_images(image_path, cache):
+    rects = np.array([[0, 0, 3, 4], [3, 0, 12, 16]])
+    atlas = make_image_atlas([image_path] * 2, rects, (16, 15), cache=cache)
+    img = plt.imread(image_path)
+    assert np.allclose(atlas[:4, :3], resize_image(img, (3, 4)))
+    assert np.allclose(atlas[:, 3:], resize_image(img, (12, 16)))
+    assert not atlas[4:, :3].any()
+
+
+def test_make_image_atlas_circled(tmp_path, cache):
+    path = str(tmp_path / "white.png")
+    Image.new("RGB", (10, 10), "white").save(path)
+    atlas = make_image_atlas(
+        [path], np.array([[0, 0, 10, 10]]), (10, 10), circled=True, cache=cache
+    )
+    assert atlas[5, 5, 3] == 1
+    assert atlas[0, 0, 3] == 0
+    assert np.all(atlas[..., :3] == 1)
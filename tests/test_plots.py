@@ -0,0 +1,374 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+from matplotlib.collections import PathCollection, PolyCollection
+from matplotlib.image import AxesImage
+from matplotlib.patches import BoxStyle
+
+from plottable.plots import (
+    AnnotationCollection,
+    CellMarkerCollection,
+    _get_marker_path,
+    _get_plot_areas,
+    _get_segments_path,
+    _to_table_coords,
+    bar,
+    bar_column,
+    circled_image,
+    circled_image_column,
+    get_column_renderer,
+    get_glyph_key,
+    glyph_column,
+    image,
+    image_column,
+    monochrome_image,
+    monochrome_image_column,
+    percentile_bars,
+    percentile_bars_column,
+    percentile_stars,
+    percentile_stars_column,
+    progress_donut,
+    progress_donut_column,
+    render_glyph,
+)
+from plottable.cache import BoundedCache
+
+
+@pytest.fixture
+def table_ax():
+    fig, ax = plt.subplots()
+    ax.set_xlim(0, 2)
+    ax.set_ylim(0, 3)
+    ax.invert_yaxis()
+    yield ax
+    plt.close(fig)
+
+
+@pytest.fixture
+def bounds() -> np.ndarray:
+    return np.array([[1, row, 1, 1] for row in range(3)], dtype=float)
+
+
+def test_get_plot_areas(bounds):
+    areas = _get_plot_areas(bounds)
+    assert areas[1] == pytest.approx([1, 1.2, 1, 0.6])
+
+
+def test_to_table_coords_inverts_v(bounds):
+    areas = _get_plot_areas(bounds)
+    x, y = _to_table_coords(areas, [0, 0.5, 1], [0, 0.5, 1])
+    assert x == pytest.approx([1, 1.5, 2])
+    assert y == pytest.approx([0.8, 1.5, 2.2])
+
+
+def test_get_column_renderer():
+    assert get_column_renderer(bar) is bar_column
+    assert get_column_renderer(percentile_bars) is percentile_bars_column
+    assert get_column_renderer(percentile_stars) is percentile_stars_column
+    assert get_column_renderer(progress_donut) is progress_donut_column
+    assert get_column_renderer(image) is image_column
+    assert get_column_renderer(circled_image) is circled_image_column
+    assert get_column_renderer(monochrome_image) is monochrome_image_column
+    assert get_column_renderer(lambda ax, val: None) is None
+
+
+def test_bar_column(table_ax, bounds):
+    (bars,) = bar_column(table_ax, [0, 0.5, 1], bounds)
+    assert isinstance(bars, PolyCollection)
+    assert len(bars.get_paths()) == 3
+
+    # the bar of 0.5 ends in the middle of the padded xlim
+    x_max = bars.get_paths()[1].vertices[:, 0].max()
+    assert x_max == pytest.approx(1.5)
+
+
+def test_bar_column_bg_bars_are_drawn_last(table_ax, bounds):
+    (bars,) = bar_column(table_ax, [0, 0.5, 1], bounds, plot_bg_bar=True)
+    assert len(bars.get_paths()) == 6
+    assert list(bars.get_edgecolors()[:3, 3]) == [0, 0, 0]
+    assert list(bars.get_facecolors()[3:, 3]) == [0, 0, 0]
+
+
+def test_bar_column_cmap(table_ax, bounds):
+    cmap = plt.get_cmap("viridis")
+    (bars,) = bar_column(table_ax, [0, 0.5, 1], bounds, cmap=cmap)
+    assert bars.get_facecolors() == pytest.approx(cmap([0, 0.5, 1]))
+
+
+def test_bar_column_annotate(table_ax, bounds):
+    bars, annotations = bar_column(
+        table_ax, [0.1, 0.5, 0.9], bounds, annotate=True, formatter="{:.1f}"
+    )
+    assert isinstance(annotations, AnnotationCollection)
+    assert annotations.get_texts() == ["0.1", "0.5", "0.9"]
+    assert annotations._has == ["left", "right", "right"]
+    assert annotations in table_ax.artists
+
+
+@pytest.mark.parametrize("formatter", [None, "{:.1f}"])
+def test_bar_column_annotations_match_bar(table_ax, bounds, formatter):
+    values = np.array([14, 2, 3])
+    _, annotations = bar_column(
+        table_ax, values, bounds, xlim=(0, 20), annotate=True, formatter=formatter
+    )
+
+    texts = []
+    for value in values:
+        fig, ax = plt.subplots()
+        bar(ax, value, xlim=(0, 20), annotate=True, formatter=formatter)
+        texts.append(ax.texts[0].get_text())
+        plt.close(fig)
+
+    assert annotations.get_texts() == texts
+
+
+def test_get_segments_path_is_cached():
+    boxstyle = BoxStyle("Round", pad=0, rounding_size=0.05)
+    path = _get_segments_path(10, boxstyle)
+    assert path is _get_segments_path(10, BoxStyle("Round", pad=0, rounding_size=0.05))
+    assert path is not _get_segments_path(5, boxstyle)
+
+    assert path.vertices[:, 0].min() == pytest.approx(0)
+    assert path.vertices[:, 0].max() == pytest.approx(1)
+    assert len(path.vertices) % 10 == 0
+
+
+def test_percentile_bars(table_ax):
+    bars = percentile_bars(table_ax, 45)
+    assert isinstance(bars, PathCollection)
+    assert list(table_ax.collections) == [bars]
+    assert len(table_ax.patches) == 0
+
+    bg_path, bar_path, edge_path = bars.get_paths()
+    assert bar_path.vertices[:, 0].max() == pytest.approx(0.45)
+    assert bg_path is edge_path
+
+    # the bars fill the axes without margins
+    assert table_ax.get_xlim() == (0, 1)
+    assert table_ax.get_ylim() == (0, 1)
+
+
+def test_percentile_bars_column(table_ax, bounds):
+    (bars,) = percentile_bars_column(table_ax, [0, 45, 100], bounds)
+    paths = bars.get_paths()
+    # background, bars and edges of each cell
+    assert len(paths) == 9
+
+    n_vertices = len(paths[0].vertices) // 10
+    assert len(paths[3].vertices) == 0
+    # 4 full and a partial segment for 45
+    assert len(paths[4].vertices) == 5 * n_vertices
+    assert paths[4].vertices[:, 0].max() == pytest.approx(1.45)
+    assert len(paths[5].vertices) == 10 * n_vertices
+
+    assert list(bars.get_linewidths()) == [0] * 6 + [2.5] * 3
+
+
+def test_get_marker_path():
+    full = _get_marker_path("*")
+    assert full is _get_marker_path("*", 1)
+
+    half = _get_marker_path("*", 0.5)
+    assert half is _get_marker_path("*", 0.51)
+    assert half.vertices[:, 0].max() == pytest.approx(0, abs=1e-9)
+    assert half.vertices[:, 0].min() == pytest.approx(full.vertices[:, 0].min())
+
+
+def test_percentile_stars_column(table_ax, bounds):
+    bg_stars, stars = percentile_stars_column(table_ax, [0, 50, 100], bounds)
+    assert len(bg_stars.get_offsets()) == 15
+    # 2.5 stars for 50 and 5 stars for 100
+    assert len(stars.get_offsets()) == 8
+    assert len(stars.get_paths()) == 8
+    assert stars.get_paths()[2] is _get_marker_path("*", 0.5)
+    full_paths = stars.get_paths()[:2] + stars.get_paths()[3:]
+    assert all(path is _get_marker_path("*") for path in full_paths)
+
+
+def test_progress_donut_column(table_ax, bounds):
+    donuts, annotations = progress_donut_column(
+        table_ax, [10, 50, 100], bounds, background_color="#eee", formatter="{:.0%}"
+    )
+    # background wedges and wedges
+    assert len(donuts.get_paths()) == 6
+    assert len(donuts.get_offsets()) == 6
+    assert annotations.get_texts() == ["10%", "50%", "100%"]
+    assert annotations.get_positions() == pytest.approx(
+        np.array([[1.5, row + 0.5] for row in range(3)])
+    )
+
+
+def test_progress_donut_column_fits_cells_after_resize(table_ax, bounds):
+    donuts, _ = progress_donut_column(table_ax, [10, 50, 100], bounds)
+    assert isinstance(donuts, CellMarkerCollection)
+    fig = table_ax.figure
+    fig.canvas.draw()
+    sizes = donuts.get_sizes().copy()
+
+    # the smaller side of the cells is their height
+    width, height = fig.get_size_inches()
+    fig.set_size_inches(width, 2 * height)
+    fig.canvas.draw()
+    assert donuts.get_sizes() == pytest.approx(4 * sizes)
+
+    # the sizes in points do not depend on the dpi
+    fig.set_dpi(2 * fig.dpi)
+    fig.canvas.draw()
+    assert donuts.get_sizes() == pytest.approx(4 * sizes)
+
+
+def test_annotation_collection_draw(table_ax):
+    annotations = AnnotationCollection([0.5, 1.5], [0.5, 1.5], ["a", "b"], fontsize=8)
+    table_ax.add_artist(annotations)
+    table_ax.figure.canvas.draw()
+
+    bbox = annotations.get_window_extent()
+    assert bbox.width > 0 and bbox.height > 0
+    assert len(annotations) == 2
+
+
+@pytest.fixture
+def image_paths(tmp_path) -> list:
+    paths = []
+    for idx, color in enumerate([(255, 0, 0), (0, 0, 255)]):
+        path = tmp_path / f"{idx}.png"
+        Image.new("RGB", (20, 10), color).save(path)
+        paths.append(str(path))
+    return paths
+
+
+def test_image_column(table_ax, bounds, image_paths):
+    values = [image_paths[0], image_paths[1], image_paths[0]]
+    artists = image_column(table_ax, values, bounds)
+
+    assert len(artists) == 1
+    im = artists[0]
+    assert isinstance(im, AxesImage)
+    assert list(table_ax.images) == [im]
+    assert im.get_extent() == pytest.approx((1, 2, 2.8, 0.2))
+
+    atlas = im.get_array()
+    height = atlas.shape[0]
+    # the images are centered in the plot areas of the cells
+    center_x = atlas.shape[1] // 2
+    first = atlas[int(height * 0.1), center_x]
+    second = atlas[int(height * 0.5), center_x]
+    assert list(first) == pytest.approx([1, 0, 0, 1])
+    assert list(second) == pytest.approx([0, 0, 1, 1])
+    # the space between the images is transparent
+    assert atlas[int(height * 0.3), center_x, 3] == 0
+
+
+def test_image_column_skips_missing_values(table_ax, bounds, image_paths):
+    (im,) = image_column(table_ax, [image_paths[0], np.nan, image_paths[0]], bounds)
+    atlas = im.get_array()
+    assert atlas[int(atlas.shape[0] * 0.5), atlas.shape[1] // 2, 3] == 0
+
+
+def test_monochrome_image_column(table_ax, bounds, image_paths):
+    (im,) = monochrome_image_column(table_ax, image_paths[:1] * 3, bounds)
+    atlas = im.get_array()
+    pixel = atlas[int(atlas.shape[0] * 0.1), atlas.shape[1] // 2]
+    assert pixel[0] == pixel[1] == pixel[2]
+
+
+def test_circled_image_column(table_ax, bounds, image_paths):
+    artists = circled_image_column(table_ax, image_paths[:1] * 3, bounds)
+    assert len(artists) == 1
+
+    atlas = artists[0].get_array()
+    alpha = atlas[: atlas.shape[0] // 3, :, 3]
+    # the images are twice as wide as high and cropped to circles
+    n_cols = np.count_nonzero(alpha.max(axis=0))
+    n_rows = np.count_nonzero(alpha.max(axis=1))
+    assert abs(n_cols - n_rows) <= 2
+
+
+def test_circled_image_column_visible_circles(table_ax, bounds, image_paths):
+    artists = circled_image_column(
+        table_ax, image_paths[:1] * 3, bounds, visible=True, ec="k"
+    )
+    assert len(artists) == 2
+    circles = artists[1]
+    assert isinstance(circles, PathCollection)
+    assert len(circles.get_offsets()) == 3
+    assert circles.get_edgecolor()[0] == pytest.approx([0, 0, 0, 1])
+
+
+def test_image_column_without_downsample(table_ax, bounds, image_paths):
+    (im,) = image_column(table_ax, image_paths[:1] * 3, bounds, downsample=False)
+    (downsampled,) = image_column(table_ax, image_paths[:1] * 3, bounds)
+    assert im.get_array().shape[0] >= downsampled.get_array().shape[0]
+
+
+def test_get_glyph_key():
+    key = get_glyph_key(bar, 0.5, {"textprops": {"fontsize": 8}})
+    assert key == get_glyph_key(bar, 0.5, {"textprops": {"fontsize": 8}})
+    assert key != get_glyph_key(bar, 0.5, {"textprops": {"fontsize": 9}})
+    assert get_glyph_key(bar, 0.5, {"xlim": [0, 1]}) is None
+    assert get_glyph_key(bar, [0.5], {}) is None
+
+
+def test_get_glyph_key_of_equal_values_of_different_types():
+    keys = [get_glyph_key(bar, value) for value in [1, 1.0, True, np.int64(1)]]
+    assert len(set(keys)) == 4
+
+
+def test_get_glyph_key_of_nan():
+    assert get_glyph_key(bar, np.nan) is None
+    assert get_glyph_key(bar, np.float32("nan")) is None
+
+
+def test_render_glyph():
+    glyph = render_glyph(bar, 0.5, (40, 20), 100, {"color": "r", "xlim": (0, 1)})
+    assert glyph.shape == (20, 40, 4)
+    assert glyph.dtype == np.uint8
+    # the bar covers the left half of the axes, the rest is transparent
+    assert list(glyph[10, 5]) == [255, 0, 0, 255]
+    assert glyph[10, 35, 3] == 0
+
+
+def test_render_glyph_margin():
+    glyph = render_glyph(bar, 1, (40, 20), 100, {"color": "r", "xlim": (0, 1)}, 5)
+    assert glyph[10, 2, 3] == 0
+    assert list(glyph[10, 10]) == [255, 0, 0, 255]
+
+
+def test_glyph_column(table_ax, bounds):
+    cache = BoundedCache()
+    artists = glyph_column(
+        table_ax, [0.5, 0.2, 0.5], bounds, plot_fn=bar, cache=cache, color="r"
+    )
+
+    assert len(artists) == 1
+    assert isinstance(artists[0], AxesImage)
+    assert cache.info().misses == 2
+    assert cache.info().hits == 1
+
+
+def test_glyph_column_equal_values_of_different_types(table_ax, bounds):
+    def plot_fn(ax, val):
+        ax.text(0.5, 0.5, val, fontsize=20, ha="center", va="center")
+
+    cache = BoundedCache()
+    (im,) = glyph_column(table_ax, [1, 1.0, True], bounds, plot_fn=plot_fn, cache=cache)
+    assert cache.info().misses == 3
+
+    fig = table_ax.figure
+    glyphs = [render_glyph(plot_fn, value, (50, 30), fig.dpi) for value in [1, 1.0]]
+    assert not np.array_equal(*glyphs)
+
+
+def test_glyph_column_does_not_cache_nan(table_ax, bounds):
+    cache = BoundedCache()
+    values = [np.nan, np.float64("nan"), 0.5]
+    glyph_column(table_ax, values, bounds, plot_fn=bar, cache=cache)
+    assert len(cache) == 1
+
+
+def test_glyph_column_unhashable_values(table_ax, bounds):
+    cache = BoundedCache()
+    values = [[0.5], [0.2], [0.5]]
+    glyph_column(table_ax, values, bounds, plot_fn=lambda ax, val: None, cache=cache)
+    assert len(cache) == 0
@@ -1,9 +1,18 @@
 import matplotlib as mpl
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 import pytest
+from PIL import Image
 
 from plottable import ColDef, ColumnDefinition, Table, formatters, plots
-from plottable.cell import SubplotCell
+from plottable.cell import (
+    CollectionPatch,
+    InsetAxesPool,
+    RectangleCollection,
+    SubplotCell,
+)
+from plottable.images import image_cache
 
 
 def test_table_df(df):
@@ -223,6 +232,61 @@ def test_table_row_indices(df):
         assert cell.content == value
 
 
+def test_get_column_values(table, df):
+    column_values = table._get_column_values()
+    records = df.to_records()
+
+    assert len(column_values) == len(table.column_names)
+    for field, values in zip(records.dtype.names, column_values):
+        assert list(values) == list(records[field])
+
+
+def test_column_layout(df):
+    tab = Table(df, column_definitions=[ColDef("A", width=2), ColDef("C", width=0.5)])
+    assert list(tab.grid.column_widths) == [1, 2, 1, 0.5, 1, 1]
+    assert list(tab.grid.column_x) == [0, 1, 3, 4, 4.5, 5.5]
+
+    for cell in tab.rows[0].cells:
+        assert cell.x == tab.grid.column_x[cell.col_idx]
+        assert cell.width == tab.grid.column_widths[cell.col_idx]
+
+
+def test_table_grid(df):
+    tab = Table(df, column_definitions=[ColDef("A", width=2)])
+    assert tab.grid.n_rows == len(df)
+    assert tab.grid.n_cols == len(tab.column_names)
+
+    for (row_idx, col_idx), cell in tab.cells.items():
+        assert cell.grid is tab.grid
+        assert cell.xy == tab.grid.get_xy(row_idx, col_idx)
+        assert tab.grid.get_style(row_idx, col_idx)["rect_kw"] is not None
+
+    assert tab.rows[2].get_yrange() == (2, 3)
+    assert tab.columns["A"].get_xrange() == (1, 3)
+    assert tab.columns["A"].get_yrange() == (0, len(df))
+    assert tab.ax.get_xlim()[1] == pytest.approx(tab.grid.get_xrange()[1] + 0.025)
+
+
+def test_table_grid_cell_collection_reserved(df):
+    tab = Table(df, use_cell_collection=True)
+    assert len(tab.cell_collection) == tab.grid.n_cells
+    assert len(tab.cell_collection._cell_linewidths) == tab.grid.n_cells
+
+
+def test_table_mixed_dtypes():
+    df = pd.DataFrame(
+        {"team": ["a", "b", "c"], "points": [3, 1, 0], "share": [0.5, 0.25, 0.25]}
+    )
+    tab = Table(df, index_col="team")
+
+    assert [cell.content for cell in tab.columns["team"].cells] == ["a", "b", "c"]
+    assert [cell.text.get_text() for cell in tab.columns["points"].cells] == [
+        "3",
+        "1",
+        "0",
+    ]
+
+
 def test_col_label_row_index(table):
     assert table.col_label_row.index == -1
 
@@ -355,6 +419,286 @@ def test_table_make_subplots(df):
         assert len(cell.axes_inset.get_lines()) > 0
 
 
+def test_table_subplot_positions(df):
+    def plot_fn(ax, arg):
+        pass
+
+    tab = Table(
+        df,
+        column_definitions=[
+            ColumnDefinition("A", plot_fn=plot_fn),
+            ColumnDefinition("C", plot_fn=plot_fn),
+        ],
+    )
+
+    for key, axes_inset in tab.subplots.items():
+        assert axes_inset.get_position().bounds == pytest.approx(
+            tuple(tab.cells[key]._get_rectangle_bounds())
+        )
+
+
+def test_table_column_renderers(df):
+    tab = Table(
+        df,
+        column_definitions=[
+            ColumnDefinition("A", plot_fn=plots.bar),
+            ColumnDefinition("B", plot_fn=plots.percentile_bars),
+            ColumnDefinition("C", plot_fn=lambda ax, val: None),
+        ],
+        use_column_renderers=True,
+    )
+
+    assert list(tab.column_artists.keys()) == ["A", "B"]
+    assert all(artist.axes is tab.ax for artist in tab.column_artists["A"])
+    assert {key[1] for key in tab.subplots} == {tab.column_name_to_idx["C"]}
+
+
+def test_table_column_renderers_are_opt_in(df):
+    tab = Table(df, column_definitions=[ColumnDefinition("A", plot_fn=plots.bar)])
+    assert tab.column_artists == {}
+    assert len(tab.subplots) == len(df)
+
+
+def test_table_glyph_cache(df):
+    plots.glyph_cache.clear()
+    df = df.round(1)
+    tab = Table(
+        df,
+        column_definitions=[
+            ColumnDefinition("A", plot_fn=plots.bar, plot_kw={"color": "r"}),
+            ColumnDefinition("B", plot_fn=plots.bar, plot_kw={"xlim": [0, 1]}),
+        ],
+        use_glyph_cache=True,
+    )
+
+    assert list(tab.column_artists.keys()) == ["A"]
+    assert list(tab.ax.images) == tab.column_artists["A"]
+    assert plots.glyph_cache.info().misses == df["A"].nunique()
+    # columns with an unhashable plot_kw are plotted on axes insets
+    assert {key[1] for key in tab.subplots} == {tab.column_name_to_idx["B"]}
+
+
+def test_table_axes_pool(df):
+    fig, ax = plt.subplots()
+    pool = InsetAxesPool(fig)
+    column_definitions = [ColumnDefinition("A", plot_fn=plots.bar)]
+
+    tab = Table(df, ax=ax, column_definitions=column_definitions, axes_pool=pool)
+    axes = list(tab.subplots.values())
+    assert len(pool) == len(df)
+
+    ax.clear()
+    tab = Table(df, ax=ax, column_definitions=column_definitions, axes_pool=pool)
+    assert list(tab.subplots.values()) == axes
+    assert len(fig.axes) == len(df) + 1
+    assert all(len(subplot.patches) == 1 for subplot in axes)
+
+    ax.clear()
+    Table(df.head(2), ax=ax, column_definitions=column_definitions, axes_pool=pool)
+    assert len(fig.axes) == 3
+    plt.close(fig)
+
+
+def test_table_axes_pool_of_other_figure(df):
+    pool = InsetAxesPool(mpl.figure.Figure())
+    with pytest.raises(ValueError):
+        Table(
+            df,
+            column_definitions=[ColumnDefinition("A", plot_fn=plots.bar)],
+            axes_pool=pool,
+        )
+
+
+def test_table_update(df):
+    tab = Table(df, column_definitions=[ColumnDefinition("B", formatter="{:.2f}")])
+    texts = [cell.text for cell in tab.cells.values() if hasattr(cell, "text")]
+
+    new_df = df.copy()
+    new_df.iloc[1, 0] = 0.123456
+    new_df.iloc[2, 1] = 0.5
+
+    dirty = tab.update(new_df)
+
+    assert set(dirty) == {(1, 1), (2, 2)}
+    assert tab.cells[(1, 1)].content == 0.123456
+    assert tab.cells[(2, 2)].text.get_text() == "0.50"
+    assert tab.df is not df
+    # the texts are updated in place
+    assert [cell.text for cell in tab.cells.values() if hasattr(cell, "text")] == texts
+
+
+def test_table_update_without_changes(df):
+    tab = Table(df)
+    assert tab.update(df.copy()) == {}
+
+
+def test_table_update_nan(df):
+    df.iloc[0, 0] = np.nan
+    tab = Table(df)
+    assert tab.update(df.copy()) == {}
+
+
+def test_table_update_changed_dtype(df):
+    df["B"] = [1, 2, 3, 4, 5]
+    df["C"] = [True, False, 1, 0, 1.0]
+    tab = Table(
+        df,
+        column_definitions=[
+            ColumnDefinition("B", formatter=str),
+            ColumnDefinition("C", formatter=str),
+        ],
+    )
+
+    new_df = df.copy()
+    new_df["B"] = new_df["B"].astype(float)
+    new_df["C"] = [1, 0, True, False, 1]
+    dirty = tab.update(new_df)
+
+    assert set(dirty) == {(row, col) for row in range(5) for col in (2, 3)}
+    assert [tab.cells[(row, 2)].text.get_text() for row in range(5)] == [
+        "1.0",
+        "2.0",
+        "3.0",
+        "4.0",
+        "5.0",
+    ]
+    assert [tab.cells[(row, 3)].text.get_text() for row in range(5)] == [
+        "1",
+        "0",
+        "True",
+        "False",
+        "1",
+    ]
+
+
+def test_table_update_cmaps(df):
+    cmap = mpl.colormaps["RdYlGn"]
+    tab = Table(
+        df,
+        column_definitions=[
+            ColumnDefinition("A", cmap=cmap),
+            ColumnDefinition("B", text_cmap=cmap),
+        ],
+        use_cell_collection=True,
+    )
+
+    new_df = df.copy()
+    new_df["A"] = 0.0
+    new_df["B"] = 1.0
+    tab.update(new_df)
+
+    assert tab.cells[(0, 1)].rectangle_patch.get_facecolor() == pytest.approx(cmap(0))
+    assert mpl.colors.to_rgba(tab.cells[(0, 2)].text.get_color()) == pytest.approx(
+        cmap(1.0)
+    )
+
+
+def test_table_update_fontcolors(df):
+    def cmap(value):
+        return "black" if value < 1 else "white"
+
+    tab = Table(df, column_definitions=[ColumnDefinition("A", cmap=cmap)])
+    tab.autoset_fontcolors(colnames=["A"])
+    assert tab.cells[(0, 1)].text.get_color() == "#ffffff"
+
+    new_df = df.copy()
+    new_df["A"] = 2.0
+    tab.update(new_df)
+    assert tab.cells[(0, 1)].text.get_color() == "#000000"
+
+
+def test_table_update_subplots(df):
+    tab = Table(df, column_definitions=[ColumnDefinition("A", plot_fn=plots.bar)])
+    new_df = df.copy()
+    new_df.iloc[3, 0] = 0.9
+    tab.update(new_df)
+
+    subplot = tab.subplots[(3, 1)]
+    assert len(subplot.patches) == 1
+    assert subplot.patches[0].get_width() == pytest.approx(0.9)
+
+
+def test_table_update_column_renderers(df):
+    tab = Table(
+        df,
+        column_definitions=[ColumnDefinition("A", plot_fn=plots.bar)],
+        use_column_renderers=True,
+    )
+    artists = tab.column_artists["A"]
+
+    new_df = df.copy()
+    new_df.iloc[0, 0] = 0.5
+    tab.update(new_df)
+
+    assert tab.column_artists["A"] != artists
+    assert all(artist.axes is None for artist in artists)
+
+
+def test_table_update_needs_same_columns(df):
+    tab = Table(df)
+    with pytest.raises(ValueError):
+        tab.update(df.drop(columns="A"))
+    with pytest.raises(ValueError):
+        tab.update(df.head(3))
+
+
+def test_table_column_plot_fn(df):
+    calls = []
+
+    def column_plot_fn(ax, values, bounds, color="C0"):
+        calls.append((values, bounds, color))
+        return [ax.scatter(bounds[:, 0], bounds[:, 1], color=color)]
+
+    tab = Table(
+        df,
+        column_definitions=[
+            ColumnDefinition(
+                "B",
+                column_plot_fn=column_plot_fn,
+                plot_kw={"color": "r"},
+                formatter="{:.2f}",
+            )
+        ],
+    )
+
+    assert len(calls) == 1
+    values, bounds, color = calls[0]
+    assert list(values) == list(df["B"])
+    assert bounds.shape == (len(df), 4)
+    assert list(bounds[:, 0]) == [tab.grid.column_x[2]] * len(df)
+    assert color == "r"
+
+    assert len(tab.column_artists["B"]) == 1
+    assert tab.subplots == {}
+    assert all(isinstance(cell, SubplotCell) for cell in tab.columns["B"].cells)
+
+
+def test_table_prefetches_image_columns(tmp_path):
+    paths = []
+    for idx in range(3):
+        path = tmp_path / f"{idx}.png"
+        Image.fromarray(np.full((4, 4, 3), idx, dtype=np.uint8)).save(path)
+        paths.append(str(path))
+
+    image_cache.clear()
+    df = pd.DataFrame({"image": paths + paths, "mono": paths + paths})
+    Table(
+        df,
+        column_definitions=[
+            ColumnDefinition(
+                "image", plot_fn=plots.image, plot_kw={"downsample": False}
+            ),
+            ColumnDefinition(
+                "mono", plot_fn=plots.monochrome_image, plot_kw={"downsample": False}
+            ),
+        ],
+    )
+
+    # each image is decoded once per mode before plotting, every cell reads the cache
+    assert image_cache.info().misses == 6
+    assert image_cache.info().hits == 12
+
+
 def test_cell_text_is_formatted_by_formatter(df):
 
     col_defs = [ColDef("A", formatter=formatters.decimal_to_percent)]
@@ -382,6 +726,49 @@ def test_table_apply_cmaps(df):
         assert cell_color != base_cell_color
 
 
+def test_cell_formatted_content(df):
+    tab = Table(df, column_definitions=[ColDef("A", formatter="{:.2f}")])
+    for cell in tab.columns["A"].cells:
+        assert cell.formatted_content == f"{cell.content:.2f}"
+        assert cell.text.get_text() == cell.formatted_content
+
+    for cell in tab.columns["B"].cells:
+        assert cell.formatted_content is None
+        assert cell.text.get_text() == str(cell.content)
+
+
+def test_get_formatted_columns(df):
+    tab = Table(df, column_definitions=[ColDef("B", formatter=formatters.tickcross)])
+    formatted_columns = tab._get_formatted_columns(tab._get_column_values())
+
+    assert formatted_columns[:2] == [None, None]
+    assert formatted_columns[2] == ["✔"] * len(df)
+
+
+def test_table_apply_scalar_cmap_function(df):
+    tab = Table(df, column_definitions=[ColDef("B", cmap=lambda x: "r")])
+
+    for cell in tab.columns["B"].cells:
+        assert cell.rectangle_patch.get_facecolor() == (1, 0, 0, 1)
+
+
+def test_table_apply_cmaps_to_bbox(df):
+    tab = Table(
+        df,
+        column_definitions=[
+            ColDef(
+                "B",
+                cmap=mpl.colormaps["RdBu"],
+                textprops={"bbox": {"boxstyle": "circle"}},
+            )
+        ],
+    )
+
+    for cell in tab.columns["B"].cells:
+        bbox_color = cell.text.get_bbox_patch().get_facecolor()
+        assert bbox_color == mpl.colormaps["RdBu"](cell.content)
+
+
 def test_table_apply_text_cmaps(df):
     tab = Table(df, column_definitions=[ColDef("B", text_cmap=mpl.colormaps["RdBu"])])
     base_text_color = tab.cells[1, 1].text.get_color()
@@ -427,8 +814,18 @@ def test_table_plot_column_borders(df):
     assert True
 
 
-def test_plot_col_group_labels(table):
-    pass
+def test_plot_col_group_labels(df):
+    tab = Table(
+        df,
+        column_definitions=[
+            ColDef("A", group="group1"),
+            ColDef("B", group="group1"),
+            ColDef("D", group="group2"),
+        ],
+    )
+    assert set(tab.col_group_cells.keys()) == {"group1", "group2"}
+    assert len(tab.col_group_line_collection.get_segments()) == 2
+    assert tab.col_group_line_collection in tab.ax.collections
 
 
 def test_plot_col_label_divider(table):
@@ -440,11 +837,38 @@ def test_plot_footer_divider(table):
 
 
 def test_plot_row_dividers(table):
-    pass
+    segments = table.row_divider_collection.get_segments()
+    assert len(segments) == len(table.df) - 1
+    assert table.row_divider_collection in table.ax.collections
 
+    for idx, segment in enumerate(segments, start=1):
+        assert segment.tolist() == [[0, idx], [len(table.column_names), idx]]
 
-def test_plot_column_borders(table):
-    pass
+
+def test_plot_row_dividers_kw(df):
+    tab = Table(df, row_divider_kw={"lw": 2, "color": "r", "linestyle": "--"})
+    assert tab.row_divider_collection.get_linewidth()[0] == 2
+    assert tuple(tab.row_divider_collection.get_color()[0]) == (1, 0, 0, 1)
+
+
+def test_no_row_dividers(df):
+    tab = Table(df, row_dividers=False)
+    assert tab.row_divider_collection is None
+
+
+def test_plot_column_borders(df):
+    tab = Table(
+        df,
+        column_definitions=[ColDef("A", border="left"), ColDef("C", border="both")],
+        column_border_kw={"lw": 2},
+    )
+    segments = tab.column_border_collection.get_segments()
+    assert [segment[0][0] for segment in segments] == [1, 3, 4]
+    assert tab.column_border_collection.get_linewidth()[0] == 2
+
+
+def test_plot_column_borders_is_empty(table):
+    assert table.column_border_collection.get_segments() == []
 
 
 def test_plot_fn_with_formatter_does_not_raise(df):
@@ -455,3 +879,138 @@ def test_plot_fn_with_formatter_does_not_raise(df):
     ]
 
     tab = Table(df, column_definitions=column_definitions)
+
+
+def test_cell_collection_is_none_by_default(table):
+    assert table.cell_collection is None
+
+
+def test_use_cell_collection(df):
+    tab = Table(df, use_cell_collection=True)
+
+    assert isinstance(tab.cell_collection, RectangleCollection)
+    assert tab.cell_collection in tab.ax.collections
+    assert len(tab.cell_collection) == len(tab.cells)
+
+    for cell in tab.cells.values():
+        assert isinstance(cell.rectangle_patch, CollectionPatch)
+        assert cell.rectangle_patch not in tab.ax.patches
+
+
+def test_cell_collection_cell_kw(df):
+    tab = Table(df, cell_kw={"linewidth": 2, "zorder": 0.5}, use_cell_collection=True)
+
+    assert tab.cell_collection.get_zorder() == 0.5
+    for cell in tab.cells.values():
+        assert cell.rectangle_patch.get_linewidth() == 2
+
+
+def test_cell_collection_alternating_row_colors(df):
+    color = (0.9, 0.9, 0.9, 1)
+    color2 = (0.85, 0.85, 0.85, 1)
+    tab = Table(
+        df, even_row_color=color, odd_row_color=color2, use_cell_collection=True
+    )
+
+    for row in tab.get_even_rows():
+        for cell in row.cells:
+            assert cell.rectangle_patch.get_facecolor() == color
+
+    for row in tab.get_odd_rows():
+        for cell in row.cells:
+            assert cell.rectangle_patch.get_facecolor() == color2
+
+
+def test_cell_collection_apply_cmaps(df):
+    tab = Table(
+        df,
+        column_definitions=[ColDef("B", cmap=mpl.colormaps["RdBu"])],
+        use_cell_collection=True,
+    )
+
+    for cell in tab.columns["B"].cells:
+        assert cell.rectangle_patch.get_facecolor() == mpl.colormaps["RdBu"](
+            cell.content
+        )
+
+
+def test_cell_collection_is_drawn(df):
+    fig, ax = plt.subplots()
+    tab = Table(df, ax=ax, use_cell_collection=True, even_row_color="#eeeeee")
+    fig.canvas.draw()
+
+    facecolors = tab.cell_collection.get_facecolor()
+    assert len(facecolors) == len(tab.cells)
+    assert tuple(facecolors[0]) == mpl.colors.to_rgba("#eeeeee")
+    plt.close(fig)
+
+
+def test_cell_collection_subplots(df):
+    def plot_fn(ax, arg):
+        ax.plot([0, 0], [1, 1])
+
+    tab = Table(
+        df,
+        column_definitions=[ColumnDefinition("A", plot_fn=plot_fn)],
+        use_cell_collection=True,
+    )
+
+    for cell in tab._get_subplot_cells().values():
+        assert len(cell.axes_inset.get_lines()) > 0
+
+
+def test_cache_stats_is_empty(table):
+    assert table.cache_stats.empty
+
+
+def test_column_caches(df):
+    df["F"] = [0, 1, 0, 1, 1]
+    tab = Table(
+        df,
+        column_definitions=[
+            ColDef("F", formatter=formatters.tickcross, cmap=mpl.colormaps["RdBu"])
+        ],
+    )
+    stats = tab.cache_stats
+
+    assert stats.loc[("F", "formatter"), "hits"] == 3
+    assert stats.loc[("F", "formatter"), "misses"] == 2
+    assert stats.loc[("F", "cmap"), "currsize"] == 2
+    assert stats.loc[("F", "cmap"), "hit_rate"] == 0.6
+
+    for cell in tab.columns["F"].cells:
+        assert cell.text.get_text() == formatters.tickcross(cell.content)
+        assert cell.rectangle_patch.get_facecolor() == mpl.colormaps["RdBu"](
+            cell.content
+        )
+
+
+def test_column_cache_size(df):
+    tab = Table(
+        df, column_definitions=[ColDef("A", formatter="{:.2f}")], column_cache_size=2
+    )
+    assert tab.cache_stats.loc[("A", "formatter"), "currsize"] == 2
+
+
+def test_autoset_fontcolors_is_memoized(df):
+    tab = Table(df, even_row_color="#000000", odd_row_color="#000000")
+    tab.autoset_fontcolors(colnames=["A"])
+
+    assert tab.cache_stats.loc[("A", "fontcolor"), "misses"] == 1
+    for cell in tab.columns["A"].cells:
+        assert cell.text.get_color() == "#ffffff"
+
+
+def test_column_definitions_are_shared_between_tables(df):
+    col_def = ColDef("A", plot_kw={"is_pct": True})
+    tab1 = Table(df, column_definitions=[col_def])
+    tab2 = Table(df, column_definitions=[col_def])
+
+    assert tab1.column_definitions["A"] is tab2.column_definitions["A"]
+    assert tab1.column_definitions["A"]["plot_kw"] is col_def.plot_kw
+
+
+def test_cells_of_a_column_share_style_dicts(table):
+    cells = table.columns["A"].cells
+    assert cells[0].textprops._data is cells[1].textprops._data
+    assert cells[0].rect_kw._data is cells[1].rect_kw._data